@@ -17,13 +17,17 @@ but WITHOUT ANY WARRANTY; without even the implied warranty of \
 MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the \
 GNU General Public License for more details.
 """
+from argparse import ArgumentParser
 import os
+from shutil import copyfile
 import sys
+from tempfile import TemporaryDirectory
 
 from nvlib.configuration.configuration import Configuration
 from nvlib.configuration.just_settings import JustSettings
 from nvlib.controller.main_controller import MainController
 from nvlib.gui.default_colors import DEFAULT_COLORS
+from nvlib.model.novx.project_merger import ProjectMerger
 from nvlib.nv_globals import INSTALL_DIR
 from nvlib.nv_globals import launchers
 from nvlib.nv_globals import prefs
@@ -54,6 +58,8 @@ SETTINGS = dict(
     time_width=40,
     title_width=400,
     vp_width=100,
+    wc_log_full_days=365,
+    wc_log_granularity='',
     wc_width=50,
 )
 SETTINGS.update(DEFAULT_COLORS)
@@ -66,6 +72,7 @@ OPTIONS = dict(
     large_icons=False,
     localize_date=True,
     lock_on_export=False,
+    save_in_background=True,
     show_auto_numbering=False,
     show_ch_links=False,
     show_contents=True,
@@ -93,6 +100,7 @@ OPTIONS = dict(
     show_st_links=False,
     show_writing_progress=False,
     warn_before_reopening=True,
+    watch_project_files=True,
 )
 
 
@@ -106,6 +114,10 @@ def main():
             'Must be 3.7 or newer.'.format(major, minor)
         )
 
+    #--- Run the merge driver, if requested.
+    if len(sys.argv) > 1 and sys.argv[1] == '--merge':
+        sys.exit(merge(sys.argv[2:]))
+
     #--- Set up the directories for configuration and temporary files.
     os.makedirs(INSTALL_DIR, exist_ok=True)
     configDir = f'{INSTALL_DIR}/config'
@@ -173,5 +185,77 @@ def main():
             pass
 
 
+def merge(args):
+    """Merge two versions of a project without GUI.
+
+    Positional arguments:
+        args: list of str -- command line arguments.
+
+    Can be configured as git merge driver, e.g.
+    git config merge.novx.driver "novelibre.py --merge %O %A %B"
+    with the line "*.novx merge=novx" in .gitattributes.
+    Return 0 if the merge is free of conflicts, otherwise 1.
+    """
+    parser = ArgumentParser(
+        prog='novelibre.py --merge',
+        description='Three-way merge of novelibre projects.',
+    )
+    parser.add_argument('base', help='common ancestor')
+    parser.add_argument('local', help='local version; overwritten')
+    parser.add_argument('remote', help='remote version')
+    parser.add_argument(
+        '--prefer',
+        choices=(ProjectMerger.LOCAL, ProjectMerger.REMOTE),
+        default=ProjectMerger.LOCAL,
+        help='version taken for conflicting fields',
+    )
+    parser.add_argument(
+        '--resolve',
+        action='append',
+        default=[],
+        metavar='FIELD=VERSION',
+        help='version taken for a conflicting field, e.g. Content=remote',
+    )
+    arguments = parser.parse_args(args)
+    resolutions = {}
+    for resolution in arguments.resolve:
+        field, __, side = resolution.partition('=')
+        if not field or not side in (ProjectMerger.LOCAL, ProjectMerger.REMOTE):
+            parser.error(
+                f'argument --resolve: invalid value: "{resolution}" '
+                f'(expected FIELD={ProjectMerger.LOCAL} '
+                f'or FIELD={ProjectMerger.REMOTE})'
+            )
+        resolutions[field] = side
+    merger = ProjectMerger(
+        preferred=arguments.prefer,
+        resolutions=resolutions,
+    )
+    with TemporaryDirectory() as tempDir:
+        # Git passes temporary files without extension.
+        filePaths = {}
+        for version in ('base', 'local', 'remote'):
+            filePaths[version] = f'{tempDir}/{version}.novx'
+            copyfile(getattr(arguments, version), filePaths[version])
+        try:
+            isClean = merger.merge_files(
+                filePaths['base'],
+                filePaths['local'],
+                filePaths['remote'],
+                targetPath=f'{tempDir}/merged.novx',
+            )
+        except RuntimeError as ex:
+            print(str(ex), file=sys.stderr)
+            return 2
+
+        copyfile(f'{tempDir}/merged.novx', arguments.local)
+    if isClean:
+        return 0
+
+    for elemId, field in merger.conflicts:
+        print(f'Conflict: {elemId or "PROJECT"} {field or ""}', file=sys.stderr)
+    return 1
+
+
 if __name__ == '__main__':
     main()
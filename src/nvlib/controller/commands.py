@@ -633,7 +633,9 @@ class Commands:
         Return True on success, otherwise return False.
         """
         if not self.isLocked:
-            return self.fileManager.save_project()
+            return self.fileManager.save_project(
+                inBackground=self.get_preferences()['save_in_background']
+            )
 
     def set_chr_status_major(self, event=None):
         if not self.check_lock():
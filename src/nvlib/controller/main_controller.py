@@ -9,6 +9,7 @@ import sys
 
 from nvlib.controller.commands import Commands
 from nvlib.controller.plugin.plugin_collection import PluginCollection
+from nvlib.controller.services.change_monitor import ChangeMonitor
 from nvlib.controller.services.clipboard_manager import ClipboardManager
 from nvlib.controller.services.data_importer import DataImporter
 from nvlib.controller.services.doc_importer import DocImporter
@@ -72,6 +73,8 @@ class MainController(SubController, Commands):
         self.elementManager = ElementManager(self._mdl, self._ui, self)
         self.linkProcessor = LinkProcessor(self._mdl, self._ui, self)
         self.clipboardManager = ClipboardManager(self._mdl, self._ui, self)
+        self.changeMonitor = ChangeMonitor(self._mdl, self._ui, self)
+        self.register_client(self.changeMonitor)
 
         #--- Load the plugins.
         self.plugins = PluginCollection(self._mdl, self._ui, self)
@@ -135,12 +138,17 @@ class MainController(SubController, Commands):
         
         Return True on success, otherwise return False.
         """
+        self.fileManager.finish_saving()
         if self._mdl.isModified and not self._internalLockFlag:
             if self._ui.ask_yes_no(
                 message=_('Save and lock?'),
                 detail=f"{_('There are unsaved changes')}."
             ):
                 self.save_project()
+                if not self.fileManager.finish_saving():
+                    return False
+                # the project may be saved in the background
+
             else:
                 return False
 
@@ -168,6 +176,7 @@ class MainController(SubController, Commands):
         """
         self.update_status()
         self._ui.propertiesView.apply_changes()
+        self.fileManager.finish_saving()
         if self._mdl.prjFile:
             pidfile = f'{self._mdl.prjFile.filePath}.pid'
         else:
@@ -0,0 +1,148 @@
+"""Provide a service class for watching the project files.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+
+from nvlib.controller.services.service_base import ServiceBase
+from nvlib.controller.sub_controller import SubController
+from nvlib.model.converter.novx_conversion import NovxConversion
+from nvlib.model.file.file_watcher import FileWatcher
+from nvlib.model.novx.project_diff import ProjectDiff
+from nvlib.novx_globals import norm_path
+from nvlib.nv_locale import _
+
+
+class ChangeMonitor(ServiceBase, SubController):
+    """Watch the project file and the exported documents.
+
+    If the project file is changed by another application,
+    offer to merge the changed elements into the project in memory.
+    If an exported document is changed, notify the user.
+    """
+    INTERVAL = 1000
+    # milliseconds between two checks
+
+    def __init__(self, model, view, controller):
+        super().__init__(model, view, controller)
+        self.prefs = self._ctrl.get_preferences()
+        self._fileWatcher = FileWatcher()
+        self._prjPath = None
+        # path of the watched project file
+        self._timerId = None
+        self._mdl.keepSnapshots = self.prefs['watch_project_files']
+
+    def on_close(self):
+        """Stop watching.
+
+        Overrides the superclass method.
+        """
+        self._stop()
+
+    def on_open(self):
+        """Start watching the project file and the exported documents.
+
+        Overrides the superclass method.
+        """
+        self._stop()
+        if not self.prefs['watch_project_files']:
+            return
+
+        if not self._mdl.prjFile.filePath:
+            return
+
+        self._prjPath = self._mdl.prjFile.filePath
+        self._fileWatcher.add(self._prjPath)
+        fileName, __ = os.path.splitext(self._prjPath)
+        for docClass in NovxConversion.IMPORT_SOURCE_CLASSES:
+            self._fileWatcher.add(
+                f'{fileName}{docClass.SUFFIX}{docClass.EXTENSION}'
+            )
+        self._timerId = self._ui.root.after(self.INTERVAL, self._check)
+
+    def on_quit(self):
+        """Stop watching.
+
+        Overrides the superclass method.
+        """
+        self._stop()
+
+    def _check(self):
+        # Check the watched files and schedule the next check.
+        self._timerId = None
+        if self._mdl.prjFile.filePath != self._prjPath:
+            # the project has been saved under another name
+            self.on_open()
+            return
+
+        for filePath in self._fileWatcher.get_changed_files():
+            if self._mdl.prjFile is None:
+                return
+
+            if filePath == self._prjPath:
+                self._check_project()
+            elif os.path.isfile(filePath):
+                self._ui.set_status(
+                    f'#{_("Document changed on disk")}: '
+                    f'"{norm_path(filePath)}"'
+                )
+        if self._mdl.prjFile is not None:
+            self._timerId = self._ui.root.after(self.INTERVAL, self._check)
+
+    def _check_project(self):
+        # Offer to merge the changes, if the project was changed on disk.
+        if (
+            self._ctrl.isLocked
+            or self._mdl.isSaving
+            or self._mdl.baseSnapshot is None
+            or not self._mdl.prjFile.has_changed_on_disk()
+        ):
+            # The project file is under external control,
+            # or it is being written or has been written by novelibre.
+            return
+
+        self._ui.propertiesView.apply_changes()
+        try:
+            remoteFile, remoteSnapshot = self._mdl.read_changes()
+        except RuntimeError:
+            # The file may be incomplete; check again on the next change.
+            return
+
+        diff = ProjectDiff(
+            self._mdl.baseSnapshot,
+            self._mdl.get_snapshot(),
+            remoteSnapshot,
+        )
+        if diff.is_empty():
+            self._mdl.prjFile.timestamp = remoteFile.timestamp
+            return
+
+        detail = (
+            f'{_("Elements changed")}: {len(diff.changed)}\n'
+            f'{_("Elements removed")}: {len(diff.removed)}\n'
+            f'{_("Conflicts (keeping the version in memory)")}: '
+            f'{len(diff.conflicts)}'
+        )
+        if not self._ui.ask_yes_no(
+            message=_('File has changed on disk. Merge the changes?'),
+            detail=detail,
+        ):
+            return
+
+        self._mdl.merge_changes(remoteFile, remoteSnapshot, diff)
+        self._ctrl.refresh_tree()
+        self._ui.show_path(_('{0} (last saved on {1})').format(
+            norm_path(self._mdl.prjFile.filePath),
+            self._mdl.prjFile.fileDate)
+        )
+        self._ctrl.update_status()
+        self._ui.set_status(f'#{_("Changes merged")}.')
+
+    def _stop(self):
+        # Cancel the next check and stop watching.
+        if self._timerId is not None:
+            self._ui.root.after_cancel(self._timerId)
+            self._timerId = None
+        self._fileWatcher.clear()
@@ -18,6 +18,12 @@ from nvlib.novx_globals import SECTION_PREFIX
 
 
 class ClipboardManager(ServiceBase):
+    """Copy, cut, and paste the selected tree elements.
+
+    All selected elements are transferred with their children
+    as a single clipboard payload.
+    """
+    CLIPBOARD_TAG = 'CLIPBOARD'
 
     def cut_element(self, elemPrefix=None):
         if self._mdl.prjFile is None:
@@ -26,35 +32,33 @@ class ClipboardManager(ServiceBase):
         if self._ctrl.check_lock():
             return
 
-        try:
-            node = self._ui.selectedNode
-        except:
+        nodes = self._get_selected_nodes(elemPrefix)
+        if not nodes:
             return
 
         if self.copy_element(elemPrefix) is None:
             return
 
-        if self._ui.tv.tree.prev(node):
-            self._ui.tv.go_to_node(self._ui.tv.tree.prev(node))
+        if self._ui.tv.tree.prev(nodes[0]):
+            self._ui.tv.go_to_node(self._ui.tv.tree.prev(nodes[0]))
         else:
-            self._ui.tv.go_to_node(self._ui.tv.tree.parent(node))
-        self._mdl.delete_element(node, trash=False)
+            self._ui.tv.go_to_node(self._ui.tv.tree.parent(nodes[0]))
+        self._mdl.begin_batch()
+        try:
+            for node in nodes:
+                self._mdl.delete_element(node, trash=False)
+        finally:
+            self._mdl.end_batch()
         return 'break'
 
     def copy_element(self, elemPrefix=None):
         if self._mdl.prjFile is None:
             return
 
-        try:
-            node = self._ui.selectedNode
-        except:
+        nodes = self._get_selected_nodes(elemPrefix)
+        if not nodes:
             return
 
-        nodePrefix = node[:2]
-        if elemPrefix is not None:
-            if nodePrefix != elemPrefix:
-                return
-
         elementContainers = {
             CHAPTER_PREFIX: (
                 self._mdl.novel.chapters,
@@ -97,34 +101,36 @@ class ClipboardManager(ServiceBase):
                 self._mdl.prjFile.basicElementCnv,
             ),
         }
-        if not nodePrefix in elementContainers:
-            return
+        xmlClipboard = ET.Element(self.CLIPBOARD_TAG)
+        for node in nodes:
+            nodePrefix = node[:2]
+            elementContainer, xmlTag, elementCnv = (
+                elementContainers[nodePrefix]
+            )
+            element = elementContainer[node]
+            xmlElement = ET.SubElement(xmlClipboard, xmlTag)
+            elementCnv.export_data(element, xmlElement)
+            self._remove_references(xmlElement)
 
-        elementContainer, xmlTag, elementCnv = elementContainers[nodePrefix]
-        element = elementContainer[node]
-        xmlElement = ET.Element(xmlTag)
-        elementCnv.export_data(element, xmlElement)
-        self._remove_references(xmlElement)
-
-        # Get children, if any.
-        if nodePrefix == CHAPTER_PREFIX:
-            for scId in self._mdl.novel.tree.get_children(node):
-                xmlSection = ET.SubElement(xmlElement, 'SECTION')
-                self._mdl.prjFile.sectionCnv.export_data(
-                    self._mdl.novel.sections[scId],
-                    xmlSection
-                )
-                self._remove_references(xmlSection)
-        elif nodePrefix == PLOT_LINE_PREFIX:
-            for ppId in self._mdl.novel.tree.get_children(node):
-                xmlPlotPoint = ET.SubElement(xmlElement, 'POINT')
-                self._mdl.prjFile.plotPointCnv.export_data(
-                    self._mdl.novel.plotPoints[ppId],
-                    xmlPlotPoint
-                )
-                self._remove_references(xmlPlotPoint)
+            # Get children, if any.
+            if nodePrefix == CHAPTER_PREFIX:
+                for scId in self._mdl.novel.tree.get_children(node):
+                    xmlSection = ET.SubElement(xmlElement, 'SECTION')
+                    self._mdl.prjFile.sectionCnv.export_data(
+                        self._mdl.novel.sections[scId],
+                        xmlSection
+                    )
+                    self._remove_references(xmlSection)
+            elif nodePrefix == PLOT_LINE_PREFIX:
+                for ppId in self._mdl.novel.tree.get_children(node):
+                    xmlPlotPoint = ET.SubElement(xmlElement, 'POINT')
+                    self._mdl.prjFile.plotPointCnv.export_data(
+                        self._mdl.novel.plotPoints[ppId],
+                        xmlPlotPoint
+                    )
+                    self._remove_references(xmlPlotPoint)
 
-        text = ET.tostring(xmlElement)
+        text = ET.tostring(xmlClipboard)
         # no utf-8 encoding here, because the text is escaped
         self._ui.root.clipboard_clear()
         self._ui.root.clipboard_append(text)
@@ -145,10 +151,66 @@ class ClipboardManager(ServiceBase):
 
         try:
             text = self._ui.root.clipboard_get()
-            xmlElement = ET.fromstring(text)
+            xmlClipboard = ET.fromstring(text)
         except:
             return
 
+        if xmlClipboard.tag == self.CLIPBOARD_TAG:
+            xmlElements = list(xmlClipboard)
+        else:
+            # single element copied by an earlier version
+            xmlElements = [xmlClipboard]
+        self._mdl.begin_batch()
+        try:
+            pastedIds = self._paste_elements(xmlElements, node, elemPrefix)
+            if pastedIds:
+                self._ctrl.refresh_tree()
+        finally:
+            self._mdl.end_batch()
+        if not pastedIds:
+            return
+
+        self._ui.tv.go_to_node(pastedIds[0])
+        return 'break'
+
+    def _get_selected_nodes(self, elemPrefix):
+        # Return a list of the selected nodes that can be copied.
+        # Nodes whose ancestors are also selected are omitted,
+        # because they are copied with their ancestors.
+        try:
+            selection = self._ui.selectedNodes
+        except:
+            return []
+
+        copyablePrefixes = (
+            CHAPTER_PREFIX,
+            SECTION_PREFIX,
+            PLOT_LINE_PREFIX,
+            PLOT_POINT_PREFIX,
+            CHARACTER_PREFIX,
+            LOCATION_PREFIX,
+            ITEM_PREFIX,
+            PRJ_NOTE_PREFIX,
+        )
+        selectedSet = set(selection)
+        nodes = []
+        for node in selection:
+            nodePrefix = node[:2]
+            if not nodePrefix in copyablePrefixes:
+                continue
+
+            if elemPrefix is not None and nodePrefix != elemPrefix:
+                continue
+
+            if self._ui.tv.tree.parent(node) in selectedSet:
+                continue
+
+            nodes.append(node)
+        return nodes
+
+    def _paste_elements(self, xmlElements, node, elemPrefix):
+        # Create new elements from xmlElements and place them at node.
+        # Return a list of the IDs of the new top-level elements.
         prefixes = {
             'CHAPTER': CHAPTER_PREFIX,
             'SECTION': SECTION_PREFIX,
@@ -159,100 +221,108 @@ class ClipboardManager(ServiceBase):
             'ITEM': ITEM_PREFIX,
             'PROJECTNOTE': PRJ_NOTE_PREFIX
         }
-        nodePrefix = prefixes.get(xmlElement.tag, None)
-        if nodePrefix is None:
-            return
+        elementControls = {
+            CHAPTER_PREFIX: (
+                self._mdl.add_new_chapter,
+                self._mdl.novel.chapters,
+                self._mdl.prjFile.chapterCnv,
+            ),
+            PLOT_LINE_PREFIX: (
+                self._mdl.add_new_plot_line,
+                self._mdl.novel.plotLines,
+                self._mdl.prjFile.plotLineCnv,
+            ),
+            PLOT_POINT_PREFIX: (
+                self._mdl.add_new_plot_point,
+                self._mdl.novel.plotPoints,
+                self._mdl.prjFile.plotPointCnv,
+            ),
+            CHARACTER_PREFIX: (
+                self._mdl.add_new_character,
+                self._mdl.novel.characters,
+                self._mdl.prjFile.characterCnv,
+            ),
+            LOCATION_PREFIX: (
+                self._mdl.add_new_location,
+                self._mdl.novel.locations,
+                self._mdl.prjFile.worldElementCnv
+            ),
+            ITEM_PREFIX: (
+                self._mdl.add_new_item,
+                self._mdl.novel.items,
+                self._mdl.prjFile.worldElementCnv
+            ),
+            PRJ_NOTE_PREFIX: (
+                self._mdl.add_new_project_note,
+                self._mdl.novel.projectNotes,
+                self._mdl.prjFile.basicElementCnv,
+            )
+        }
+        pastedIds = []
+        targetNodes = {}
+        # key: element prefix; value: node after which to paste
+        for xmlElement in xmlElements:
+            nodePrefix = prefixes.get(xmlElement.tag, None)
+            if nodePrefix is None:
+                continue
 
-        if elemPrefix is not None:
-            if nodePrefix != elemPrefix:
-                return
+            if elemPrefix is not None:
+                if nodePrefix != elemPrefix:
+                    continue
 
-        if nodePrefix == SECTION_PREFIX:
-            typeStr = xmlElement.get('type', 0)
-            if int(typeStr) > 1:
-                elemCreator = self._mdl.add_new_stage
+            if nodePrefix == SECTION_PREFIX:
+                typeStr = xmlElement.get('type', 0)
+                if int(typeStr) > 1:
+                    elemCreator = self._mdl.add_new_stage
+                else:
+                    elemCreator = self._mdl.add_new_section
+                elemContainer = self._mdl.novel.sections
+                elemCnv = self._mdl.prjFile.sectionCnv
             else:
-                elemCreator = self._mdl.add_new_section
-            elemContainer = self._mdl.novel.sections
-            elemCnv = self._mdl.prjFile.sectionCnv
-        else:
-            elementControls = {
-                CHAPTER_PREFIX: (
-                    self._mdl.add_new_chapter,
-                    self._mdl.novel.chapters,
-                    self._mdl.prjFile.chapterCnv,
-                ),
-                PLOT_LINE_PREFIX: (
-                    self._mdl.add_new_plot_line,
-                    self._mdl.novel.plotLines,
-                    self._mdl.prjFile.plotLineCnv,
-                ),
-                PLOT_POINT_PREFIX: (
-                    self._mdl.add_new_plot_point,
-                    self._mdl.novel.plotPoints,
-                    self._mdl.prjFile.plotPointCnv,
-                ),
-                CHARACTER_PREFIX: (
-                    self._mdl.add_new_character,
-                    self._mdl.novel.characters,
-                    self._mdl.prjFile.characterCnv,
-                ),
-                LOCATION_PREFIX: (
-                    self._mdl.add_new_location,
-                    self._mdl.novel.locations,
-                    self._mdl.prjFile.worldElementCnv
-                ),
-                ITEM_PREFIX: (
-                    self._mdl.add_new_item,
-                    self._mdl.novel.items,
-                    self._mdl.prjFile.worldElementCnv
-                ),
-                PRJ_NOTE_PREFIX: (
-                    self._mdl.add_new_project_note,
-                    self._mdl.novel.projectNotes,
-                    self._mdl.prjFile.basicElementCnv,
+                elemCreator, elemContainer, elemCnv = (
+                    elementControls[nodePrefix]
                 )
-            }
-            if not nodePrefix in elementControls:
-                return
-
-            elemCreator, elemContainer, elemCnv = elementControls[nodePrefix]
 
-        elemId = elemCreator(targetNode=node)
-        if not elemId:
-            return
-
-        elemCnv.import_data(
-            elemContainer[elemId],
-            xmlElement
-        )
+            elemId = elemCreator(
+                targetNode=targetNodes.get(nodePrefix, node)
+            )
+            if not elemId:
+                continue
 
-        # Get children, if any.
-        targetNode = elemId
-        if nodePrefix == CHAPTER_PREFIX:
-            for xmlSection in xmlElement.iterfind('SECTION'):
-                typeStr = xmlSection.get('type', 0)
-                if int(typeStr) > 1:
-                    scId = self._mdl.add_new_stage(targetNode=targetNode)
-                else:
-                    scId = self._mdl.add_new_section(targetNode=targetNode)
-                self._mdl.prjFile.sectionCnv.import_data(
-                    self._mdl.novel.sections[scId],
-                    xmlSection
-                )
-                targetNode = scId
-        elif nodePrefix == PLOT_LINE_PREFIX:
-            for xmlPoint in xmlElement.iterfind('POINT'):
-                ppId = self._mdl.add_new_plot_point(targetNode=targetNode)
-                self._mdl.prjFile.plotPointCnv.import_data(
-                    self._mdl.novel.plotPoints[ppId],
-                    xmlPoint
-                )
-                targetNode = ppId
+            elemCnv.import_data(
+                elemContainer[elemId],
+                xmlElement
+            )
+            pastedIds.append(elemId)
+            targetNodes[nodePrefix] = elemId
 
-        self._ctrl.refresh_tree()
-        self._ui.tv.go_to_node(elemId)
-        return 'break'
+            # Get children, if any.
+            targetNode = elemId
+            if nodePrefix == CHAPTER_PREFIX:
+                for xmlSection in xmlElement.iterfind('SECTION'):
+                    typeStr = xmlSection.get('type', 0)
+                    if int(typeStr) > 1:
+                        scId = self._mdl.add_new_stage(targetNode=targetNode)
+                    else:
+                        scId = self._mdl.add_new_section(
+                            targetNode=targetNode
+                        )
+                    self._mdl.prjFile.sectionCnv.import_data(
+                        self._mdl.novel.sections[scId],
+                        xmlSection
+                    )
+                    targetNode = scId
+            elif nodePrefix == PLOT_LINE_PREFIX:
+                for xmlPoint in xmlElement.iterfind('POINT'):
+                    ppId = self._mdl.add_new_plot_point(
+                        targetNode=targetNode
+                    )
+                    self._mdl.prjFile.plotPointCnv.import_data(
+                        self._mdl.novel.plotPoints[ppId],
+                        xmlPoint
+                    )
+                    targetNode = ppId
+        return pastedIds
 
     def _remove_references(self, xmlElement):
         references = [
@@ -29,13 +29,19 @@ class DataImporter(ServiceBase):
         super().__init__(model, view, controller)
         self.sourceNovel = None
         self.sourceElements = None
+        self.sourceTitles = None
+        self._source = None
+        self._prefix = None
 
     def read_source(self, filePath, prefix):
-        """Read the elements of the XML data file specified by filePath.
+        """Index the elements of the XML data file specified by filePath.
         
         Positional arguments:
             filePath: str -- Path of the XML data file.
             prefix: str -- Prefix of the new element IDs.
+
+        Only the element IDs and titles are read for selection.
+        The selected elements are read by add_elements().
         """
         sources = {
             CHARACTER_PREFIX:CharacterDataReader,
@@ -53,36 +59,39 @@ class DataImporter(ServiceBase):
             PLOT_LINE_PREFIX:_('No plot lines found'),
         }
         try:
-            source.read()
+            sourceTitles = source.read_index()
         except:
             raise RuntimeError(
                 f'{_("Cannot process file")}: {norm_path(filePath)}'
             )
 
-        sourceElements = {
-            CHARACTER_PREFIX:source.novel.characters,
-            LOCATION_PREFIX:source.novel.locations,
-            ITEM_PREFIX:source.novel.items,
-            PLOT_LINE_PREFIX:source.novel.plotLines,
-        }
-        if not sourceElements[prefix]:
+        if not sourceTitles:
             raise UserWarning(
                 f'{errorMessages[prefix]}: {norm_path(filePath)}'
             )
 
-        self.sourceElements = sourceElements[prefix]
-        self.sourceNovel = source.novel
+        self.sourceTitles = sourceTitles
+        self._source = source
+        self._prefix = prefix
+        self.sourceNovel = None
+        self.sourceElements = None
 
     def add_elements(self, selectedIds=None):
         """Add the elements specified by selectedIds to the novel."""
-        if self.sourceNovel is None:
+        if self._source is None:
             return
 
-        if self.sourceElements is None:
+        if self.sourceTitles is None:
             return
 
         if selectedIds is None:
-            selectedIds = self.sourceElements
+            selectedIds = list(self.sourceTitles)
+        try:
+            self._read_selection(selectedIds)
+        except Exception as ex:
+            self._ui.set_status(f'!{str(ex)}')
+            self._reset()
+            return
 
         targetElements = {
             CHARACTER_PREFIX:self._mdl.novel.characters,
@@ -104,6 +113,9 @@ class DataImporter(ServiceBase):
         }
         i = 0
         for  elemId in selectedIds:
+            if not elemId in self.sourceElements:
+                continue
+
             prefix = elemId[:2]
             newId = new_id(targetElements[prefix], prefix=prefix)
             targetElements[prefix][newId] = self.sourceElements[elemId]
@@ -113,8 +125,7 @@ class DataImporter(ServiceBase):
         if i > 0:
             self._ui.tv.go_to_node(newId)
             self._ui.set_status(f'{i} {_("elements imported")}')
-        self.sourceNovel = None
-        self.sourceElements = None
+        self._reset()
 
     def _add_plot_points(self, plId, srcPlId):
         """Add the plot points belonging to the plot line specified by plId."""
@@ -132,3 +143,30 @@ class DataImporter(ServiceBase):
 
     def _do_nothing(self, *args):
         pass
+
+    def _read_selection(self, selectedIds):
+        # Fully read only the selected elements of the source file.
+        try:
+            self._source.read(elementIds=set(selectedIds))
+        except:
+            raise RuntimeError(
+                f'{_("Cannot process file")}: '
+                f'{norm_path(self._source.filePath)}'
+            )
+
+        novel = self._source.novel
+        sourceElements = {
+            CHARACTER_PREFIX:novel.characters,
+            LOCATION_PREFIX:novel.locations,
+            ITEM_PREFIX:novel.items,
+            PLOT_LINE_PREFIX:novel.plotLines,
+        }
+        self.sourceElements = sourceElements[self._prefix]
+        self.sourceNovel = novel
+
+    def _reset(self):
+        self.sourceNovel = None
+        self.sourceElements = None
+        self.sourceTitles = None
+        self._source = None
+        self._prefix = None
@@ -133,6 +133,18 @@ class DocImporter(ServiceBase, NovxConversion):
             target.novel = source.novel
             target.write()
             message = f'{_("File written")}: "{norm_path(target.filePath)}".'
+            changedSections = getattr(source, 'changedSections', None)
+            if changedSections is not None:
+                message = (
+                    f'{message} - {_("Sections changed")}: '
+                    f'{len(changedSections)}.'
+                )
+            ambiguousTitles = getattr(source, 'ambiguousTitles', None)
+            if ambiguousTitles:
+                message = (
+                    f'{message} - {_("Ambiguous names in")}: '
+                    f'{", ".join(ambiguousTitles)}.'
+                )
             self.newFile = target.filePath
             if source.projectStructureModified:
                 os.replace(source.filePath, f'{source.filePath}.bak')
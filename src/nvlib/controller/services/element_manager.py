@@ -608,10 +608,7 @@ class ElementManager(ServiceBase):
             self._ui.set_status(f'!{str(ex)}')
             return
 
-        sourceElements = {}
-        for elemId in self._ctrl.dataImporter.sourceElements:
-            sourceElements[
-                elemId] = self._ctrl.dataImporter.sourceElements[elemId].title
+        sourceElements = dict(self._ctrl.dataImporter.sourceTitles)
         if not sourceElements:
             return
 
@@ -30,6 +30,9 @@ from nvlib.nv_locale import _
 
 class FileManager(ServiceBase):
 
+    SAVE_CHECK_INTERVAL = 100
+    # milliseconds between two checks whether saving is finished
+
     def __init__(self, model, view, controller):
         super().__init__(model, view, controller)
         self.exporter = NvDocExporter(self._ui)
@@ -149,6 +152,7 @@ class FileManager(ServiceBase):
         if self._mdl.prjFile is None:
             return
 
+        self.finish_saving()
         if self._mdl.prjFile.filePath is None:
             if not self.save_project():
                 return
@@ -182,6 +186,23 @@ class FileManager(ServiceBase):
             ):
                 self._ctrl.lock()
 
+    def finish_saving(self):
+        """Wait until the project file is written, if saving is started.
+
+        Return True on success, otherwise return False.
+        """
+        if not self._mdl.isSaving:
+            return True
+
+        try:
+            self._mdl.finish_saving()
+        except RuntimeError as ex:
+            self._ui.set_status(f'!{str(ex)}')
+            return False
+
+        self._on_saved()
+        return True
+
     def import_odf(
             self, sourcePath=None,
             defaultExtension='.odt',
@@ -334,6 +355,7 @@ class FileManager(ServiceBase):
         if self._mdl.prjFile is None:
             return
 
+        self.finish_saving()
         if self._mdl.isModified and not self._ui.ask_yes_no(
             message=_('Discard changes and reload the project?')
         ):
@@ -362,6 +384,8 @@ class FileManager(ServiceBase):
         if self._mdl.prjFile is None:
             return
 
+        self.finish_saving()
+        # the backup file is replaced when saving
         latestBackup = f'{self._mdl.prjFile.filePath}.bak'
         if not os.path.isfile(latestBackup):
             self._ui.set_status(f'!{_("No backup available")}')
@@ -410,6 +434,9 @@ class FileManager(ServiceBase):
         if self._mdl.prjFile is None:
             return False
 
+        if not self.finish_saving():
+            return False
+
         if self.prefs['last_open']:
             initDir = os.path.dirname(self.prefs['last_open'])
         else:
@@ -449,15 +476,25 @@ class FileManager(ServiceBase):
         self._ctrl.on_open()
         return True
 
-    def save_project(self):
+    def save_project(self, inBackground=False):
         """Save the novelibre project to disk.
+
+        Optional arguments:
+            inBackground: Boolean -- If True, write the file on a
+                                     worker thread, keeping the GUI
+                                     responsive.
         
         Return True on success, otherwise return False.
+        When saving in the background, True means that saving
+        has started; errors are shown on the status bar.
         """
         self._ui.restore_status()
         if self._mdl.prjFile is None:
             return False
 
+        if not self.finish_saving():
+            return False
+
         if self._ctrl.check_lock():
             self._ui.set_status(
                 f'!{_("Cannot save: The project is locked")}.'
@@ -477,19 +514,17 @@ class FileManager(ServiceBase):
 
         self._ui.propertiesView.apply_changes()
         try:
-            self._mdl.save_project()
+            self._mdl.start_saving()
         except RuntimeError as ex:
             self._ui.set_status(f'!{str(ex)}')
             return False
 
-        self._ui.show_path(
-            f'{norm_path(self._mdl.prjFile.filePath)} '
-            f'({_("last saved on")} {self._mdl.prjFile.fileDate})'
-        )
-        self._ui.restore_status()
-        self.prefs['last_open'] = self._mdl.prjFile.filePath
-        self.copy_to_backup(self._mdl.prjFile.filePath)
-        return True
+        if inBackground:
+            self._ui.set_status(f'{_("Saving the project")}...')
+            self._ui.root.after(self.SAVE_CHECK_INTERVAL, self._check_saving)
+            return True
+
+        return self.finish_saving()
 
     def select_project(self, fileName):
         """Return a project file path.
@@ -582,3 +617,32 @@ class FileManager(ServiceBase):
         except RuntimeError as ex:
             self._ui.set_status(f'!{str(ex)}')
 
+    def _check_saving(self):
+        # Complete saving in the background, if the file is written.
+        if not self._mdl.isSaving:
+            # completed by another operation
+            return
+
+        try:
+            if not self._mdl.finish_saving(wait=False):
+                self._ui.root.after(
+                    self.SAVE_CHECK_INTERVAL,
+                    self._check_saving,
+                )
+                return
+
+        except RuntimeError as ex:
+            self._ui.set_status(f'!{str(ex)}')
+            return
+
+        self._on_saved()
+
+    def _on_saved(self):
+        # Update the view after the project file is written.
+        self._ui.show_path(
+            f'{norm_path(self._mdl.prjFile.filePath)} '
+            f'({_("last saved on")} {self._mdl.prjFile.fileDate})'
+        )
+        self._ui.restore_status()
+        self.prefs['last_open'] = self._mdl.prjFile.filePath
+        self.copy_to_backup(self._mdl.prjFile.filePath)
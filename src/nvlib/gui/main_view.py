@@ -30,10 +30,17 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
     _MIN_WINDOW_WIDTH = 400
     _MIN_WINDOW_HEIGHT = 200
     # minimum size's main window
+    _SELECTION_DELAY = 150
+    # milliseconds of idle time before a rapid selection change is shown
 
     def __init__(self, model, controller, title):
         self._mdl = model
         self._ctrl = controller
+        self._selectionTimerId = None
+        self._pendingSelection = None
+        # node selected while the selection timer is running
+        self._shownSelection = None
+        # node shown in the properties view since the last model change
 
         #--- Create the tk root window and set the size.
         self.root = tk.Tk()
@@ -105,6 +112,8 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
         self._ctrl.register_client(self.contentsView)
         if prefs['show_contents']:
             self.middleFrame.pack(side='left', expand=False, fill='both')
+        else:
+            self._mdl.hide_observer(self.contentsView)
 
         #--- Right frame for for the element properties view.
         self.rightFrame = ttk.Frame(
@@ -128,6 +137,8 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
             self._detach_properties_frame()
         self._mdl.add_observer(self.propertiesView)
         self._ctrl.register_client(self.propertiesView)
+        if not (self._propWinDetached or prefs['show_properties']):
+            self._mdl.hide_observer(self.propertiesView)
 
         #--- Create the menu structure.
         self.create_menus()
@@ -154,17 +165,30 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
         """Event handler for element selection.
         
         Show the properties/contents of the selected element.
+        If the selection changes rapidly, e.g. when browsing the tree
+        with the arrow keys, show only the latest selection after
+        a short idle period.
         """
-        self.propertiesView.show_properties(nodeId)
-        self.contentsView.see(nodeId)
-        self.root.event_generate('<<selection_changed>>', when='tail')
-        # this event can be used by plugins
+        if self._selectionTimerId is None:
+            self._show_selection(nodeId)
+        else:
+            self.root.after_cancel(self._selectionTimerId)
+            self._pendingSelection = nodeId
+        self._selectionTimerId = self.root.after(
+            self._SELECTION_DELAY,
+            self._show_pending_selection,
+        )
 
     def on_close(self):
         """Actions to be performed when a project is closed.
         
         Overrides the SubController method.
         """
+        if self._selectionTimerId is not None:
+            self.root.after_cancel(self._selectionTimerId)
+            self._selectionTimerId = None
+        self._pendingSelection = None
+        self._shownSelection = None
         self.root.title(self.title)
         self.show_path('')
         self.pathBar.set_normal()
@@ -187,6 +211,8 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
 
     def refresh(self):
         """Implements the Observer method."""
+        self._shownSelection = None
+        # the element's data may have been replaced, e.g. by a merge
         self.set_title()
 
     def restore_status(self, event=None):
@@ -243,6 +269,7 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
         """Show/hide the contents viewer text box."""
         if self.middleFrame.winfo_manager():
             self.middleFrame.pack_forget()
+            self._mdl.hide_observer(self.contentsView)
             prefs['show_contents'] = False
         else:
             self.middleFrame.pack(
@@ -251,6 +278,7 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
                 expand=False,
                 fill='both',
             )
+            self._mdl.show_observer(self.contentsView)
             prefs['show_contents'] = True
         return 'break'
 
@@ -259,9 +287,11 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
         if self.rightFrame.winfo_manager():
             self.propertiesView.apply_changes()
             self.rightFrame.pack_forget()
+            self._mdl.hide_observer(self.propertiesView)
             prefs['show_properties'] = False
         elif not self._propWinDetached:
             self.rightFrame.pack(side='left', expand=False, fill='both')
+            self._mdl.show_observer(self.propertiesView)
             prefs['show_properties'] = True
         return 'break'
 
@@ -377,6 +407,9 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
             KEYS.DETACH_PROPERTIES[0], self._dock_properties_frame)
         self._propertiesWindow.protocol(
             "WM_DELETE_WINDOW", self._dock_properties_frame)
+        self._propertiesWindow.bind('<Map>', self._on_properties_window_map)
+        self._propertiesWindow.bind(
+            '<Unmap>', self._on_properties_window_unmap)
         prefs['detach_prop_win'] = True
         self._propWinDetached = True
         try:
@@ -419,3 +452,35 @@ class MainView(Observer, MsgBoxes, SubController, MainMenu):
         except IndexError:
             pass
         return 'break'
+
+    def _on_properties_window_map(self, event):
+        # Refresh the detached properties view when deiconified, if needed.
+        if self._propWinDetached and event.widget is self._propertiesWindow:
+            self._mdl.show_observer(self.propertiesView)
+
+    def _on_properties_window_unmap(self, event):
+        # Stop refreshing the detached properties view when iconified.
+        if self._propWinDetached and event.widget is self._propertiesWindow:
+            self._mdl.hide_observer(self.propertiesView)
+
+    def _show_pending_selection(self):
+        # Show the latest selection made while the timer was running.
+        self._selectionTimerId = None
+        nodeId = self._pendingSelection
+        self._pendingSelection = None
+        if nodeId is not None and self.tv.tree.exists(nodeId):
+            self._show_selection(nodeId)
+
+    def _show_selection(self, nodeId):
+        # Show the properties/contents of the selected element.
+        if (
+            self._shownSelection != nodeId
+            or self.propertiesView.activeView.elementId != nodeId
+        ):
+            self.propertiesView.apply_changes()
+            # making sure that pending edits go to the element viewed
+            self.propertiesView.show_properties(nodeId)
+            self._shownSelection = nodeId
+        self.contentsView.see(nodeId)
+        self.root.event_generate('<<selection_changed>>', when='tail')
+        # this event can be used by plugins
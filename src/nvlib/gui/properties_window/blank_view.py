@@ -31,6 +31,7 @@ class BlankView(ttk.Frame, SubController):
         self._ui = view
         self._ctrl = controller
         self.element = None
+        self.elementId = None
 
     def apply_changes(self, event=None):
         pass
@@ -9,6 +9,7 @@ from tkinter import ttk
 from nvlib.controller.sub_controller import SubController
 from nvlib.gui.observer import Observer
 from nvlib.gui.tree_window.history_list import HistoryList
+from nvlib.model.data.navigation_index import NavigationIndex
 from nvlib.model.data.py_calendar import PyCalendar
 from nvlib.model.nv_treeview import NvTreeview
 from nvlib.novx_globals import CHAPTER_PREFIX
@@ -24,7 +25,6 @@ from nvlib.novx_globals import PLOT_POINT_PREFIX
 from nvlib.novx_globals import PL_ROOT
 from nvlib.novx_globals import PN_ROOT
 from nvlib.novx_globals import PRJ_NOTE_PREFIX
-from nvlib.novx_globals import ROOT_PREFIX
 from nvlib.novx_globals import SECTION_PREFIX
 from nvlib.novx_globals import STATUS
 from nvlib.novx_globals import list_to_string
@@ -101,6 +101,7 @@ class TreeViewer(ttk.Frame, Observer, SubController):
 
         # Create a novel tree.
         self.tree = NvTreeview(self)
+        self._navigation = NavigationIndex(self.tree)
         scrollX = ttk.Scrollbar(
             self,
             orient='horizontal',
@@ -392,53 +393,21 @@ class TreeViewer(ttk.Frame, Observer, SubController):
             self.go_to_node(prevNode)
         return('break')
 
-    def next_node(self, thisNode):
+    def next_node(self, thisNode, match=None):
         """Return the next node ID of the same element type as thisNode.
         
         Positional arguments: 
             thisNode: str -- node ID
-        """
-
-        def search_tree(parent, result, flag):
-            # Search the tree for the node ID after thisNode.
-            for child in self.tree.get_children(parent):
-                if result:
-                    break
-
-                if child.startswith(prefix):
-                    if prefix == CHAPTER_PREFIX:
-                        if (self._mdl.novel.chapters[child].chLevel
-                            != self._mdl.novel.chapters[thisNode].chLevel
-                        ):
-                            continue
-
-                    elif prefix == SECTION_PREFIX:
-                        if self._mdl.novel.sections[thisNode].scType > 1:
-                            if (self._mdl.novel.sections[child].scType
-                                != self._mdl.novel.sections[thisNode].scType
-                            ):
-                                continue
-
-                        elif self._mdl.novel.sections[thisNode].scType < 2:
-                            if self._mdl.novel.sections[child].scType > 1:
-                                continue
-
-                    if flag:
-                        result = child
-                        break
 
-                    elif child == thisNode:
-                        flag = True
-                else:
-                    result, flag = search_tree(child, result, flag)
-            return result, flag
-
-        prefix = thisNode[:2]
-        root = self.tree.parent(thisNode)
-        while not root.startswith(ROOT_PREFIX):
-            root = self.tree.parent(root)
-        nextNode, __ = search_tree(root, None, False)
-        return nextNode
+        Optional arguments:
+            match -- callable; with a node ID as argument, it returns
+                     False, if the node is to be skipped,
+                     e.g. when looking for the next "draft" section.
+        """
+        return self._navigation.get_next(
+            thisNode,
+            self._get_navigation_filter(thisNode, match),
+        )
 
     def on_close(self):
         """Actions to be performed when a project is closed."""
@@ -487,52 +456,21 @@ class TreeViewer(ttk.Frame, Observer, SubController):
         for child in self.tree.get_children(parent):
             self.open_children(child)
 
-    def prev_node(self, thisNode):
+    def prev_node(self, thisNode, match=None):
         """Return the previous node ID of the same element type as thisNode.
 
         Positional arguments: 
             thisNode: str -- node ID
-        """
-
-        def search_tree(parent, result, prevNode):
-            # Search the tree for the node ID before thisNode.
-            for child in self.tree.get_children(parent):
-                if result:
-                    break
-
-                if child.startswith(prefix):
-                    if prefix == CHAPTER_PREFIX:
-                        if (self._mdl.novel.chapters[child].chLevel
-                            != self._mdl.novel.chapters[thisNode].chLevel
-                        ):
-                            continue
-
-                    elif prefix == SECTION_PREFIX:
-                        if self._mdl.novel.sections[thisNode].scType > 1:
-                            if (self._mdl.novel.sections[child].scType
-                                != self._mdl.novel.sections[thisNode].scType
-                            ):
-                                continue
-
-                        elif self._mdl.novel.sections[thisNode].scType < 2:
-                            if self._mdl.novel.sections[child].scType > 1:
-                                continue
-
-                    if child == thisNode:
-                        result = prevNode
-                        break
-                    else:
-                        prevNode = child
-                else:
-                    result, prevNode = search_tree(child, result, prevNode)
-            return result, prevNode
 
-        prefix = thisNode[:2]
-        root = self.tree.parent(thisNode)
-        while not root.startswith(ROOT_PREFIX):
-            root = self.tree.parent(root)
-        prevNode, __ = search_tree(root, None, None)
-        return prevNode
+        Optional arguments:
+            match -- callable; with a node ID as argument, it returns
+                     False, if the node is to be skipped,
+                     e.g. when looking for the previous "draft" section.
+        """
+        return self._navigation.get_prev(
+            thisNode,
+            self._get_navigation_filter(thisNode, match),
+        )
 
     def refresh(self, event=None):
         """Update the tree display to view changes.
@@ -1108,6 +1046,38 @@ class TreeViewer(ttk.Frame, Observer, SubController):
             self._mdl.novel.items[itId].title
             ), nodeValues, tuple(nodeTags)
 
+    def _get_navigation_filter(self, thisNode, match):
+        # Return a function that accepts the nodes to navigate to from
+        # thisNode: chapters of the same level, stages of the same level,
+        # or sections that are no stages; restricted by match, if any.
+        if thisNode.startswith(CHAPTER_PREFIX):
+            chapters = self._mdl.novel.chapters
+            chLevel = chapters[thisNode].chLevel
+
+            def is_same_type(node):
+                return chapters[node].chLevel == chLevel
+
+        elif thisNode.startswith(SECTION_PREFIX):
+            sections = self._mdl.novel.sections
+            scType = sections[thisNode].scType
+            if scType > 1:
+
+                def is_same_type(node):
+                    return sections[node].scType == scType
+
+            else:
+
+                def is_same_type(node):
+                    return sections[node].scType < 2
+
+        else:
+            return match
+
+        if match is None:
+            return is_same_type
+
+        return lambda node: is_same_type(node) and match(node)
+
     def _get_location_row_data(self, lcId):
         # Return title, values, and tags for a location row.
         nodeValues = [''] * len(self.columns)
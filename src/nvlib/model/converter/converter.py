@@ -295,6 +295,10 @@ class Converter:
             )
             source.read()
             target.novel = source.novel
+            if hasattr(target, 'wcLog'):
+                # Converting between project layouts: keep the log.
+                target.wcLog = source.wcLog
+                target.wcLogUpdate = source.wcLogUpdate
             target.write()
         except RuntimeError as ex:
             statusMsg = f'!{str(ex)}'
@@ -36,12 +36,13 @@ class ExportTargetFactory(FileFactory):
         suffix = kwargs['suffix']
         for fileClass in self._fileClasses:
             if fileClass.SUFFIX == suffix:
-                if suffix is None:
-                    suffix = ''
-                targetFile = fileClass(
-                    f'{fileName}{suffix}{fileClass.EXTENSION}',
-                    **kwargs
-                )
+                targetPath = f'{fileName}{suffix or ""}{fileClass.EXTENSION}'
+                if targetPath == sourcePath:
+                    # Never overwrite the source,
+                    # e.g. when converting between project layouts.
+                    continue
+
+                targetFile = fileClass(targetPath, **kwargs)
                 return None, targetFile
 
         raise RuntimeError(
@@ -6,6 +6,7 @@ License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 from nvlib.model.novx.data_writer import DataWriter
 from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.split_novx_file import SplitNovxFile
 from nvlib.model.ods.ods_r_chapterlist import OdsRChapterList
 from nvlib.model.ods.ods_r_charlist import OdsRCharList
 from nvlib.model.ods.ods_r_grid import OdsRGrid
@@ -67,8 +68,10 @@ class NovxConversion:
                                  that can converted 
                                  to a new novelibre project.
     """
-    EXPORT_SOURCE_CLASSES = [NovxFile]
+    EXPORT_SOURCE_CLASSES = [NovxFile, SplitNovxFile]
     EXPORT_TARGET_CLASSES = [
+        NovxFile,
+        SplitNovxFile,
         DataWriter,
         OdsWCharList,
         OdsWChapterList,
@@ -116,6 +119,6 @@ class NovxConversion:
         OdtRSectionDesc,
         OdtRStages,
     ]
-    IMPORT_TARGET_CLASSES = [NovxFile]
+    IMPORT_TARGET_CLASSES = [NovxFile, SplitNovxFile]
     CREATE_SOURCE_CLASSES = []
 
@@ -4,6 +4,13 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from sys import intern
+from types import MappingProxyType
+
+EMPTY_DICT = MappingProxyType({})
+EMPTY_LIST = ()
+# Immutable empty defaults shared by all element instances.
+# The property getters return mutable copies.
 
 
 class BasicElement:
@@ -16,8 +23,22 @@ class BasicElement:
     any property changes.
     This method can be overridden at runtime for each individual 
     element instance.
+    
+    The elements use __slots__ instead of a per-instance __dict__ 
+    in order to keep large projects compact in memory.
+    Subclasses must declare their own instance variables as slots.
     """
 
+    __slots__ = (
+        'on_element_change',
+        '_title',
+        '_desc',
+        '_color',
+        '_links',
+        '_fields',
+        'titleIndex',
+    )
+
     def __init__(
         self,
         on_element_change=None,
@@ -42,8 +63,10 @@ class BasicElement:
         self._title = title
         self._desc = desc
         self._color = color
-        self._links = links or {}
-        self._fields = fields or {}
+        self._links = self._compact_dict(links) or EMPTY_DICT
+        self._fields = self._compact_dict(fields) or EMPTY_DICT
+        self.titleIndex = None
+        # TitleIndex the element is registered with
 
     @property
     def title(self):
@@ -55,6 +78,8 @@ class BasicElement:
             assert type(newVal) is str
         if self._title != newVal:
             self._title = newVal
+            if self.titleIndex is not None:
+                self.titleIndex.update(self)
             self.on_element_change()
 
     @property
@@ -97,7 +122,7 @@ class BasicElement:
                 if val is not None:
                     assert type(val) is str
         if self._links != newVal:
-            self._links = newVal
+            self._links = self._compact_dict(newVal)
             self.on_element_change()
 
     @property
@@ -107,10 +132,66 @@ class BasicElement:
     @fields.setter
     def fields(self, newVal):
         if self._fields != newVal:
-            self._fields = newVal
+            self._fields = self._compact_dict(newVal)
             self.on_element_change()
 
+    def __getstate__(self):
+        # Return the attribute values for pickling.
+        # The shared empty dictionary cannot be pickled,
+        # so the attributes referring to it are listed separately.
+        values = dict(getattr(self, '__dict__', {}))
+        emptyDicts = []
+        for cls in type(self).__mro__:
+            for attribute in getattr(cls, '__slots__', ()):
+                if not hasattr(self, attribute):
+                    continue
+
+                value = getattr(self, attribute)
+                if value is EMPTY_DICT:
+                    emptyDicts.append(attribute)
+                else:
+                    values[attribute] = value
+        return values, emptyDicts
+
+    def __setstate__(self, state):
+        # Restore the attribute values after unpickling.
+        values, emptyDicts = state
+        for attribute in values:
+            object.__setattr__(self, attribute, values[attribute])
+        for attribute in emptyDicts:
+            object.__setattr__(self, attribute, EMPTY_DICT)
+
     def do_nothing(self):
         """Standard callback routine for element changes."""
         pass
 
+    def _compact_dict(self, newVal):
+        # Return newVal, or the shared empty default if newVal is empty.
+        if newVal is None:
+            return None
+
+        if not newVal:
+            return EMPTY_DICT
+
+        return newVal
+
+    def _compact_list(self, newVal):
+        # Return a list of interned strings,
+        # or the shared empty default if newVal is empty.
+        if newVal is None:
+            return None
+
+        if not newVal:
+            return EMPTY_LIST
+
+        return [self._interned(elem) for elem in newVal]
+
+    def _interned(self, newVal):
+        # Return newVal as an interned string, if applicable.
+        # IDs and tags occur many times in a project,
+        # so all occurrences share a single string object.
+        if newVal is None:
+            return None
+
+        return intern(newVal)
+
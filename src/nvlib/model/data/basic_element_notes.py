@@ -10,6 +10,8 @@ from nvlib.model.data.basic_element import BasicElement
 class BasicElementNotes(BasicElement):
     """Basic element with notes."""
 
+    __slots__ = ('_notes',)
+
     def __init__(
         self,
         notes=None,
@@ -4,12 +4,15 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from nvlib.model.data.basic_element import EMPTY_LIST
 from nvlib.model.data.basic_element_notes import BasicElementNotes
 
 
 class BasicElementTags(BasicElementNotes):
     """Basic element with notes and tags."""
 
+    __slots__ = ('_tags',)
+
     def __init__(
         self,
         tags=None,
@@ -17,12 +20,15 @@ class BasicElementTags(BasicElementNotes):
     ):
         """Extends the superclass constructor"""
         super().__init__(**kwargs)
-        self._tags = tags or []
+        self._tags = self._compact_list(tags) or EMPTY_LIST
 
     @property
     def tags(self):
         # list of str
-        return self._tags
+        try:
+            return list(self._tags)
+        except TypeError:
+            return None
 
     @tags.setter
     def tags(self, newVal):
@@ -30,6 +36,7 @@ class BasicElementTags(BasicElementNotes):
             for elem in newVal:
                 if elem is not None:
                     assert type(elem) is str
+        newVal = self._compact_list(newVal)
         if self._tags != newVal:
             self._tags = newVal
             self.on_element_change()
@@ -11,6 +11,14 @@ from nvlib.model.data.basic_element_notes import BasicElementNotes
 class Chapter(BasicElementNotes):
     """novelibre chapter representation."""
 
+    __slots__ = (
+        '_chLevel',
+        '_chType',
+        '_noNumber',
+        '_isTrash',
+        '_hasEpigraph',
+    )
+
     def __init__(
         self,
         chLevel=None,
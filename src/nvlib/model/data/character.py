@@ -10,6 +10,15 @@ from nvlib.model.data.world_element import WorldElement
 class Character(WorldElement):
     """novelibre character representation."""
 
+    __slots__ = (
+        '_bio',
+        '_goals',
+        '_fullName',
+        '_isMajor',
+        '_birthDate',
+        '_deathDate',
+    )
+
     def __init__(
         self,
         bio=None,
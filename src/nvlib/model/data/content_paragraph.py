@@ -0,0 +1,121 @@
+"""Provide a class for a paragraph of section content.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import re
+
+import xml.etree.ElementTree as ET
+
+LANGUAGE_TAG = re.compile(r'\<(p|span|h.) xml\:lang=\"(.*?)\".*?\>')
+ELEMENT_TAG = re.compile(r'\<([^\s/>!?]+)')
+
+
+def get_languages(xmlStr):
+    """Return a tuple of the language codes used in xmlStr.
+    
+    The language codes are listed in the order of their first use.
+    """
+    languages = []
+    for match in LANGUAGE_TAG.finditer(xmlStr):
+        language = match.group(2)
+        if not language in languages:
+            languages.append(language)
+    return tuple(languages)
+
+
+class ContentParagraph:
+    """A top-level element of the section content, e.g. a paragraph.
+
+    The paragraph's XML string is kept as it is.
+    The derived values are calculated on first access,
+    and the inline elements are parsed on first access.
+    """
+
+    __slots__ = (
+        'xml',
+        '_wordCounter',
+        '_wordCountInfo',
+        '_languages',
+        '_element',
+    )
+
+    def __init__(self, xmlStr, wordCounter):
+        """Positional arguments:
+            xmlStr: str -- XML of the paragraph.
+            wordCounter -- WordCounter instance.
+        """
+        self.xml = xmlStr
+        self._wordCounter = wordCounter
+        self._wordCountInfo = None
+        self._languages = None
+        self._element = None
+
+    @property
+    def comments(self):
+        # list of the paragraph's comment elements
+        return list(self.element.iter('comment'))
+
+    @property
+    def element(self):
+        # ElementTree element of the paragraph, parsed on demand
+        if self._element is None:
+            self._element = ET.fromstring(self.xml)
+        return self._element
+
+    @property
+    def hasComment(self):
+        return '<comment>' in self.xml
+
+    @property
+    def languages(self):
+        # tuple of the language codes used in the paragraph
+        if self._languages is None:
+            self._languages = get_languages(self.xml)
+        return self._languages
+
+    @property
+    def notes(self):
+        # list of the paragraph's note elements
+        return list(self.element.iter('note'))
+
+    @property
+    def spans(self):
+        # list of the paragraph's span elements
+        return list(self.element.iter('span'))
+
+    @property
+    def tag(self):
+        # name of the paragraph's element, e.g. "p" or "h5"
+        match = ELEMENT_TAG.match(self.xml)
+        if match is None:
+            return None
+
+        return match.group(1)
+
+    @property
+    def text(self):
+        # plain text of the paragraph without comments and notes
+        return ''.join(self._iter_text(self.element))
+
+    @property
+    def wordCountInfo(self):
+        # (word count, head, tail), see WordCounter.get_word_count_info()
+        if self._wordCountInfo is None:
+            self._wordCountInfo = self._wordCounter.get_word_count_info(
+                self.xml
+            )
+        return self._wordCountInfo
+
+    def _iter_text(self, element):
+        # Yield the text parts of element, skipping comments and notes.
+        if element.tag in ('comment', 'note'):
+            return
+
+        if element.text:
+            yield element.text
+        for child in element:
+            yield from self._iter_text(child)
+            if child.tail:
+                yield child.tail
@@ -10,6 +10,8 @@ import re
 
 from nvlib.model.data.splitter import Splitter
 
+XML_TAG = re.compile(r'\<.*?\>')
+
 
 class ContentSplitter(Splitter):
     """Helper class for section and chapter splitting by content.
@@ -77,12 +79,15 @@ class ContentSplitter(Splitter):
         )
 
     def _get_lines(self, novel, scanScId):
-        sectionContent = novel.sections[scanScId].sectionContent
-        sectionContent = sectionContent.replace('</p>', '</p>\n')
-        return sectionContent.split('\n')
+        # Return the lines of the section content's top-level elements.
+        # Dividers inserted as plain text are on lines of their own.
+        lines = []
+        for paragraph in novel.sections[scanScId].structuredContent:
+            lines.extend(paragraph.xml.split('\n'))
+        return lines
 
     def _set_text(self, novel, scId, newLines):
         novel.sections[scId].sectionContent = ''.join(newLines)
 
     def _stripped_line(self, line):
-        return re.sub(r'\<.*?\>', '', line)
+        return XML_TAG.sub('', line)
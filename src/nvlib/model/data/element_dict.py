@@ -0,0 +1,81 @@
+"""Provide a dictionary class for the elements of a novel.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.title_index import TitleIndex
+
+
+class ElementDict(dict):
+    """Dictionary of elements, keeping the title index up to date.
+
+    key = element ID, value = element instance.
+
+    Public instance variables:
+        titleIndex: TitleIndex -- the element IDs by normalized title.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.titleIndex = TitleIndex()
+
+    def __delitem__(self, elemId):
+        self._detach(self[elemId])
+        super().__delitem__(elemId)
+
+    def __reduce__(self):
+        # Pickle support: Create the index before the items are set.
+        return (
+            self.__class__,
+            (),
+            None,
+            None,
+            iter(self.items()),
+        )
+
+    def __setitem__(self, elemId, element):
+        if elemId in self:
+            self._detach(self[elemId])
+        super().__setitem__(elemId, element)
+        self._attach(elemId, element)
+
+    def clear(self):
+        for element in self.values():
+            self._detach(element)
+        super().clear()
+
+    def pop(self, elemId, *args):
+        if elemId in self:
+            self._detach(self[elemId])
+        return super().pop(elemId, *args)
+
+    def popitem(self):
+        elemId, element = super().popitem()
+        self._detach(element)
+        return elemId, element
+
+    def setdefault(self, elemId, element=None):
+        if not elemId in self:
+            self[elemId] = element
+        return self[elemId]
+
+    def update(self, *args, **kwargs):
+        for elemId, element in dict(*args, **kwargs).items():
+            self[elemId] = element
+
+    def _attach(self, elemId, element):
+        # Register the element's title.
+        # If the element is registered elsewhere, e.g. in another novel,
+        # unregister it there first.
+        if element.titleIndex is not None:
+            element.titleIndex.remove(element)
+        element.titleIndex = self.titleIndex
+        self.titleIndex.add(elemId, element)
+
+    def _detach(self, element):
+        # Unregister the element's title,
+        # unless it has been registered elsewhere in the meantime.
+        if element.titleIndex is self.titleIndex:
+            self.titleIndex.remove(element)
+            element.titleIndex = None
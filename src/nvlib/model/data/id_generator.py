@@ -17,3 +17,21 @@ def new_id(elements, prefix=''):
         i += 1
     return f'{prefix}{i}'
 
+
+def new_ids(elements, prefix=''):
+    """Generate unused IDs for new elements.
+    
+    Positional arguments:
+        elements -- list or dictionary containing all existing IDs
+    
+    The IDs are the same as those returned by repeated calls of new_id(),
+    provided that each ID is added to elements before the next one
+    is generated, and no elements are removed in the meantime.
+    The search continues after the last ID generated, so generating
+    n IDs takes linear time instead of quadratic time.
+    """
+    i = 1
+    while True:
+        if not f'{prefix}{i}' in elements:
+            yield f'{prefix}{i}'
+        i += 1
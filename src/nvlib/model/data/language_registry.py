@@ -0,0 +1,50 @@
+"""Provide a class for registering the languages used in the sections.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+
+
+class LanguageRegistry:
+    """Reference-counted registry of the section languages.
+    
+    Each section registers the language codes found in its content.
+    A language is listed as long as at least one section uses it.
+    """
+
+    def __init__(self):
+        self._refCounts = {}
+        # key: language code, value: number of sections using it
+        # in the order of the first occurrence
+
+    def add(self, languages):
+        """Register the languages of a section.
+        
+        Positional arguments:
+            languages: tuple of str -- language codes.
+        """
+        for language in languages:
+            self._refCounts[language] = self._refCounts.get(language, 0) + 1
+
+    def get_languages(self):
+        """Return a list of the registered language codes."""
+        return list(self._refCounts)
+
+    def remove(self, languages):
+        """Unregister the languages of a section.
+        
+        Positional arguments:
+            languages: tuple of str -- language codes.
+        """
+        for language in languages:
+            refCount = self._refCounts.get(language, 0) - 1
+            if refCount > 0:
+                self._refCounts[language] = refCount
+            else:
+                self._refCounts.pop(language, None)
+
+    def replace(self, oldLanguages, newLanguages):
+        """Update the registry after a section's languages have changed."""
+        self.remove(oldLanguages)
+        self.add(newLanguages)
@@ -0,0 +1,93 @@
+"""Provide a class for looking up the next/previous tree element.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+
+
+class NavigationIndex:
+    """The project tree in navigation order, per element type.
+
+    The tree's elements are listed in depth-first order, one list
+    per ID prefix, e.g. all sections of the book in reading order.
+    The lists are rebuilt on demand after structural changes of the
+    tree, i.e. when the tree's "structureChanges" counter has changed.
+    """
+
+    def __init__(self, tree):
+        """Positional arguments:
+            tree -- NvTree or NvTreeview instance.
+        """
+        self._tree = tree
+        self._structureChanges = None
+        # tree's change counter when the index was built
+        self._orders = {}
+        # key: str -- ID prefix
+        # value: list of node IDs in tree order
+        self._positions = {}
+        # key: str -- node ID
+        # value: int -- index in the list of its prefix
+
+    def get_next(self, node, match=None):
+        """Return the next node ID of the same type, or None.
+
+        Positional arguments:
+            node: str -- ID of the node to start from.
+
+        Optional arguments:
+            match -- callable; with a node ID as argument, it returns
+                     False, if the node is to be skipped.
+        """
+        order, i = self._locate(node)
+        if order is None:
+            return None
+
+        for i in range(i + 1, len(order)):
+            if match is None or match(order[i]):
+                return order[i]
+
+        return None
+
+    def get_prev(self, node, match=None):
+        """Return the previous node ID of the same type, or None.
+
+        Positional arguments:
+            node: str -- ID of the node to start from.
+
+        Optional arguments:
+            match -- callable; with a node ID as argument, it returns
+                     False, if the node is to be skipped.
+        """
+        order, i = self._locate(node)
+        if order is None:
+            return None
+
+        for i in range(i - 1, -1, -1):
+            if match is None or match(order[i]):
+                return order[i]
+
+        return None
+
+    def _build(self):
+        # Collect the nodes of all branches in tree order.
+        self._orders = {}
+        self._positions = {}
+        stack = list(reversed(self._tree.get_children('')))
+        while stack:
+            node = stack.pop()
+            order = self._orders.setdefault(node[:2], [])
+            self._positions[node] = len(order)
+            order.append(node)
+            stack.extend(reversed(self._tree.get_children(node) or ()))
+        self._structureChanges = self._tree.structureChanges
+
+    def _locate(self, node):
+        # Return the list of the node's type, and the node's index.
+        if self._structureChanges != self._tree.structureChanges:
+            self._build()
+        i = self._positions.get(node, None)
+        if i is None:
+            return None, None
+
+        return self._orders[node[:2]], i
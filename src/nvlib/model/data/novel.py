@@ -5,10 +5,14 @@ For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 import locale
-import re
 
 from nvlib.model.data.basic_element import BasicElement
+from nvlib.model.data.element_dict import ElementDict
+from nvlib.model.data.language_registry import LanguageRegistry
 from nvlib.model.data.py_calendar import PyCalendar
+from nvlib.model.data.section_dict import SectionDict
+from nvlib.model.data.section_table import SectionTable
+from nvlib.model.data.timeline_index import TimelineIndex
 from nvlib.novx_globals import CHAPTER_PREFIX
 from nvlib.novx_globals import CHARACTER_PREFIX
 from nvlib.novx_globals import ITEM_PREFIX
@@ -18,8 +22,6 @@ from nvlib.novx_globals import PLOT_POINT_PREFIX
 from nvlib.novx_globals import PRJ_NOTE_PREFIX
 from nvlib.novx_globals import SECTION_PREFIX
 
-LANGUAGE_TAG = re.compile(r'\<(p|span|h.) xml\:lang=\"(.*?)\".*?\>')
-
 
 class Novel(BasicElement):
     """Novel representation."""
@@ -81,25 +83,35 @@ class Novel(BasicElement):
         self._crField1 = crField1
         self._crField2 = crField2
 
-        self.chapters = {}
+        self.chapters = ElementDict()
         # key = chapter ID, value = Chapter instance.
-        self.sections = {}
+        self.languageRegistry = LanguageRegistry()
+        # Languages used in the section contents.
+        self.timelineIndex = TimelineIndex(referenceDate)
+        # Start and end timestamps of the sections.
+        self.sectionTable = SectionTable(referenceDate)
+        # Columnar section metadata for analytics.
+        self.sections = SectionDict(
+            self.languageRegistry,
+            self.timelineIndex,
+            self.sectionTable,
+        )
         # key = section ID, value = Section instance.
-        self.plotPoints = {}
+        self.plotPoints = ElementDict()
         # key = section ID, value = PlotPoint instance.
         self.languages = None
         # List of non-document languages occurring as section markup.
         # Format: ll-CC,
         # where ll is the language code, and CC is the country code.
-        self.plotLines = {}
+        self.plotLines = ElementDict()
         # key = plot line ID, value = PlotLine instance.
-        self.locations = {}
+        self.locations = ElementDict()
         # key = location ID, value = WorldElement instance.
-        self.items = {}
+        self.items = ElementDict()
         # key = item ID, value = WorldElement instance.
-        self.characters = {}
+        self.characters = ElementDict()
         # key = character ID, value = Character instance.
-        self.projectNotes = {}
+        self.projectNotes = ElementDict()
         # key = note ID, value = note instance.
         try:
             self.referenceWeekDay = PyCalendar.weekday(referenceDate)
@@ -441,6 +453,8 @@ class Novel(BasicElement):
             if not newVal:
                 self._referenceDate = None
                 self.referenceWeekDay = None
+                self.timelineIndex.set_reference_date(None)
+                self.sectionTable.set_reference_date(None)
                 self.on_element_change()
             else:
                 try:
@@ -450,6 +464,8 @@ class Novel(BasicElement):
                     # date and week day remain unchanged
                 else:
                     self._referenceDate = newVal
+                    self.timelineIndex.set_reference_date(newVal)
+                    self.sectionTable.set_reference_date(newVal)
                     self.on_element_change()
 
     def check_locale(self):
@@ -479,32 +495,33 @@ class Novel(BasicElement):
             # Set "No country information".
             self.countryCode = None
 
+    def get_ids_by_title(self, prefix, title):
+        """Return a list of the IDs of the elements with the given title.
+        
+        Positional arguments:
+            prefix: str -- element type prefix, e.g. CHARACTER_PREFIX.
+            title: str -- title to look up.
+
+        The titles are compared case-insensitive,
+        with normalized whitespace.
+        More than one ID means that the title is ambiguous.
+        """
+        return self.elementsByPrefix[prefix].titleIndex.get_ids(title)
+
     def get_languages(self):
         """Determine the languages used in the document.
         
         Populate the self.languages list with all language codes 
-        found in the section contents.        
+        found in the section contents. 
+        The sections register their languages when their content 
+        is set, so no content needs to be searched here.
+        The languages are listed in the order of their registration.
         Example:
         - language markup: 
           'Standard text <span xml:lang="en-AU"]Australian text</span>.'
         - language code: 'en-AU'
         """
-
-        def languages(text):
-            # Yield the language codes appearing in text.
-            m = LANGUAGE_TAG.search(text)
-            while m:
-                text = text[m.span()[1]:]
-                yield m.group(2)
-                m = LANGUAGE_TAG.search(text)
-
-        self.languages = []
-        for scId in self.sections:
-            text = self.sections[scId].sectionContent
-            if text:
-                for language in languages(text):
-                    if not language in self.languages:
-                        self.languages.append(language)
+        self.languages = self.languageRegistry.get_languages()
 
     def get_tags(self):
         """Return a dictionary with all tags.
@@ -38,9 +38,12 @@ class NvTree:
         self.srtPlotPoints = {}
         # key: plot line ID
         # value : plot point ID
+        self.structureChanges = 0
+        # incremented on each structural change
 
     def append(self, parent, iid):
         """Creates a new item with identifier iid."""
+        self.structureChanges += 1
         if parent in self.roots:
             self.roots[parent].append(iid)
             if parent == CH_ROOT:
@@ -65,10 +68,22 @@ class NvTree:
     def delete(self, *items):
         """Delete all specified items and all their descendants. The root
         item may not be deleted."""
-        raise NotImplementedError
+        self.structureChanges += 1
+        for item in items:
+            self.srtSections.pop(item, None)
+            self.srtPlotPoints.pop(item, None)
+            for children in (
+                list(self.roots.values())
+                + list(self.srtSections.values())
+                + list(self.srtPlotPoints.values())
+            ):
+                if item in children:
+                    children.remove(item)
+                    break
 
     def delete_children(self, parent):
         """Delete all parent's descendants."""
+        self.structureChanges += 1
         if parent in self.roots:
             self.roots[parent] = []
             if parent == CH_ROOT:
@@ -88,6 +103,9 @@ class NvTree:
 
     def get_children(self, item):
         """Returns the list of children belonging to item."""
+        if item == '':
+            return list(self.roots)
+
         if item in self.roots:
             return self.roots[item]
 
@@ -104,6 +122,7 @@ class NvTree:
 
     def insert(self, parent, index, iid):
         """Create a new item with identifier iid."""
+        self.structureChanges += 1
         if parent in self.roots:
             self.roots[parent].insert(index, iid)
             if parent == CH_ROOT:
@@ -170,27 +189,44 @@ class NvTree:
 
     def reset(self):
         """Clear the tree."""
+        self.structureChanges += 1
         for item in self.roots:
             self.roots[item] = []
         self.srtSections.clear()
         self.srtPlotPoints.clear()
 
-    def set_children(self, item, newchildren):
-        """Replaces item’s child with newchildren."""
+    def set_children(self, item, *newchildren):
+        """Replaces item’s child with newchildren.
+
+        Children in newchildren that are not yet children of item
+        are deleted first, i.e. removed from their previous parent
+        together with their own descendants.
+        Then item's child list is replaced by newchildren.
+        If item is a root, the descendants of its previous children
+        are kept for the children that remain, and dropped otherwise.
+        """
+        self.structureChanges += 1
+        newchildren = list(newchildren)
+        for child in newchildren:
+            if not child in self.get_children(item):
+                self.delete(child)
         if item in self.roots:
-            self.roots[item] = newchildren[:]
+            self.roots[item] = newchildren
             if item == CH_ROOT:
-                self.srtSections.clear()
-                return
-
-            if item == PL_ROOT:
-                self.srtPlotPoints.clear()
+                self.srtSections = {
+                    chId: self.srtSections.get(chId, [])
+                    for chId in newchildren
+                }
+            elif item == PL_ROOT:
+                self.srtPlotPoints = {
+                    plId: self.srtPlotPoints.get(plId, [])
+                    for plId in newchildren
+                }
             return
 
         if item.startswith(CHAPTER_PREFIX):
-            self.srtSections[item] = newchildren[:]
+            self.srtSections[item] = newchildren
             return
 
         if item.startswith(PLOT_LINE_PREFIX):
-            self.srtPlotPoints[item] = newchildren[:]
-
+            self.srtPlotPoints[item] = newchildren
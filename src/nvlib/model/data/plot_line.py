@@ -4,12 +4,18 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from nvlib.model.data.basic_element import EMPTY_LIST
 from nvlib.model.data.basic_element_notes import BasicElementNotes
 
 
 class PlotLine(BasicElementNotes):
     """Plot line representation."""
 
+    __slots__ = (
+        '_shortName',
+        '_sections',
+    )
+
     def __init__(
         self,
         shortName=None,
@@ -20,7 +26,7 @@ class PlotLine(BasicElementNotes):
         super().__init__(**kwargs)
 
         self._shortName = shortName
-        self._sections = sections or []
+        self._sections = self._compact_list(sections) or EMPTY_LIST
 
     @property
     def shortName(self):
@@ -39,7 +45,7 @@ class PlotLine(BasicElementNotes):
     def sections(self):
         # List of str: IDs of the sections associated with the plot line.
         try:
-            return self._sections[:]
+            return list(self._sections)
         except TypeError:
             return None
 
@@ -49,6 +55,7 @@ class PlotLine(BasicElementNotes):
             for elem in newVal:
                 if elem is not None:
                     assert type(elem) is str
+        newVal = self._compact_list(newVal)
         if self._sections != newVal:
             self._sections = newVal
             self.on_element_change()
@@ -10,6 +10,8 @@ from nvlib.model.data.basic_element_notes import BasicElementNotes
 class PlotPoint(BasicElementNotes):
     """Plot point representation."""
 
+    __slots__ = ('_sectionAssoc',)
+
     def __init__(
         self,
         sectionAssoc=None,
@@ -18,7 +20,7 @@ class PlotPoint(BasicElementNotes):
         """Extends the superclass constructor."""
         super().__init__(**kwargs)
 
-        self._sectionAssoc = sectionAssoc
+        self._sectionAssoc = self._interned(sectionAssoc)
 
     @property
     def sectionAssoc(self):
@@ -30,6 +32,6 @@ class PlotPoint(BasicElementNotes):
         if newVal is not None:
             assert type(newVal) is str
         if self._sectionAssoc != newVal:
-            self._sectionAssoc = newVal
+            self._sectionAssoc = self._interned(newVal)
             self.on_element_change()
 
@@ -121,6 +121,11 @@ class PyCalendar:
             section.lastsMinutes
         )
 
+    @classmethod
+    def get_duration_seconds(cls, section):
+        """Return the section's duration in seconds."""
+        return int(cls._get_duration(section).total_seconds())
+
     @classmethod
     def get_end_date_time(cls, section):
         """Return a tuple: (endDate, endTime) of a given section."""
@@ -4,15 +4,52 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-
+from nvlib.model.data.basic_element import EMPTY_DICT
+from nvlib.model.data.basic_element import EMPTY_LIST
 from nvlib.model.data.basic_element_tags import BasicElementTags
 from nvlib.model.data.py_calendar import PyCalendar
+from nvlib.model.data.structured_content import StructuredContent
 from nvlib.model.data.word_counter import WordCounter
 
 
 class Section(BasicElementTags):
     """novelibre section representation."""
 
+    __slots__ = (
+        '_sectionContent',
+        '_structuredContent',
+        'wordCount',
+        '_hasComment',
+        'languages',
+        'languageRegistry',
+        'timelineIndex',
+        'sectionTable',
+        '_scType',
+        '_scene',
+        '_status',
+        '_appendToPrev',
+        '_goal',
+        '_conflict',
+        '_outcome',
+        '_plotlineNotes',
+        '_date',
+        '_time',
+        '_day',
+        '_lastsMinutes',
+        '_lastsHours',
+        '_lastsDays',
+        '_viewpoint',
+        '_characters',
+        '_locations',
+        '_items',
+        'scPlotLines',
+        'scPlotPoints',
+        '_dateCache',
+        '_durationCache',
+        '_startCache',
+        '_endCache',
+    )
+
     NULL_DATE = '0001-01-01'
     NULL_TIME = '00:00:00'
 
@@ -44,9 +81,20 @@ class Section(BasicElementTags):
         """Extends the superclass constructor."""
         super().__init__(**kwargs)
         self._sectionContent = None
+        self._structuredContent = None
+        # StructuredContent instance, created when the content is set;
+        # after editing paragraphs, it holds the current content
         self.wordCount = 0
         self._hasComment = False
+        self.languages = EMPTY_LIST
+        # tuple of the language codes used in the content
         # To be updated by the sectionContent setter
+        self.languageRegistry = None
+        # LanguageRegistry of the novel containing the section
+        self.timelineIndex = None
+        # TimelineIndex of the novel containing the section
+        self.sectionTable = None
+        # SectionTable of the novel containing the section
 
         # Initialize properties.
         self._scType = scType
@@ -56,24 +104,20 @@ class Section(BasicElementTags):
         self._goal = goal
         self._conflict = conflict
         self._outcome = outcome
-        self._plotlineNotes = plotlineNotes or {}
+        self._plotlineNotes = self._compact_dict(plotlineNotes) or EMPTY_DICT
         try:
-            self._weekDay = PyCalendar.weekday(scDate)
-            self._localeDate = PyCalendar.locale_date(scDate)
-            self._date = scDate
+            self._date = PyCalendar.verified_date(scDate)
         except:
-            self._weekDay = None
-            self._localeDate = None
             self._date = None
         self._time = scTime
         self._day = day
         self._lastsMinutes = lastsMinutes
         self._lastsHours = lastsHours
         self._lastsDays = lastsDays
-        self._viewpoint = viewpoint
-        self._characters = characters or []
-        self._locations = locations or []
-        self._items = items or []
+        self._viewpoint = self._interned(viewpoint)
+        self._characters = self._compact_list(characters) or EMPTY_LIST
+        self._locations = self._compact_list(locations) or EMPTY_LIST
+        self._items = self._compact_list(items) or EMPTY_LIST
 
         self.scPlotLines = []
         # Back references to PlotLine.sections
@@ -81,25 +125,46 @@ class Section(BasicElementTags):
         # Back references to PlotPoint.sectionAssoc
         # key: plot point ID, value: plot line ID
 
+        # Derived date/time values, calculated on demand.
+        # None means "to be calculated".
+        self._dateCache = None
+        # tuple: (week day, locale date)
+        self._durationCache = None
+        # tuple: (duration in minutes,)
+        self._startCache = None
+        # tuple: (reference date, start timestamp)
+        self._endCache = None
+        # tuple: (end date, end time, end day)
+
     @property
     def sectionContent(self):
+        if self._structuredContent is not None:
+            return self._structuredContent.to_xml()
+
         return self._sectionContent
 
     @sectionContent.setter
     def sectionContent(self, text):
-        """Set sectionContent updating the word count."""
+        """Set sectionContent updating the derived data."""
         if text is not None:
             assert type(text) is str
-        if self._sectionContent != text:
+        if self.sectionContent != text:
             self._sectionContent = text
-            if text is not None:
-                self.wordCount = self.wordCounter.get_word_count(text)
-                self._hasComment = '<comment>' in self._sectionContent
-            else:
-                self.wordCount = 0
-                self._hasComment = False
+            self._structuredContent = None
+            self._update_content_data()
+            self._update_table()
             self.on_element_change()
 
+    @property
+    def structuredContent(self):
+        # StructuredContent instance, parsed from sectionContent once
+        if self._structuredContent is None:
+            self._structuredContent = StructuredContent(
+                self._sectionContent,
+                self.wordCounter,
+            )
+        return self._structuredContent
+
     @property
     def hasComment(self):
         # True if the contents include at least one comment
@@ -119,6 +184,7 @@ class Section(BasicElementTags):
             assert type(newVal) is int
         if self._scType != newVal:
             self._scType = newVal
+            self._update_table()
             self.on_element_change()
 
     @property
@@ -135,6 +201,7 @@ class Section(BasicElementTags):
             assert type(newVal) is int
         if self._scene != newVal:
             self._scene = newVal
+            self._update_table()
             self.on_element_change()
 
     @property
@@ -152,6 +219,7 @@ class Section(BasicElementTags):
             assert type(newVal) is int
         if self._status != newVal:
             self._status = newVal
+            self._update_table()
             self.on_element_change()
 
     @property
@@ -222,7 +290,7 @@ class Section(BasicElementTags):
                 if val is not None:
                     assert type(val) is str
         if self._plotlineNotes != newVal:
-            self._plotlineNotes = newVal
+            self._plotlineNotes = self._compact_dict(newVal)
             self.on_element_change()
 
     @property
@@ -236,34 +304,40 @@ class Section(BasicElementTags):
             assert type(newVal) is str
         if self._date != newVal:
             if not newVal:
-                self._date = None
-                self._weekDay = None
-                self._localeDate = None
-                self.on_element_change()
-                return
-
-            try:
-                self._weekDay = PyCalendar.weekday(newVal)
-            except:
-                return
-                # date and week day remain unchanged
+                newVal = None
+            else:
+                try:
+                    PyCalendar.verified_date(newVal)
+                except:
+                    return
+                    # date remains unchanged
 
-            try:
-                self._localeDate = PyCalendar.locale_date(newVal)
-            except:
-                self._localeDate = newVal
             self._date = newVal
+            self._dateCache = None
+            self._update_timeline()
             self.on_element_change()
 
     @property
     def weekDay(self):
         # the number of the day ot the week
-        return self._weekDay
+        return self._get_date_cache()[0]
 
     @property
     def localeDate(self):
         # the preferred date representation for the current locale
-        return self._localeDate
+        return self._get_date_cache()[1]
+
+    @property
+    def durationMinutes(self):
+        # total duration in minutes; None if invalid
+        if self._durationCache is None:
+            try:
+                self._durationCache = (
+                    PyCalendar.get_duration_seconds(self) // 60,
+                )
+            except (ValueError, OverflowError):
+                self._durationCache = (None,)
+        return self._durationCache[0]
 
     @property
     def time(self):
@@ -276,6 +350,7 @@ class Section(BasicElementTags):
             assert type(newVal) is str
         if self._time != newVal:
             self._time = newVal
+            self._update_timeline()
             self.on_element_change()
 
     @property
@@ -288,6 +363,7 @@ class Section(BasicElementTags):
             assert type(newVal) is str
         if self._day != newVal:
             self._day = newVal
+            self._update_timeline()
             self.on_element_change()
 
     @property
@@ -300,6 +376,8 @@ class Section(BasicElementTags):
             assert type(newVal) is str
         if self._lastsMinutes != newVal:
             self._lastsMinutes = newVal
+            self._durationCache = None
+            self._update_timeline()
             self.on_element_change()
 
     @property
@@ -312,6 +390,8 @@ class Section(BasicElementTags):
             assert type(newVal) is str
         if self._lastsHours != newVal:
             self._lastsHours = newVal
+            self._durationCache = None
+            self._update_timeline()
             self.on_element_change()
 
     @property
@@ -324,6 +404,8 @@ class Section(BasicElementTags):
             assert type(newVal) is str
         if self._lastsDays != newVal:
             self._lastsDays = newVal
+            self._durationCache = None
+            self._update_timeline()
             self.on_element_change()
 
     @property
@@ -335,14 +417,15 @@ class Section(BasicElementTags):
         if newVal is not None:
             assert type(newVal) is str
         if self._viewpoint != newVal:
-            self._viewpoint = newVal
+            self._viewpoint = self._interned(newVal)
+            self._update_table()
             self.on_element_change()
 
     @property
     def characters(self):
         # list of character IDs
         try:
-            return self._characters[:]
+            return list(self._characters)
         except TypeError:
             return None
 
@@ -352,6 +435,7 @@ class Section(BasicElementTags):
             for elem in newVal:
                 if elem is not None:
                     assert type(elem) is str
+        newVal = self._compact_list(newVal)
         if self._characters != newVal:
             self._characters = newVal
             self.on_element_change()
@@ -360,7 +444,7 @@ class Section(BasicElementTags):
     def locations(self):
         # List of location IDs
         try:
-            return self._locations[:]
+            return list(self._locations)
         except TypeError:
             return None
 
@@ -370,6 +454,7 @@ class Section(BasicElementTags):
             for elem in newVal:
                 if elem is not None:
                     assert type(elem) is str
+        newVal = self._compact_list(newVal)
         if self._locations != newVal:
             self._locations = newVal
             self.on_element_change()
@@ -378,7 +463,7 @@ class Section(BasicElementTags):
     def items(self):
         # List of Item IDs
         try:
-            return self._items[:]
+            return list(self._items)
         except TypeError:
             return None
 
@@ -388,6 +473,7 @@ class Section(BasicElementTags):
             for elem in newVal:
                 if elem is not None:
                     assert type(elem) is str
+        newVal = self._compact_list(newVal)
         if self._items != newVal:
             self._items = newVal
             self.on_element_change()
@@ -406,6 +492,7 @@ class Section(BasicElementTags):
         try:
             self.date = PyCalendar.specific_date(self._day, referenceDate)
             self._day = None
+            self._update_timeline()
             return True
 
         except:
@@ -430,13 +517,36 @@ class Section(BasicElementTags):
 
         except:
             self._day = None
+            self._update_timeline()
             return False
 
+    def replace_paragraphs(self, start, end, xmlStrings):
+        """Replace paragraphs of the content, updating the derived data.
+        
+        Positional arguments:
+            start: int -- index of the first paragraph to replace.
+            end: int -- index after the last paragraph to replace.
+            xmlStrings: list of XML strings of the new paragraphs.
+
+        See StructuredContent.replace().
+        The sectionContent string is assembled on the next access.
+        """
+        content = self.structuredContent
+        if not content.replace(start, end, xmlStrings):
+            return
+
+        self._update_content_data()
+        self._update_table()
+        self.on_element_change()
+
     def get_end_date_time(self):
         """Return the end (date, time, day) tuple 
         
         calculated from start and duration.
         """
+        if self._endCache is not None:
+            return self._endCache
+
         endDate = None
         endTime = None
         endDay = None
@@ -452,6 +562,75 @@ class Section(BasicElementTags):
                 except:
                     pass
             else:
-                endTime = PyCalendar.get_end_time(self)
-        return endDate, endTime, endDay
+                try:
+                    endTime = PyCalendar.get_end_time(self)
+                except:
+                    pass
+        self._endCache = (endDate, endTime, endDay)
+        return self._endCache
+
+    def get_timestamp(self, referenceDate):
+        """Return the start timestamp in seconds, or None if not set.
+        
+        Positional argument:
+            referenceDate: str -- reference date in isoformat
+                                  for sections with a day.
 
+        See PyCalendar.get_timestamp().
+        """
+        if (
+            self._startCache is None
+            or self._startCache[0] != referenceDate
+        ):
+            self._startCache = (
+                referenceDate,
+                PyCalendar.get_timestamp(self, referenceDate),
+            )
+        return self._startCache[1]
+
+    def _get_date_cache(self):
+        # Return the (week day, locale date) tuple of the date.
+        if self._dateCache is None:
+            if self._date:
+                weekDay = PyCalendar.weekday(self._date)
+                try:
+                    localeDate = PyCalendar.locale_date(self._date)
+                except:
+                    localeDate = self._date
+            else:
+                weekDay = None
+                localeDate = None
+            self._dateCache = (weekDay, localeDate)
+        return self._dateCache
+
+    def _set_languages(self, languages):
+        # Set the language codes used in the content
+        # and notify the registry, if changed.
+        languages = tuple(languages) or EMPTY_LIST
+        if languages != self.languages:
+            if self.languageRegistry is not None:
+                self.languageRegistry.replace(self.languages, languages)
+            self.languages = languages
+
+    def _update_content_data(self):
+        # Set the word count, the comment flag, and the language codes
+        # from the structured content.
+        content = self.structuredContent
+        self.wordCount = content.wordCount
+        self._hasComment = content.hasComment
+        self._set_languages(content.languages)
+
+    def _update_table(self):
+        # Notify the section table of a change of metadata.
+        if self.sectionTable is not None:
+            self.sectionTable.update(self)
+
+    def _update_timeline(self):
+        # Discard the derived start and end,
+        # and notify the timeline index and the section table
+        # of a change of date, time, or duration.
+        self._startCache = None
+        self._endCache = None
+        if self.timelineIndex is not None:
+            self.timelineIndex.update(self)
+        self._update_table()
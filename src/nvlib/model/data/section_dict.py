@@ -0,0 +1,70 @@
+"""Provide a dictionary class for the sections of a novel.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.element_dict import ElementDict
+
+
+class SectionDict(ElementDict):
+    """Dictionary of sections, keeping the novel's indexes up to date.
+    
+    key = section ID, value = Section instance.
+    """
+
+    def __init__(self, languageRegistry, timelineIndex, sectionTable):
+        """Positional arguments:
+            languageRegistry: LanguageRegistry -- the novel's registry.
+            timelineIndex: TimelineIndex -- the novel's timeline.
+            sectionTable: SectionTable -- the novel's section metadata.
+
+        Extends the superclass constructor.
+        """
+        super().__init__()
+        self.languageRegistry = languageRegistry
+        self.timelineIndex = timelineIndex
+        self.sectionTable = sectionTable
+
+    def __reduce__(self):
+        # Pickle support: Pass the indexes to the constructor
+        # before the items are set.
+        return (
+            self.__class__,
+            (self.languageRegistry, self.timelineIndex, self.sectionTable),
+            None,
+            None,
+            iter(self.items()),
+        )
+
+    def _attach(self, scId, section):
+        # Register the section's title, languages, timing, and metadata.
+        super()._attach(scId, section)
+        # If the section is registered elsewhere, e.g. in another novel,
+        # unregister it there first.
+        if section.languageRegistry is not None:
+            section.languageRegistry.remove(section.languages)
+        section.languageRegistry = self.languageRegistry
+        self.languageRegistry.add(section.languages)
+        if section.timelineIndex is not None:
+            section.timelineIndex.remove(section)
+        section.timelineIndex = self.timelineIndex
+        self.timelineIndex.add(scId, section)
+        if section.sectionTable is not None:
+            section.sectionTable.remove(section)
+        section.sectionTable = self.sectionTable
+        self.sectionTable.add(scId, section)
+
+    def _detach(self, section):
+        # Unregister the section's title, languages, timing, and metadata,
+        # unless it has been registered elsewhere in the meantime.
+        super()._detach(section)
+        if section.languageRegistry is self.languageRegistry:
+            self.languageRegistry.remove(section.languages)
+            section.languageRegistry = None
+        if section.timelineIndex is self.timelineIndex:
+            self.timelineIndex.remove(section)
+            section.timelineIndex = None
+        if section.sectionTable is self.sectionTable:
+            self.sectionTable.remove(section)
+            section.sectionTable = None
@@ -0,0 +1,366 @@
+"""Provide a class for a columnar table of section metadata.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from array import array
+from itertools import accumulate
+
+from nvlib.model.data.py_calendar import PyCalendar
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SectionTable:
+    """Columnar mirror of the section metadata, for analytics.
+
+    Each column is an array with one row per section:
+    type, scene kind, status, word count, viewpoint, start timestamp,
+    and duration in minutes. Missing values are stored as -1.
+    The viewpoint column holds indexes into a list of character IDs.
+
+    The sections update the table when their metadata changes.
+    The novel updates the table when the reference date changes.
+
+    The queries run as vectorized NumPy operations on the arrays,
+    if NumPy is installed. Otherwise, they iterate over the arrays.
+    """
+    NONE = -1
+
+    def __init__(self, referenceDate=None):
+        """Optional arguments:
+            referenceDate: str -- reference date in isoformat.
+        """
+        self._referenceDate = referenceDate or PyCalendar.min
+        self._scIds = []
+        # section IDs in the order of the rows
+        self._sections = []
+        # Section instances in the order of the rows
+        self._rows = {}
+        # key: Section instance, value: row index
+        self._rowsById = {}
+        # key: section ID, value: row index
+        self._scTypes = array('l')
+        self._scenes = array('l')
+        self._statuses = array('l')
+        self._wordCounts = array('q')
+        self._viewpoints = array('l')
+        self._starts = array('q')
+        self._durations = array('q')
+        self._viewpointIds = []
+        # character IDs referred to by the viewpoint column
+        self._viewpointCodes = {}
+        # key: character ID, value: index in _viewpointIds
+
+    def __len__(self):
+        return len(self._scIds)
+
+    def add(self, scId, section):
+        """Add a section to the table.
+
+        Positional arguments:
+            scId: str -- section ID.
+            section: Section instance.
+        """
+        row = len(self._scIds)
+        self._scIds.append(scId)
+        self._sections.append(section)
+        self._rows[section] = row
+        self._rowsById[scId] = row
+        for column in self._get_columns():
+            column.append(self.NONE)
+        self._set_row(row, section)
+
+    def get_cumulative_word_counts(self, scIds, scType=0):
+        """Return a list of the running word count totals.
+
+        Positional arguments:
+            scIds: list of section IDs in the order of counting.
+
+        Optional arguments:
+            scType: int -- type of the sections to count.
+
+        Sections of other types are listed with the preceding total.
+        """
+        rows = self._get_rows(scIds)
+        if np is not None and rows:
+            rows = np.array(rows)
+            wordCounts = self._view(self._wordCounts)[rows]
+            wordCounts[self._view(self._scTypes)[rows] != scType] = 0
+            return np.cumsum(wordCounts).tolist()
+
+        return list(accumulate(
+            self._wordCounts[row] if self._scTypes[row] == scType else 0
+            for row in rows
+        ))
+
+    def get_plot_line_counts(self, plotLines, scType=0):
+        """Return a dictionary with the totals per plot line.
+
+        Positional arguments:
+            plotLines: dict -- key: plot line ID, value: PlotLine instance.
+
+        Optional arguments:
+            scType: int -- type of the sections to count.
+
+        key: plot line ID, value: (number of sections, number of words)
+        """
+        counts = {}
+        for plId in plotLines:
+            rows = self._get_rows(plotLines[plId].sections)
+            if np is not None and rows:
+                rows = np.array(rows)
+                selected = self._view(self._scTypes)[rows] == scType
+                counts[plId] = (
+                    int(np.count_nonzero(selected)),
+                    int(self._view(self._wordCounts)[rows][selected].sum()),
+                )
+                continue
+
+            sectionCount = 0
+            wordCount = 0
+            for row in rows:
+                if self._scTypes[row] == scType:
+                    sectionCount += 1
+                    wordCount += self._wordCounts[row]
+            counts[plId] = (sectionCount, wordCount)
+        return counts
+
+    def get_sections_by_time(self, scIds=None):
+        """Return a list of section IDs, sorted by narrative time.
+
+        Optional arguments:
+            scIds: list of section IDs to sort; None: all sections.
+
+        Sections without date, day, and time are omitted.
+        Sections with the same start keep their relative order.
+        """
+        if scIds is None:
+            rows = list(range(len(self._scIds)))
+        else:
+            rows = self._get_rows(scIds)
+        if np is not None and rows:
+            rows = np.array(rows)
+            starts = self._view(self._starts)[rows]
+            rows = rows[starts != self.NONE]
+            starts = starts[starts != self.NONE]
+            rows = rows[np.argsort(starts, kind='stable')].tolist()
+        else:
+            rows = sorted(
+                (row for row in rows if self._starts[row] != self.NONE),
+                key=self._starts.__getitem__,
+            )
+        return [self._scIds[row] for row in rows]
+
+    def get_status_counts(self, scType=0):
+        """Return a list with word count totals per section status.
+
+        Optional arguments:
+            scType: int -- type of the sections to count.
+
+        Position 0 -- None
+        Positions 1 to 5 -- Total number of words per status.
+        """
+        counts = [None, 0, 0, 0, 0, 0]
+        if np is not None and self._scIds:
+            statuses = self._view(self._statuses)
+            selected = (
+                (self._view(self._scTypes) == scType)
+                & (statuses >= 1)
+                & (statuses <= 5)
+            )
+            totals = np.bincount(
+                statuses[selected],
+                weights=self._view(self._wordCounts)[selected],
+                minlength=6,
+            )
+            for status in range(1, 6):
+                counts[status] = int(totals[status])
+            return counts
+
+        for sectionType, status, wordCount in zip(
+            self._scTypes,
+            self._statuses,
+            self._wordCounts,
+        ):
+            if sectionType == scType and 1 <= status <= 5:
+                counts[status] += wordCount
+        return counts
+
+    def get_totals(self, scIds=None, scType=0):
+        """Return a (number of sections, number of words) tuple.
+
+        Optional arguments:
+            scIds: list of section IDs to count; None: all sections.
+            scType: int -- type of the sections to count.
+        """
+        if scIds is None:
+            rows = list(range(len(self._scIds)))
+        else:
+            rows = self._get_rows(scIds)
+        if np is not None and rows:
+            rows = np.array(rows)
+            selected = self._view(self._scTypes)[rows] == scType
+            return (
+                int(np.count_nonzero(selected)),
+                int(self._view(self._wordCounts)[rows][selected].sum()),
+            )
+
+        sectionCount = 0
+        wordCount = 0
+        for row in rows:
+            if self._scTypes[row] == scType:
+                sectionCount += 1
+                wordCount += self._wordCounts[row]
+        return sectionCount, wordCount
+
+    def get_viewpoint_counts(self, scType=0):
+        """Return a dictionary with the totals per viewpoint character.
+
+        Optional arguments:
+            scType: int -- type of the sections to count.
+
+        key: character ID, value: (number of sections, number of words)
+        """
+        counts = {}
+        if np is not None and self._scIds:
+            viewpoints = self._view(self._viewpoints)
+            selected = (
+                (self._view(self._scTypes) == scType)
+                & (viewpoints != self.NONE)
+            )
+            sectionCounts = np.bincount(
+                viewpoints[selected],
+                minlength=len(self._viewpointIds),
+            )
+            wordCounts = np.bincount(
+                viewpoints[selected],
+                weights=self._view(self._wordCounts)[selected],
+                minlength=len(self._viewpointIds),
+            )
+            for code in np.flatnonzero(sectionCounts).tolist():
+                counts[self._viewpointIds[code]] = (
+                    int(sectionCounts[code]),
+                    int(wordCounts[code]),
+                )
+            return counts
+
+        for sectionType, viewpoint, wordCount in zip(
+            self._scTypes,
+            self._viewpoints,
+            self._wordCounts,
+        ):
+            if sectionType == scType and viewpoint != self.NONE:
+                crId = self._viewpointIds[viewpoint]
+                sectionCount, total = counts.get(crId, (0, 0))
+                counts[crId] = (sectionCount + 1, total + wordCount)
+        return counts
+
+    def remove(self, section):
+        """Remove a section from the table.
+
+        Positional arguments:
+            section: Section instance.
+
+        The last row is moved into the gap.
+        """
+        row = self._rows.pop(section, None)
+        if row is None:
+            return
+
+        del self._rowsById[self._scIds[row]]
+        last = len(self._scIds) - 1
+        if row != last:
+            self._scIds[row] = self._scIds[last]
+            self._sections[row] = self._sections[last]
+            self._rowsById[self._scIds[row]] = row
+            self._rows[self._sections[row]] = row
+            for column in self._get_columns():
+                column[row] = column[last]
+        del self._scIds[last]
+        del self._sections[last]
+        for column in self._get_columns():
+            del column[last]
+
+    def set_reference_date(self, referenceDate):
+        """Update the start of the sections with a day.
+
+        Positional arguments:
+            referenceDate: str -- reference date in isoformat.
+        """
+        referenceDate = referenceDate or PyCalendar.min
+        if referenceDate == self._referenceDate:
+            return
+
+        self._referenceDate = referenceDate
+        for section, row in self._rows.items():
+            if not section.date:
+                self._set_row(row, section)
+
+    def update(self, section):
+        """Update the table after a section's metadata has changed.
+
+        Positional arguments:
+            section: Section instance.
+        """
+        row = self._rows.get(section, None)
+        if row is not None:
+            self._set_row(row, section)
+
+    def _get_columns(self):
+        # Return a tuple of the column arrays.
+        return (
+            self._scTypes,
+            self._scenes,
+            self._statuses,
+            self._wordCounts,
+            self._viewpoints,
+            self._starts,
+            self._durations,
+        )
+
+    def _get_rows(self, scIds):
+        # Return a list of the rows of the sections in the table.
+        rows = []
+        for scId in scIds:
+            row = self._rowsById.get(scId, None)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def _get_viewpoint_code(self, crId):
+        # Return the index of the viewpoint character's ID.
+        if crId is None:
+            return self.NONE
+
+        code = self._viewpointCodes.get(crId, None)
+        if code is None:
+            code = len(self._viewpointIds)
+            self._viewpointIds.append(crId)
+            self._viewpointCodes[crId] = code
+        return code
+
+    def _set_row(self, row, section):
+        # Copy the section's metadata to the columns.
+        for column, value in (
+            (self._scTypes, section.scType),
+            (self._scenes, section.scene),
+            (self._statuses, section.status),
+            (self._wordCounts, section.wordCount),
+            (self._starts, section.get_timestamp(self._referenceDate)),
+            (self._durations, section.durationMinutes),
+        ):
+            if value is None:
+                value = self.NONE
+            column[row] = value
+        self._viewpoints[row] = self._get_viewpoint_code(section.viewpoint)
+
+    def _view(self, column):
+        # Return a NumPy array sharing the column's memory.
+        # The view must not be kept, because the column can't
+        # be resized while it is exported.
+        return np.frombuffer(column, dtype=column.typecode)
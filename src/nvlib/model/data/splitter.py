@@ -5,9 +5,10 @@ For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 from abc import ABC, abstractmethod
+import re
 
 from nvlib.model.data.chapter import Chapter
-from nvlib.model.data.id_generator import new_id
+from nvlib.model.data.id_generator import new_ids
 from nvlib.model.data.section import Section
 from nvlib.novx_globals import CHAPTER_PREFIX
 from nvlib.novx_globals import CH_ROOT
@@ -42,6 +43,8 @@ class Splitter(ABC):
     DESC_SEPARATOR = '|'
     _CLIP_TITLE = 20
     # Maximum length of newly generated section titles.
+    _DIVIDER = re.compile(r'#{1,4}')
+    # Separator at the beginning of a line; matches the separators above.
 
     def create_chapter(
         self,
@@ -119,19 +122,27 @@ class Splitter(ABC):
         
         Return True if the sructure has changed, 
         otherwise return False.        
+        
+        The sections are scanned in a single pass. The new chapter
+        and section structure is built up in a list, and applied to
+        the tree at the end.
         """
+        sectionIds = new_ids(novel.sections, prefix=SECTION_PREFIX)
+        chapterIds = new_ids(novel.chapters, prefix=CHAPTER_PREFIX)
+        structure = []
+        # list of (chapter ID, list of section IDs) in the new order
+        newChapters = set()
 
         # Process chapters and sections.
         sectionsSplit = False
-        chIndex = 0
         newLines = []
         for scanChId in novel.tree.get_children(CH_ROOT):
-            scList = novel.tree.get_children(scanChId)
-            novel.tree.delete_children(scanChId)
             chId = scanChId
-            for scanScId in scList:
+            chSections = []
+            structure.append((chId, chSections))
+            for scanScId in novel.tree.get_children(scanChId):
                 scId = scanScId
-                novel.tree.append(chId, scId)
+                chSections.append(scId)
                 if not self._contains_heading(novel, scId):
                     continue
 
@@ -142,9 +153,12 @@ class Splitter(ABC):
 
                 # Search section content for dividers.
                 for line in lines:
-                    plainLine = self._stripped_line(line)
-
-                    if '#' in plainLine:
+                    if '#' in line:
+                        plainLine = self._stripped_line(line)
+                        divider = self._get_divider(plainLine)
+                    else:
+                        divider = None
+                    if divider is not None:
                         heading = plainLine.strip('# ').split(
                             self.DESC_SEPARATOR)
                         title = heading[0]
@@ -153,16 +167,16 @@ class Splitter(ABC):
                         else:
                             desc = ''
 
-                    if plainLine.startswith(self.SECTION_SEPARATOR):
+                    if divider in (
+                        self.SECTION_SEPARATOR,
+                        self.APPENDED_SECTION_SEPARATOR,
+                    ):
                         # Split the section.
                         if inSection:
                             self._set_text(novel, scId, newLines)
                         newLines.clear()
                         sectionSplitCount += 1
-                        newScId = new_id(
-                            novel.sections,
-                            prefix=SECTION_PREFIX,
-                        )
+                        newScId = next(sectionIds)
                         self.create_section(
                             novel,
                             newScId,
@@ -170,58 +184,52 @@ class Splitter(ABC):
                             sectionSplitCount,
                             title,
                             desc,
-                            plainLine.startswith(
-                                self.APPENDED_SECTION_SEPARATOR)
+                            divider == self.APPENDED_SECTION_SEPARATOR,
                         )
-                        novel.tree.append(chId, newScId)
+                        chSections.append(newScId)
                         scId = newScId
                         sectionsSplit = True
                         inSection = True
 
-                    elif plainLine.startswith(self.CHAPTER_SEPARATOR):
-                        # Start a new chapter.
-                        if inSection:
-                            self._set_text(novel, scId, newLines)
-                            newLines.clear()
-                            inSection = False
-                        newChId = new_id(
-                            novel.chapters,
-                            prefix=CHAPTER_PREFIX,
-                        )
-                        if not title:
-                            title = _('New Chapter')
-                        self.create_chapter(novel, newChId, title, desc, 2)
-                        chIndex += 1
-                        novel.tree.insert(CH_ROOT, chIndex, newChId)
-                        chId = newChId
-                        sectionsSplit = True
-
-                    elif plainLine.startswith(self.PART_SEPARATOR):
-                        # start a new part.
+                    elif divider is not None:
+                        # Start a new chapter or part.
                         if inSection:
                             self._set_text(novel, scId, newLines)
                             newLines.clear()
                             inSection = False
-                        newChId = new_id(
-                            novel.chapters,
-                            prefix=CHAPTER_PREFIX,
-                        )
-                        if not title:
-                            title = _('New Part')
-                        self.create_chapter(novel, newChId, title, desc, 1)
-                        chIndex += 1
-                        novel.tree.insert(CH_ROOT, chIndex, newChId)
+                        newChId = next(chapterIds)
+                        if divider == self.CHAPTER_SEPARATOR:
+                            if not title:
+                                title = _('New Chapter')
+                            self.create_chapter(
+                                novel,
+                                newChId,
+                                title,
+                                desc,
+                                2,
+                            )
+                            sectionsSplit = True
+                        else:
+                            if not title:
+                                title = _('New Part')
+                            self.create_chapter(
+                                novel,
+                                newChId,
+                                title,
+                                desc,
+                                1,
+                            )
                         chId = newChId
+                        chSections = []
+                        structure.append((chId, chSections))
+                        newChapters.add(chId)
 
                     elif not inSection:
                         # Append a section without heading to
                         # a new chapter or part.
                         newLines.append(line)
                         sectionSplitCount += 1
-                        newScId = new_id(
-                            novel.sections,
-                            prefix=SECTION_PREFIX,
-                        )
+                        newScId = next(sectionIds)
                         self.create_section(
                             novel,
                             newScId,
@@ -231,7 +239,7 @@ class Splitter(ABC):
                             '',
                             False,
                         )
-                        novel.tree.append(chId, newScId)
+                        chSections.append(newScId)
                         scId = newScId
                         sectionsSplit = True
                         inSection = True
@@ -241,7 +249,7 @@ class Splitter(ABC):
 
                 if inSection:
                     self._set_text(novel, scId, newLines)
-            chIndex += 1
+        self._set_structure(novel.tree, structure, newChapters)
         return sectionsSplit
 
     def _contains_heading(self, novel, scId):
@@ -255,5 +263,38 @@ class Splitter(ABC):
     def _set_text(self, novel, scId, newLines):
         pass
 
+    def _get_divider(self, plainLine):
+        # Return the separator the line starts with, or None.
+        match = self._DIVIDER.match(plainLine)
+        if match is None:
+            return None
+
+        return match.group()
+
+    def _set_structure(self, tree, structure, newChapters):
+        # Apply the new chapter and section order to the tree.
+        # Only the chapters with changed children are rebuilt.
+        # structure -- list of (chapter ID, list of section IDs).
+        # newChapters -- set of the IDs of the chapters to be inserted.
+        changedChapters = set()
+        for chId, chSections in structure:
+            if chId in newChapters:
+                changedChapters.add(chId)
+            elif chSections != tree.get_children(chId):
+                tree.delete_children(chId)
+                changedChapters.add(chId)
+        if newChapters:
+            for chId, __ in structure:
+                if chId in newChapters:
+                    tree.append(CH_ROOT, chId)
+            tree.set_children(
+                CH_ROOT,
+                *[chId for chId, __ in structure]
+            )
+        for chId, chSections in structure:
+            if chId in changedChapters:
+                for scId in chSections:
+                    tree.append(chId, scId)
+
     def _stripped_line(self, line):
         return line
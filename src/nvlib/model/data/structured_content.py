@@ -0,0 +1,193 @@
+"""Provide a class for section content structured by paragraphs.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import re
+
+from nvlib.model.data.content_paragraph import ContentParagraph
+from nvlib.model.data.content_paragraph import get_languages
+
+TAG = re.compile(r'\<(/?)([^\s/>!?]+)[^>]*?(/?)\>')
+
+
+class StructuredContent:
+    """Section content as a list of paragraphs.
+
+    The content is split into its top-level elements once,
+    when the paragraphs are first accessed.
+    Paragraphs can be replaced, inserted, or deleted individually,
+    and the derived values are updated paragraph by paragraph.
+    As long as no paragraph is replaced, the derived values
+    are taken from the content string in a single pass.
+    The XML string is assembled only when requested.
+    """
+
+    def __init__(self, xmlStr, wordCounter):
+        """Positional arguments:
+            xmlStr: str -- section content XML.
+            wordCounter -- WordCounter instance.
+        """
+        self._wordCounter = wordCounter
+        self._paragraphs = None
+        # list of ContentParagraph instances; None, if to be split
+        self._xml = xmlStr
+        # the content string; None, if to be assembled
+        self._isModified = False
+        self._wordCount = None
+
+    def __getitem__(self, index):
+        return self._get_paragraphs()[index]
+
+    def __iter__(self):
+        return iter(self._get_paragraphs())
+
+    def __len__(self):
+        return len(self._get_paragraphs())
+
+    @property
+    def hasComment(self):
+        if not self._isModified:
+            return '<comment>' in (self._xml or '')
+
+        for paragraph in self._paragraphs:
+            if paragraph.hasComment:
+                return True
+
+        return False
+
+    @property
+    def languages(self):
+        # tuple of the language codes in order of their first use
+        if not self._isModified:
+            return get_languages(self._xml or '')
+
+        languages = []
+        for paragraph in self._paragraphs:
+            for language in paragraph.languages:
+                if not language in languages:
+                    languages.append(language)
+        return tuple(languages)
+
+    @property
+    def wordCount(self):
+        # total word count; after editing, summed up from the paragraphs
+        if self._wordCount is None:
+            if (
+                not self._isModified
+                or not hasattr(self._wordCounter, 'get_word_count_info')
+            ):
+                # Count the content string in a single pass.
+                # A custom word counter can only count the whole text.
+                self._wordCount = self._wordCounter.get_word_count(
+                    self.to_xml() or ''
+                )
+                return self._wordCount
+
+            wordCount = 0
+            previousTail = None
+            for paragraph in self._paragraphs:
+                count, head, tail = paragraph.wordCountInfo
+                if head is None:
+                    continue
+
+                wordCount += count
+                if previousTail and head:
+                    wordCount -= 1
+                    # the first word continues the preceding last word
+                previousTail = tail
+            self._wordCount = wordCount
+        return self._wordCount
+
+    def replace(self, start, end, xmlStrings):
+        """Replace the paragraphs from start to end.
+
+        Positional arguments:
+            start: int -- index of the first paragraph to replace.
+            end: int -- index after the last paragraph to replace.
+            xmlStrings: list of XML strings of the new paragraphs.
+
+        With start == end, the new paragraphs are inserted.
+        With an empty list, the paragraphs are deleted.
+        Return True if the content has changed.
+        """
+        oldStrings = [
+            paragraph.xml for paragraph in self._get_paragraphs()[start:end]
+        ]
+        if oldStrings == list(xmlStrings):
+            return False
+
+        self._paragraphs[start:end] = [
+            ContentParagraph(xmlStr, self._wordCounter)
+            for xmlStr in xmlStrings
+        ]
+        self._xml = None
+        self._isModified = True
+        self._wordCount = None
+        return True
+
+    def to_xml(self):
+        """Return the content as an XML string.
+        
+        Return None if the content was None and is unchanged.
+        """
+        if self._xml is None and self._isModified:
+            self._xml = ''.join(
+                paragraph.xml for paragraph in self._paragraphs
+            )
+        return self._xml
+
+    def _find_end(self, xmlStr, match):
+        # Return the position after the element opened by match.
+        # If the element contains no element of the same name,
+        # the closing tag is searched directly;
+        # otherwise, the nesting depth is tracked tag by tag.
+        closingTag = f'</{match.group(2)}>'
+        end = xmlStr.find(closingTag, match.end())
+        if end != -1 and xmlStr.find(
+            f'<{match.group(2)}',
+            match.end(),
+            end,
+        ) == -1:
+            return end + len(closingTag)
+
+        depth = 0
+        for tagMatch in TAG.finditer(xmlStr, match.start()):
+            if tagMatch.group(1):
+                depth -= 1
+            elif not tagMatch.group(3):
+                depth += 1
+            if depth == 0:
+                return tagMatch.end()
+
+        return len(xmlStr)
+
+    def _get_paragraphs(self):
+        # Return the list of paragraphs, splitting the content once.
+        if self._paragraphs is None:
+            self._paragraphs = [
+                ContentParagraph(part, self._wordCounter)
+                for part in self._split(self._xml or '')
+            ]
+        return self._paragraphs
+
+    def _split(self, xmlStr):
+        # Return a list of the top-level elements' XML strings.
+        # Text between the elements is kept with the following element.
+        parts = []
+        start = 0
+        while True:
+            match = TAG.search(xmlStr, start)
+            if match is None:
+                break
+
+            if match.group(1) or match.group(3):
+                end = match.end()
+            else:
+                end = self._find_end(xmlStr, match)
+            parts.append(xmlStr[start:end])
+            start = end
+        if start < len(xmlStr):
+            parts.append(xmlStr[start:])
+        return parts
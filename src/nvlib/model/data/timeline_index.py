@@ -0,0 +1,201 @@
+"""Provide a class for a narrative timeline index.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from bisect import bisect_left
+from bisect import bisect_right
+from datetime import datetime
+
+from nvlib.model.data.py_calendar import PyCalendar
+
+
+class TimelineIndex:
+    """Index of the section start and end timestamps.
+
+    Timestamps are total seconds since 0001-01-01 00:00,
+    as returned by PyCalendar.get_timestamp.
+    Sections with a day instead of a specific date refer
+    to the reference date.
+    Sections without date, day, and time are not indexed.
+
+    The sections update the index when their date, time, day,
+    or duration changes. The novel updates the index when
+    the reference date changes.
+    """
+
+    def __init__(self, referenceDate=None):
+        """Optional arguments:
+            referenceDate: str -- reference date in isoformat.
+        """
+        self._referenceDate = referenceDate or PyCalendar.min
+        self._sectionIds = {}
+        # key: Section instance, value: section ID
+        self._spans = {}
+        # key: section ID, value: (start timestamp, end timestamp)
+        self._starts = []
+        # sorted start timestamps
+        self._startIds = []
+        # section IDs in the order of _starts
+        self._unspecificIds = set()
+        # IDs of the sections depending on the reference date
+        self._maxDuration = 0
+        # upper bound of the section durations in seconds
+
+    def add(self, scId, section):
+        """Add a section to the index.
+
+        Positional arguments:
+            scId: str -- section ID.
+            section: Section instance.
+        """
+        self._sectionIds[section] = scId
+        self._index(scId, section)
+
+    def get_gaps(self, minSeconds=1):
+        """Return a list of (end, start) tuples of uncovered periods.
+
+        Optional arguments:
+            minSeconds: int -- minimum length of a gap to be listed.
+
+        A gap is a period between two sections that is not
+        covered by any other section.
+        """
+        gaps = []
+        coveredUntil = None
+        for scId in self._startIds:
+            start, end = self._spans[scId]
+            if (
+                coveredUntil is not None
+                and start - coveredUntil >= minSeconds
+            ):
+                gaps.append((coveredUntil, start))
+            if coveredUntil is None or end > coveredUntil:
+                coveredUntil = end
+        return gaps
+
+    def get_overlaps(self):
+        """Return a list of (scId, scId) tuples of overlapping sections."""
+        overlaps = []
+        active = []
+        # IDs of the sections not yet ended
+        for scId in self._startIds:
+            start, __ = self._spans[scId]
+            active = [
+                activeId for activeId in active
+                if self._spans[activeId][1] > start
+            ]
+            for activeId in active:
+                overlaps.append((activeId, scId))
+            active.append(scId)
+        return overlaps
+
+    def get_section_ids(self):
+        """Return a list of the indexed section IDs, sorted by start."""
+        return self._startIds[:]
+
+    def get_sections_between(self, start, end):
+        """Return a list of the IDs of the sections within a period.
+
+        Positional arguments:
+            start: int -- timestamp of the period's beginning.
+            end: int -- timestamp of the period's end (exclusive).
+
+        A section is listed if it overlaps the period.
+        Sections without duration are listed if they start
+        within the period.
+        The list is sorted by section start.
+        """
+        first = bisect_left(self._starts, start - self._maxDuration)
+        last = bisect_left(self._starts, end)
+        scIds = []
+        for i in range(first, last):
+            scId = self._startIds[i]
+            scStart, scEnd = self._spans[scId]
+            if scEnd > start or scStart >= start:
+                scIds.append(scId)
+        return scIds
+
+    def get_sections_on_day(self, dateIso):
+        """Return a list of the IDs of the sections on a specific day.
+
+        Positional arguments:
+            dateIso: str -- date in isoformat.
+        """
+        start = int(
+            (
+                datetime.fromisoformat(f'{dateIso} 00:00')
+                - datetime.min
+            ).total_seconds()
+        )
+        return self.get_sections_between(start, start + 86400)
+
+    def get_span(self, scId):
+        """Return a (start, end) tuple of timestamps, or None."""
+        return self._spans.get(scId, None)
+
+    def remove(self, section):
+        """Remove a section from the index.
+
+        Positional arguments:
+            section: Section instance.
+        """
+        scId = self._sectionIds.pop(section, None)
+        if scId is not None:
+            self._unindex(scId)
+
+    def set_reference_date(self, referenceDate):
+        """Update the sections that depend on the reference date.
+
+        Positional arguments:
+            referenceDate: str -- reference date in isoformat.
+        """
+        referenceDate = referenceDate or PyCalendar.min
+        if referenceDate == self._referenceDate:
+            return
+
+        self._referenceDate = referenceDate
+        for section in self._sectionIds:
+            scId = self._sectionIds[section]
+            if scId in self._unspecificIds:
+                self._index(scId, section)
+
+    def update(self, section):
+        """Update the index after a section's timing has changed.
+
+        Positional arguments:
+            section: Section instance.
+        """
+        scId = self._sectionIds.get(section, None)
+        if scId is not None:
+            self._index(scId, section)
+
+    def _index(self, scId, section):
+        # Add or replace the section's entries.
+        self._unindex(scId)
+        start = section.get_timestamp(self._referenceDate)
+        if start is None:
+            return
+
+        end = start + (section.durationMinutes or 0) * 60
+        self._spans[scId] = (start, end)
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._startIds.insert(i, scId)
+        if not section.date:
+            self._unspecificIds.add(scId)
+        self._maxDuration = max(self._maxDuration, end - start)
+
+    def _unindex(self, scId):
+        # Remove the section's entries, if any.
+        span = self._spans.pop(scId, None)
+        self._unspecificIds.discard(scId)
+        if span is None:
+            return
+
+        i = bisect_left(self._starts, span[0])
+        while self._startIds[i] != scId:
+            i += 1
+        del self._starts[i]
+        del self._startIds[i]
@@ -0,0 +1,105 @@
+"""Provide a class for looking up elements by title.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from bisect import insort
+
+
+def normalize_title(title):
+    """Return title case-folded and with normalized whitespace."""
+    if not title:
+        return ''
+
+    return ' '.join(title.split()).casefold()
+
+
+class TitleIndex:
+    """Index of the element IDs of an element type by normalized title.
+
+    The elements register themselves when added to the novel,
+    and update their entry when their title changes.
+    More than one ID per title means that the title is ambiguous.
+    """
+
+    def __init__(self):
+        self._idsByTitle = {}
+        # key: normalized title, value: list of (serial number, element ID)
+        # in the order of registration
+        self._entries = {}
+        # key: element, value: (serial number, element ID, normalized title)
+        self._serial = 0
+
+    def add(self, elemId, element):
+        """Register an element.
+
+        Positional arguments:
+            elemId: str -- element ID.
+            element: BasicElement instance.
+        """
+        self._serial += 1
+        self._entries[element] = (
+            self._serial,
+            elemId,
+            normalize_title(element.title),
+        )
+        self._insert(element)
+
+    def get_ids(self, title):
+        """Return a list of the IDs of the elements with the given title.
+
+        Positional arguments:
+            title: str -- title, not necessarily normalized.
+
+        The IDs are listed in the order of registration.
+        """
+        return [
+            elemId for __, elemId in self._idsByTitle.get(
+                normalize_title(title),
+                ()
+            )
+        ]
+
+    def remove(self, element):
+        """Unregister an element.
+
+        Positional arguments:
+            element: BasicElement instance.
+        """
+        if element in self._entries:
+            self._delete(element)
+            del self._entries[element]
+
+    def update(self, element):
+        """Update the registry after an element's title has changed."""
+        if not element in self._entries:
+            return
+
+        serial, elemId, title = self._entries[element]
+        newTitle = normalize_title(element.title)
+        if newTitle == title:
+            return
+
+        self._delete(element)
+        self._entries[element] = (serial, elemId, newTitle)
+        self._insert(element)
+
+    def _delete(self, element):
+        # Remove the element's ID from the title's list.
+        serial, elemId, title = self._entries[element]
+        if not title:
+            return
+
+        ids = self._idsByTitle[title]
+        ids.remove((serial, elemId))
+        if not ids:
+            del self._idsByTitle[title]
+
+    def _insert(self, element):
+        # Add the element's ID to the title's list.
+        serial, elemId, title = self._entries[element]
+        if not title:
+            return
+
+        insort(self._idsByTitle.setdefault(title, []), (serial, elemId))
@@ -0,0 +1,170 @@
+"""Provide a class for the daily word count log.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from collections.abc import MutableMapping
+from datetime import date
+
+
+class WordCountLog(MutableMapping):
+    """Word count log, sorted by date.
+
+    Behaves like a dictionary:
+        key: str -- date (iso formatted)
+        value: tuple -- (word count: int, with unused: int)
+
+    The entries are held in arrays of date ordinals and counts,
+    so the latest entry is accessed in constant time, and date
+    ranges are found by binary search.
+    """
+    GRANULARITIES = ('weekly', 'monthly')
+
+    def __init__(self, entries=None):
+        """Optional arguments:
+            entries -- mapping or iterable of (date, [count, total]) pairs.
+        """
+        self._ordinals = array('l')
+        self._counts = array('l')
+        self._totalCounts = array('l')
+        if entries is not None:
+            self.update(entries)
+
+    def __delitem__(self, dateIso):
+        i = self._find(dateIso)
+        del self._ordinals[i]
+        del self._counts[i]
+        del self._totalCounts[i]
+
+    def __getitem__(self, dateIso):
+        # Return a tuple, because changing a copy would have no effect.
+        i = self._find(dateIso)
+        return (self._counts[i], self._totalCounts[i])
+
+    def __iter__(self):
+        for ordinal in self._ordinals:
+            yield date.fromordinal(ordinal).isoformat()
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __setitem__(self, dateIso, counts):
+        """Add or replace an entry.
+
+        Raise the "ValueError" exception if dateIso is not
+        an iso formatted date.
+        """
+        ordinal = date.fromisoformat(dateIso).toordinal()
+        count, totalCount = counts
+        i = bisect_left(self._ordinals, ordinal)
+        if i < len(self._ordinals) and self._ordinals[i] == ordinal:
+            self._counts[i] = count
+            self._totalCounts[i] = totalCount
+            return
+
+        self._ordinals.insert(i, ordinal)
+        self._counts.insert(i, count)
+        self._totalCounts.insert(i, totalCount)
+
+    def clear(self):
+        """Remove all entries.
+
+        Overrides the superclass method.
+        """
+        del self._ordinals[:]
+        del self._counts[:]
+        del self._totalCounts[:]
+
+    def compact(self, granularity, before):
+        """Keep only the last entry per week or month for old entries.
+
+        Positional arguments:
+            granularity: str -- 'weekly' or 'monthly'.
+            before: str -- iso formatted date; later entries are kept.
+
+        Raise the "ValueError" exception in case of invalid arguments.
+        """
+        if not granularity in self.GRANULARITIES:
+            raise ValueError(f'Unknown granularity: "{granularity}"')
+
+        end = bisect_left(
+            self._ordinals,
+            date.fromisoformat(before).toordinal(),
+        )
+        keep = []
+        # indexes of the old entries to keep
+        for i in range(end):
+            if i + 1 == end or self._get_period(
+                granularity,
+                self._ordinals[i],
+            ) != self._get_period(granularity, self._ordinals[i + 1]):
+                keep.append(i)
+        if len(keep) == end:
+            return
+
+        for values in (self._ordinals, self._counts, self._totalCounts):
+            values[:end] = array('l', (values[i] for i in keep))
+
+    def get_range(self, start=None, end=None):
+        """Return a list of (date, count, total) tuples within a period.
+
+        Optional arguments:
+            start: str -- first date (iso formatted); None: unlimited.
+            end: str -- last date (iso formatted); None: unlimited.
+        """
+        first = 0
+        last = len(self._ordinals)
+        if start is not None:
+            first = bisect_left(
+                self._ordinals,
+                date.fromisoformat(start).toordinal(),
+            )
+        if end is not None:
+            last = bisect_right(
+                self._ordinals,
+                date.fromisoformat(end).toordinal(),
+            )
+        return [
+            (
+                date.fromordinal(self._ordinals[i]).isoformat(),
+                self._counts[i],
+                self._totalCounts[i],
+            )
+            for i in range(first, last)
+        ]
+
+    def latest(self):
+        """Return a (date, count, total) tuple of the latest entry, or None."""
+        if not self._ordinals:
+            return None
+
+        return (
+            date.fromordinal(self._ordinals[-1]).isoformat(),
+            self._counts[-1],
+            self._totalCounts[-1],
+        )
+
+    def _find(self, dateIso):
+        # Return the index of the entry; raise KeyError if not found.
+        try:
+            ordinal = date.fromisoformat(dateIso).toordinal()
+        except (TypeError, ValueError):
+            raise KeyError(dateIso)
+
+        i = bisect_left(self._ordinals, ordinal)
+        if i == len(self._ordinals) or self._ordinals[i] != ordinal:
+            raise KeyError(dateIso)
+
+        return i
+
+    def _get_period(self, granularity, ordinal):
+        # Return a tuple identifying the week or month of the date.
+        day = date.fromordinal(ordinal)
+        if granularity == 'weekly':
+            return day.isocalendar()[:2]
+
+        return (day.year, day.month)
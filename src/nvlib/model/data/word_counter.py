@@ -24,7 +24,32 @@ class WordCounter:
 
     def get_word_count(self, text):
         """Return the total word count of text as an integer."""
+        return len(self._get_countable_text(text).split())
+
+    def get_word_count_info(self, text):
+        """Return a (word count, head, tail) tuple for a part of a text.
+        
+        head: True if the part begins with a word character
+              that continues a word of the preceding part.
+        tail: True if the part ends with a word character
+              that is continued by the following part.
+        head and tail are None if nothing in the part is counted.
+
+        The word count of the whole text is the sum of the word counts
+        of its parts, minus one for each joined pair of tail and head.
+        """
+        text = self._get_countable_text(text)
+        if not text:
+            return 0, None, None
+
+        return (
+            len(text.split()),
+            not text[0].isspace(),
+            not text[-1].isspace(),
+        )
+
+    def _get_countable_text(self, text):
+        # Return text with separators and ignored parts removed.
         text = text.replace('\n', '')
         text = self.SEPARATOR_PATTERN.sub(' ', text)
-        text = self.IGNORE_PATTERN.sub('', text)
-        return len(text.split())
+        return self.IGNORE_PATTERN.sub('', text)
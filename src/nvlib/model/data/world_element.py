@@ -10,6 +10,8 @@ from nvlib.model.data.basic_element_tags import BasicElementTags
 class WorldElement(BasicElementTags):
     """Story world element representation (may be location or item)."""
 
+    __slots__ = ('_aka',)
+
     def __init__(
         self,
         aka=None,
@@ -36,3 +36,14 @@ class Filter:
         is filtered.
         """
         return ''
+
+    def prepare(self, source):
+        """Evaluate the filter criteria before exporting from source.
+        
+        Positional arguments:
+            source -- File instance holding the entities to check.
+        
+        This is a stub to be overridden by subclass methods
+        implementing filters that are evaluated in advance.
+        """
+        pass
@@ -6,10 +6,13 @@ License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 from nvlib.model.exporter.ch_ch_filter import ChChFilter
 from nvlib.model.exporter.ch_pl_filter import ChPlFilter
+from nvlib.model.exporter.ch_query_filter import ChQueryFilter
 from nvlib.model.exporter.ch_vp_filter import ChVpFilter
 from nvlib.model.exporter.sc_pl_filter import ScPlFilter
+from nvlib.model.exporter.sc_query_filter import ScQueryFilter
 from nvlib.model.exporter.sc_vp_filter import ScVpFilter
 from nvlib.model.exporter.filter import Filter
+from nvlib.model.exporter.section_query import SectionQuery
 from nvlib.novx_globals import CHAPTER_PREFIX
 from nvlib.novx_globals import CHARACTER_PREFIX
 from nvlib.novx_globals import PLOT_LINE_PREFIX
@@ -24,7 +27,11 @@ class FilterFactory:
         Positional arguments: 
             filterElementId: str -- ID of the element that serves 
                                     as filter criteria. 
+                             SectionQuery -- compound filter criteria.
         """
+        if isinstance(filterElementId, SectionQuery):
+            return ScQueryFilter(filterElementId)
+
         if filterElementId.startswith(CHARACTER_PREFIX):
             return ScVpFilter(filterElementId)
 
@@ -40,7 +47,11 @@ class FilterFactory:
         Positional arguments: 
             filterElementId: str -- ID of the element that serves 
                                     as filter criteria. 
+                             SectionQuery -- compound filter criteria.
         """
+        if isinstance(filterElementId, SectionQuery):
+            return ChQueryFilter(filterElementId)
+
         if filterElementId.startswith(CHARACTER_PREFIX):
             return ChVpFilter(filterElementId)
 
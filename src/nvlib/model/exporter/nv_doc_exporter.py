@@ -38,6 +38,7 @@ class NvDocExporter(NovxConversion):
                         
         Keyword arguments:
             filter: str -- element ID for filtering chapters and sections.
+                    SectionQuery -- compound filter criteria.
             show: Boolean -- If True, open the exported document 
                              after creation.
             ask: Boolean -- If True, ask before opening 
@@ -45,6 +46,9 @@ class NvDocExporter(NovxConversion):
             overwrite: Boolean -- Overwrite existing files 
                                   without confirmation.
             doNotExport: Boolean -- Open existing, if any. Do not export.
+            skipUpToDate: Boolean -- Do not export, if the existing 
+                                     document was generated from 
+                                     the current project data.
 
         Return a message. 
         """
@@ -57,29 +61,37 @@ class NvDocExporter(NovxConversion):
             suffix=suffix,
         )
 
-        if kwargs.get('doNotExport', False):
-            return self._open_document_if_up_to_date()
-
         # Set the user's custom styles.xml path.
         if os.path.isfile(USER_STYLES_XML):
             self._target.userStylesXml = USER_STYLES_XML
 
+        self._target.sectionFilter = FilterFactory.get_section_filter(
+            filterElementId
+        )
+        self._target.chapterFilter = FilterFactory.get_chapter_filter(
+            filterElementId
+        )
+        self._target.novel = self._source.novel
+
+        if kwargs.get('doNotExport', False):
+            return self._open_document_if_up_to_date()
+
+        if (
+            kwargs.get('skipUpToDate', False)
+            and os.path.isfile(self._target.filePath)
+            and self._has_current_fingerprint()
+        ):
+            return _('{0} is up to date.').format(self._target.DESCRIPTION)
+
         if (
             os.path.isfile(self._target.filePath)
             and not kwargs.get('overwrite', False)
         ):
             targetTimestamp = os.path.getmtime(self._target.filePath)
-            targetIsUpToDate = False
-            try:
-                if  targetTimestamp > self._source.timestamp:
-                    timeStatus = _('Newer than the project file')
-                    targetIsUpToDate = True
-                    defaultChoice = 1
-                else:
-                    timeStatus = _('Older than the project file')
-                    defaultChoice = 0
-            except Exception:
-                timeStatus = ''
+            targetIsUpToDate, timeStatus = self._get_status(targetTimestamp)
+            if targetIsUpToDate:
+                defaultChoice = 1
+            else:
                 defaultChoice = 0
             self._targetFileDate = datetime.fromtimestamp(
                 targetTimestamp).strftime('%c')
@@ -103,13 +115,6 @@ class NvDocExporter(NovxConversion):
                 return self._open_existing_document(targetIsUpToDate)
 
         # Generate a new document. Overwrite the existing document, if any.
-        self._target.sectionFilter = FilterFactory.get_section_filter(
-            filterElementId
-        )
-        self._target.chapterFilter = FilterFactory.get_chapter_filter(
-            filterElementId
-        )
-        self._target.novel = self._source.novel
         self._target.write()
         self._targetFileDate = datetime.now().replace(
             microsecond=0
@@ -132,6 +137,36 @@ class NvDocExporter(NovxConversion):
             self._targetFileDate
         )
 
+    def _get_status(self, targetTimestamp):
+        # Return a tuple: (True if the target is up to date, status text).
+        # Prefer the fingerprint of the exported data to the timestamps,
+        # because saving unrelated project data does not affect the target.
+        if self._has_current_fingerprint():
+            return True, _('Generated from the current project data')
+
+        try:
+            if targetTimestamp > self._source.timestamp:
+                return True, _('Newer than the project file')
+
+            return False, _('Older than the project file')
+
+        except Exception:
+            return False, ''
+
+    def _has_current_fingerprint(self):
+        # Return True if the existing target was generated
+        # from the current project data.
+        try:
+            recordedFingerprint = self._target.read_fingerprint()
+        except AttributeError:
+            # The target does not record a fingerprint.
+            return False
+
+        if recordedFingerprint is None:
+            return False
+
+        return recordedFingerprint == self._target.get_fingerprint()
+
     def _open_existing_document(self, isUpToDate):
         open_document(self._target.filePath)
         if isUpToDate:
@@ -148,7 +183,8 @@ class NvDocExporter(NovxConversion):
     def _open_document_if_up_to_date(self):
         if os.path.isfile(self._target.filePath):
             targetTimestamp = os.path.getmtime(self._target.filePath)
-            if  targetTimestamp > self._source.timestamp:
+            targetIsUpToDate, __ = self._get_status(targetTimestamp)
+            if targetIsUpToDate:
                 self._targetFileDate = datetime.fromtimestamp(
                     targetTimestamp).strftime('%c')
                 return self._open_existing_document(True)
@@ -0,0 +1,56 @@
+"""Provide a "sections by query" filter class.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.exporter.filter import Filter
+from nvlib.nv_locale import _
+
+
+class ScQueryFilter(Filter):
+    """Filter a section by the criteria of a SectionQuery.
+    
+    Strategy class, implementing filtering criteria for 
+    template-based export.
+    The query is evaluated once per export, so each section 
+    is checked by a set lookup.
+    """
+
+    def __init__(self, query):
+        """Positional arguments:
+            query -- SectionQuery instance.
+        """
+        self._query = query
+        self._scIds = None
+
+    def accept(self, source, scId):
+        """Check whether an entity matches the filter criteria.
+        
+        Positional arguments:
+            source -- File instance holding the section to check.
+            scId -- ID of the section to check.       
+        
+        Return True if the section is selected by the query.
+        """
+        if self._scIds is None:
+            self.prepare(source)
+        return scId in self._scIds
+
+    def get_message(self, source):
+        """Return a message 
+        
+        The message is about how the document exported from source 
+        is filtered.
+        """
+        return (
+            f'{_("Sections")}: '
+            f'{self._query.get_description(source.novel)}'
+        )
+
+    def prepare(self, source):
+        """Evaluate the query for the novel of source.
+        
+        Overrides the superclass method.
+        """
+        self._scIds = self._query.get_section_ids(source.novel)
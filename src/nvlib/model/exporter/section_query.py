@@ -0,0 +1,199 @@
+"""Provide a class for selecting sections by compound criteria.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from nvlib.novx_globals import STATUS
+from nvlib.nv_locale import _
+
+
+class SectionQuery:
+    """Selection of sections by criteria.
+
+    Queries are created by the class methods, and combined
+    with the operators "&" (and), "|" (or), and "~" (not), e.g.
+    SectionQuery.by_status(2) & SectionQuery.by_character('cr1')
+    selects the draft sections featuring character cr1.
+
+    A query is evaluated as a whole, returning a set of section IDs.
+    Where the novel has an index for a criterion, it is used.
+    """
+
+    def __init__(self, select, describe):
+        """Positional arguments:
+            select -- function(novel) returning an iterable of section IDs.
+            describe -- function(novel) returning a description string.
+        """
+        self._select = select
+        self._describe = describe
+
+    def __and__(self, other):
+        return SectionQuery(
+            lambda novel: (
+                self.get_section_ids(novel) & other.get_section_ids(novel)
+            ),
+            lambda novel: (
+                f'({self.get_description(novel)} {_("and")} '
+                f'{other.get_description(novel)})'
+            ),
+        )
+
+    def __invert__(self):
+        return SectionQuery(
+            lambda novel: set(novel.sections) - self.get_section_ids(novel),
+            lambda novel: f'{_("not")} {self.get_description(novel)}',
+        )
+
+    def __or__(self, other):
+        return SectionQuery(
+            lambda novel: (
+                self.get_section_ids(novel) | other.get_section_ids(novel)
+            ),
+            lambda novel: (
+                f'({self.get_description(novel)} {_("or")} '
+                f'{other.get_description(novel)})'
+            ),
+        )
+
+    @classmethod
+    def behind_work_phase(cls):
+        """Select the sections with a status below the work phase."""
+
+        def select(novel):
+            if not novel.workPhase:
+                return ()
+
+            return cls._select_by(
+                novel,
+                lambda section: (
+                    section.status or 0
+                ) < novel.workPhase
+            )
+
+        return cls(
+            select,
+            lambda novel: _('Behind the work phase'),
+        )
+
+    @classmethod
+    def by_character(cls, crId):
+        """Select the sections featuring a character."""
+        return cls(
+            lambda novel: cls._select_by(
+                novel,
+                lambda section: crId in section.characters,
+            ),
+            lambda novel: (
+                f'{_("Character")}: "{novel.characters[crId].title}"'
+            ),
+        )
+
+    @classmethod
+    def by_date_range(cls, startIso, endIso):
+        """Select the sections within a period.
+
+        Positional arguments:
+            startIso: str -- first day (iso formatted).
+            endIso: str -- last day (iso formatted).
+        """
+        start = cls._get_timestamp(date.fromisoformat(startIso))
+        end = cls._get_timestamp(
+            date.fromisoformat(endIso) + timedelta(days=1)
+        )
+        return cls(
+            lambda novel: novel.timelineIndex.get_sections_between(
+                start, end
+            ),
+            lambda novel: f'{_("Date")}: {startIso} - {endIso}',
+        )
+
+    @classmethod
+    def by_location(cls, lcId):
+        """Select the sections taking place at a location."""
+        return cls(
+            lambda novel: cls._select_by(
+                novel,
+                lambda section: lcId in section.locations,
+            ),
+            lambda novel: (
+                f'{_("Location")}: "{novel.locations[lcId].title}"'
+            ),
+        )
+
+    @classmethod
+    def by_plot_line(cls, plId):
+        """Select the sections belonging to a plot line."""
+        return cls(
+            lambda novel: novel.plotLines[plId].sections,
+            lambda novel: (
+                f'{_("Plot line")}: "{novel.plotLines[plId].title}"'
+            ),
+        )
+
+    @classmethod
+    def by_status(cls, *statuses):
+        """Select the sections with any of the completion statuses."""
+        return cls(
+            lambda novel: cls._select_by(
+                novel,
+                lambda section: section.status in statuses,
+            ),
+            lambda novel: (
+                f'{_("Status")}: '
+                f'{", ".join(STATUS[status] for status in statuses)}'
+            ),
+        )
+
+    @classmethod
+    def by_tags(cls, *tags):
+        """Select the sections with any of the tags."""
+        return cls(
+            lambda novel: cls._select_by(
+                novel,
+                lambda section: not set(tags).isdisjoint(section.tags),
+            ),
+            lambda novel: f'{_("Tags")}: {", ".join(tags)}',
+        )
+
+    @classmethod
+    def by_viewpoint(cls, crId):
+        """Select the sections from a character's viewpoint."""
+        return cls(
+            lambda novel: cls._select_by(
+                novel,
+                lambda section: section.viewpoint == crId,
+            ),
+            lambda novel: (
+                f'{_("Viewpoint")}: "{novel.characters[crId].title}"'
+            ),
+        )
+
+    def get_description(self, novel):
+        """Return a string describing the query."""
+        return self._describe(novel)
+
+    def get_section_ids(self, novel):
+        """Return a set of the IDs of the sections selected."""
+        return set(self._select(novel))
+
+    @staticmethod
+    def _get_timestamp(day):
+        # Return the total seconds from 0001-01-01 00:00 to the day.
+        return int(
+            (
+                datetime.combine(day, datetime.min.time()) - datetime.min
+            ).total_seconds()
+        )
+
+    @staticmethod
+    def _select_by(novel, condition):
+        # Return the IDs of the sections that meet the condition.
+        return [
+            scId for scId, section in novel.sections.items()
+            if condition(section)
+        ]
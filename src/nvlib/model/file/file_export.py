@@ -7,6 +7,7 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from hashlib import sha256
 import os
 from string import Template
 
@@ -14,6 +15,7 @@ from nvlib.model.data.py_calendar import PyCalendar
 from nvlib.model.data.section import Section
 from nvlib.model.exporter.filter import Filter
 from nvlib.model.file.file import File
+from nvlib.model.novx.novx_file import NovxFile
 from nvlib.novx_globals import CHARACTERS_SUFFIX
 from nvlib.novx_globals import CH_ROOT
 from nvlib.novx_globals import CR_ROOT
@@ -31,6 +33,7 @@ from nvlib.novx_globals import SECTIONS_SUFFIX
 from nvlib.novx_globals import list_to_string
 from nvlib.novx_globals import norm_path
 from nvlib.nv_locale import _
+import xml.etree.ElementTree as ET
 
 
 class FileExport(File):
@@ -90,15 +93,32 @@ class FileExport(File):
         self.itemFilter = Filter()
         self.arcFilter = Filter()
         self.turningPointFilter = Filter()
+        self._templates = {}
+        # key: template string, value: Template instance
+
+    def get_fingerprint(self):
+        """Return a hash of the data that the exported document depends on.
+        
+        The fingerprint is calculated from the project data,
+        the templates, and the filter settings,
+        so the document does not need to be generated.
+        """
+        fingerprint = sha256()
+        for text in self._get_fingerprint_data():
+            fingerprint.update(f'{text}\0'.encode('utf-8'))
+        return fingerprint.hexdigest()
 
     def write(self):
         """Write instance variables to the export file.
         
         Create a template-based output file. 
+        The text is written chapter by chapter as it is generated,
+        so the whole document is never held in memory.
         Return a message in case of success.
         Raise the "RuntimeError" exception in case of error. 
         """
-        text = self._get_text()
+        self._templates.clear()
+        self._prepare_filters()
         backedUp = False
         if os.path.isfile(self.filePath):
             try:
@@ -112,10 +132,19 @@ class FileExport(File):
                 backedUp = True
         try:
             with open(self.filePath, 'w', encoding='utf-8') as f:
-                f.write(text)
-        except:
+                for text in self._get_output_parts():
+                    f.write(text)
+        except Exception as ex:
             if backedUp:
                 os.replace(f'{self.filePath}.bak', self.filePath)
+            else:
+                try:
+                    os.remove(self.filePath)
+                except:
+                    pass
+            if isinstance(ex, RuntimeError):
+                raise
+
             raise RuntimeError(
                 f'{_("Cannot write file")}: '
                 f'"{norm_path(self.filePath)}".'
@@ -179,18 +208,35 @@ class FileExport(File):
         )
         return chapterMapping
 
+    def _get_chapter_parts(self):
+        # Generate the chapters and nested sections.
+        # If a subclass overrides _get_chapters(), use its list;
+        # otherwise, yield the chapters as they are processed.
+        if self._overrides('_get_chapters'):
+            yield from self._get_chapters()
+        else:
+            yield from self._iterate_chapters()
+
     def _get_chapters(self):
         """Process the chapters and nested sections.
         
+        Return a list of strings.
+        This is a template method that can be extended 
+        or overridden by subclasses.
+        """
+        return list(self._iterate_chapters())
+
+    def _iterate_chapters(self):
+        """Generate the chapters and nested sections.
+        
         Iterate through the sorted chapter list and apply the templates, 
         substituting placeholders according to the chapter mapping dictionary.
         For each chapter call the processing of its included sections.
         Skip chapters not accepted by the chapter filter.
-        Return a list of strings.
+        Yield the strings chapter by chapter.
         This is a template method that can be extended 
         or overridden by subclasses.
         """
-        lines = []
         partNumber = 0
         chapterNumber = 0
         sectionNumber = 0
@@ -207,26 +253,24 @@ class FileExport(File):
             if self.novel.chapters[chId].chType == 1:
                 # Chapter is "unused" type.
                 if self._unusedChapterTemplate:
-                    template = Template(self._unusedChapterTemplate)
+                    template = self._get_template(self._unusedChapterTemplate)
             elif (
                 self.novel.chapters[chId].chLevel == 1
                 and self._partTemplate
             ):
-                template = Template(self._partTemplate)
+                template = self._get_template(self._partTemplate)
                 partNumber += 1
                 dispNumber = partNumber
             elif (
                 self.novel.chapters[chId].chLevel == 2
                 and self._chapterTemplate
             ):
-                template = Template(self._chapterTemplate)
+                template = self._get_template(self._chapterTemplate)
                 chapterNumber += 1
                 dispNumber = chapterNumber
             if template is not None:
-                lines.append(
-                    template.safe_substitute(
-                        self._get_chapterMapping(chId, dispNumber)
-                    )
+                yield template.safe_substitute(
+                    self._get_chapterMapping(chId, dispNumber)
                 )
 
             #--- Process sections.
@@ -240,30 +284,29 @@ class FileExport(File):
                 wordsTotal,
                 self.novel.chapters[chId].hasEpigraph,
             )
-            lines.extend(sectionLines)
+            yield from sectionLines
 
             #--- Process chapter ending.
             template = None
             if self.novel.chapters[chId].chType == 1:
                 if self._unusedChapterEndTemplate:
-                    template = Template(self._unusedChapterEndTemplate)
+                    template = self._get_template(
+                        self._unusedChapterEndTemplate
+                    )
             elif (
                 self.novel.chapters[chId].chLevel == 1
                 and self._partEndTemplate
             ):
-                template = Template(self._partEndTemplate)
+                template = self._get_template(self._partEndTemplate)
             elif (
                 self.novel.chapters[chId].chLevel == 2
                 and self._chapterEndTemplate
             ):
-                template = Template(self._chapterEndTemplate)
+                template = self._get_template(self._chapterEndTemplate)
             if template is not None:
-                lines.append(
-                    template.safe_substitute(
-                        self._get_chapterMapping(chId, dispNumber)
-                    )
+                yield template.safe_substitute(
+                    self._get_chapterMapping(chId, dispNumber)
                 )
-        return lines
 
     def _get_characterMapping(self, crId):
         """Return a mapping dictionary for a character section.
@@ -359,7 +402,7 @@ class FileExport(File):
             lines = [self._characterHeadingTemplate]
         else:
             lines = []
-        template = Template(self._characterTemplate)
+        template = self._get_template(self._characterTemplate)
         for crId in self.novel.tree.get_children(CR_ROOT):
             if self.characterFilter.accept(self, crId):
                 lines.append(
@@ -424,7 +467,7 @@ class FileExport(File):
         or overridden by subclasses.
         """
         lines = []
-        template = Template(self._fileFooter)
+        template = self._get_template(self._fileFooter)
         lines.append(template.safe_substitute(self._get_fileFooterMapping()))
         return lines
 
@@ -442,7 +485,7 @@ class FileExport(File):
         or overridden by subclasses.
         """
         lines = []
-        template = Template(self._fileHeader)
+        template = self._get_template(self._fileHeader)
         lines.append(template.safe_substitute(self._get_fileHeaderMapping()))
         return lines
 
@@ -517,6 +560,102 @@ class FileExport(File):
         )
         return fileHeaderMapping
 
+    def _get_fingerprint_data(self):
+        """Generate the strings that the exported document depends on.
+        
+        - The export class and its templates.
+        - The filter settings.
+        - The project data read by the export.
+        This is a template method that can be extended
+        or overridden by subclasses.
+        """
+        exportClass = type(self)
+        yield f'{exportClass.__module__}.{exportClass.__qualname__}'
+        for name in sorted(dir(exportClass)):
+            value = getattr(exportClass, name)
+            if (
+                name.startswith('_')
+                and not name.startswith('__')
+                and isinstance(value, str)
+            ):
+                yield f'{name}={value}'
+
+        expFilters = [
+            self.chapterFilter,
+            self.sectionFilter,
+            self.characterFilter,
+            self.locationFilter,
+            self.itemFilter,
+            self.arcFilter,
+            self.turningPointFilter,
+        ]
+        for expFilter in expFilters:
+            yield type(expFilter).__qualname__
+            yield expFilter.get_message(self)
+            for name, value in sorted(vars(expFilter).items()):
+                if isinstance(value, str):
+                    yield f'{name}={value}'
+
+        yield from self._get_project_fingerprint_data()
+
+    def _get_chapters_fingerprint_data(self):
+        # Generate the novx XML strings of the chapters and sections
+        # accepted by the filters, and the titles of the elements
+        # referenced by the sections.
+        prjFile = NovxFile('')
+        prjFile.novel = self.novel
+        for chId in self.novel.tree.get_children(CH_ROOT):
+            if not self.chapterFilter.accept(self, chId):
+                continue
+
+            yield ET.tostring(
+                prjFile.build_element_xml(chId),
+                encoding='unicode',
+            )
+            for scId in self.novel.tree.get_children(chId):
+                if not self.sectionFilter.accept(self, scId):
+                    continue
+
+                yield ET.tostring(
+                    prjFile.build_element_xml(scId),
+                    encoding='unicode',
+                )
+                section = self.novel.sections[scId]
+                if section.viewpoint:
+                    yield self.novel.characters[section.viewpoint].title
+                for crId in section.characters or []:
+                    yield self.novel.characters[crId].title
+                for lcId in section.locations or []:
+                    yield self.novel.locations[lcId].title
+                for itId in section.items or []:
+                    yield self.novel.items[itId].title
+
+    def _get_elements_fingerprint_data(self, elemIds):
+        # Generate the novx XML strings of the elements with the given IDs.
+        prjFile = NovxFile('')
+        prjFile.novel = self.novel
+        for elemId in elemIds:
+            yield ET.tostring(
+                prjFile.build_element_xml(elemId),
+                encoding='unicode',
+            )
+
+    def _get_novel_fingerprint_data(self):
+        # Generate the strings of the project-wide data.
+        prjFile = NovxFile('')
+        prjFile.novel = self.novel
+        xmlProject = ET.Element('PROJECT')
+        prjFile.novelCnv.export_data(self.novel, xmlProject)
+        yield ET.tostring(xmlProject, encoding='unicode')
+        yield self.projectName
+        yield self.projectPath
+
+    def _get_novx_fingerprint_data(self):
+        # Generate the whole project, serialized as novx XML.
+        prjFile = NovxFile('')
+        prjFile.novel = self.novel
+        yield ET.tostring(prjFile.build_xml_root(), encoding='unicode')
+
     def _get_itemMapping(self, itId):
         """Return a mapping dictionary for an item section.
         
@@ -577,7 +716,7 @@ class FileExport(File):
             lines = [self._itemHeadingTemplate]
         else:
             lines = []
-        template = Template(self._itemTemplate)
+        template = self._get_template(self._itemTemplate)
         for itId in self.novel.tree.get_children(IT_ROOT):
             if self.itemFilter.accept(self, itId):
                 lines.append(
@@ -648,7 +787,7 @@ class FileExport(File):
             lines = [self._locationHeadingTemplate]
         else:
             lines = []
-        template = Template(self._locationTemplate)
+        template = self._get_template(self._locationTemplate)
         for lcId in self.novel.tree.get_children(LC_ROOT):
             if self.locationFilter.accept(self, lcId):
                 lines.append(
@@ -658,6 +797,15 @@ class FileExport(File):
                 )
         return lines
 
+    def _get_output_parts(self):
+        # Generate the strings to be written to the output file.
+        # If a subclass overrides _get_text(), use its string;
+        # otherwise, yield the parts as they are processed.
+        if self._overrides('_get_text'):
+            yield self._get_text()
+        else:
+            yield from self._get_text_parts()
+
     def _get_plotLineMapping(self, plId):
         """Return a mapping dictionary for a plot line.
         
@@ -706,7 +854,7 @@ class FileExport(File):
         for plId in self.novel.tree.get_children(PL_ROOT):
             if self.arcFilter.accept(self, plId):
                 if self._plotLineTemplate:
-                    template = Template(self._plotLineTemplate)
+                    template = self._get_template(self._plotLineTemplate)
                     lines.append(
                         template.safe_substitute(
                             self._get_plotLineMapping(plId)
@@ -716,7 +864,7 @@ class FileExport(File):
             #--- Process plot points.
             for ppId in self.novel.tree.get_children(plId):
                 if self._plotPointTemplate:
-                    template = Template(self._plotPointTemplate)
+                    template = self._get_template(self._plotPointTemplate)
                     plotPointMapping = self._get_plotPointMapping(ppId)
                     lines.append(
                         template.safe_substitute(
@@ -759,7 +907,7 @@ class FileExport(File):
         )
         scId = self.novel.plotPoints[ppId].sectionAssoc
         if scId:
-            template = Template(self._assocSectionTemplate)
+            template = self._get_template(self._assocSectionTemplate)
             plotPointMapping['Section'] = template.safe_substitute(
                 self._get_sectionAssocMapping(scId)
             )
@@ -1044,13 +1192,13 @@ class FileExport(File):
 
             if self.novel.sections[scId].scType == 2:
                 if self._stage1Template:
-                    template = Template(self._stage1Template)
+                    template = self._get_template(self._stage1Template)
                 else:
                     continue
 
             elif self.novel.sections[scId].scType == 3:
                 if self._stage2Template:
-                    template = Template(self._stage2Template)
+                    template = self._get_template(self._stage2Template)
                 else:
                     continue
 
@@ -1061,7 +1209,7 @@ class FileExport(File):
                 # Unused section.
                 isEpigraph = False
                 if self._unusedSectionTemplate:
-                    template = Template(self._unusedSectionTemplate)
+                    template = self._get_template(self._unusedSectionTemplate)
                 else:
                     continue
 
@@ -1074,15 +1222,17 @@ class FileExport(File):
                 sectionNumber += 1
                 dispNumber = sectionNumber
                 wordsTotal += self.novel.sections[scId].wordCount
-                template = Template(self._sectionTemplate)
+                template = self._get_template(self._sectionTemplate)
                 if isEpigraph:
-                    template = Template(self._epigraphTemplate)
+                    template = self._get_template(self._epigraphTemplate)
                 elif firstSectionInChapter:
                     if self._firstSectionTemplate:
-                        template = Template(self._firstSectionTemplate)
+                        template = self._get_template(self._firstSectionTemplate)
                 elif self.novel.sections[scId].appendToPrev:
                     if self._appendedSectionTemplate:
-                        template = Template(self._appendedSectionTemplate)
+                        template = self._get_template(
+                            self._appendedSectionTemplate
+                        )
 
             # Append section divider, if necessary.
             if not (
@@ -1120,6 +1270,80 @@ class FileExport(File):
 
         return lines, sectionNumber, wordsTotal
 
+    def _get_project_fingerprint_data(self):
+        """Generate the strings of the project data read by the export.
+        
+        - The project-wide data, and the file header and footer.
+        - The chapters and sections accepted by the filters,
+          if there are templates for them.
+        - The other elements, if there are templates for them.
+        If a subclass overrides any processing method,
+        generate the whole project, serialized as novx XML.
+        This is a template method that can be extended
+        or overridden by subclasses.
+        """
+        if self._overrides_processing(FileExport):
+            yield from self._get_novx_fingerprint_data()
+            return
+
+        self._prepare_filters()
+        yield from self._get_novel_fingerprint_data()
+        yield from self._get_fileHeader()
+        if any(
+            (
+                self._partTemplate,
+                self._partEndTemplate,
+                self._chapterTemplate,
+                self._chapterEndTemplate,
+                self._unusedChapterTemplate,
+                self._unusedChapterEndTemplate,
+                self._sectionTemplate,
+                self._firstSectionTemplate,
+                self._appendedSectionTemplate,
+                self._unusedSectionTemplate,
+                self._epigraphTemplate,
+                self._stage1Template,
+                self._stage2Template,
+                self._sectionDivider,
+            )
+        ):
+            yield from self._get_chapters_fingerprint_data()
+        if self._characterTemplate:
+            yield from self._get_elements_fingerprint_data(
+                crId for crId in self.novel.tree.get_children(CR_ROOT)
+                if self.characterFilter.accept(self, crId)
+            )
+        if self._locationTemplate:
+            yield from self._get_elements_fingerprint_data(
+                lcId for lcId in self.novel.tree.get_children(LC_ROOT)
+                if self.locationFilter.accept(self, lcId)
+            )
+        if self._itemTemplate:
+            yield from self._get_elements_fingerprint_data(
+                itId for itId in self.novel.tree.get_children(IT_ROOT)
+                if self.itemFilter.accept(self, itId)
+            )
+        plotElementIds = []
+        assocSectionTitles = []
+        for plId in self.novel.tree.get_children(PL_ROOT):
+            if self._plotLineTemplate and self.arcFilter.accept(self, plId):
+                plotElementIds.append(plId)
+            if not self._plotPointTemplate:
+                continue
+
+            for ppId in self.novel.tree.get_children(plId):
+                plotElementIds.append(ppId)
+                scId = self.novel.plotPoints[ppId].sectionAssoc
+                if scId:
+                    assocSectionTitles.append(self.novel.sections[scId].title)
+        yield from self._get_elements_fingerprint_data(plotElementIds)
+        yield from assocSectionTitles
+        if self._projectNoteTemplate:
+            yield from self._get_elements_fingerprint_data(
+                self.novel.tree.get_children(PN_ROOT)
+            )
+        yield from self._get_fileFooter()
+
     def _get_prjNoteMapping(self, pnId):
         """Return a mapping dictionary for a project note.
         
@@ -1157,26 +1381,89 @@ class FileExport(File):
         or overridden by subclasses.
         """
         lines = []
-        template = Template(self._projectNoteTemplate)
+        template = self._get_template(self._projectNoteTemplate)
         for pnId in self.novel.tree.get_children(PN_ROOT):
             pnMap = self._get_prjNoteMapping(pnId)
             lines.append(template.safe_substitute(pnMap))
         return lines
 
+    def _get_template(self, templateStr):
+        """Return a Template instance for templateStr.
+        
+        Each template is compiled only once per export.
+        """
+        try:
+            return self._templates[templateStr]
+
+        except KeyError:
+            template = Template(templateStr)
+            self._templates[templateStr] = template
+            return template
+
     def _get_text(self):
+        """Return a string to be written to the output file.
+        
+        This is a template method that can be extended
+        or overridden by subclasses.
+        """
+        return ''.join(self._get_text_parts())
+
+    def _get_text_parts(self):
         """Call all processing methods.
         
-        Return a string to be written to the output file.
+        Generate the strings to be written to the output file.
+        The chapters and sections are yielded as they are processed. 
         This is a template method that can be extended 
         or overridden by subclasses.
         """
-        lines = self._get_fileHeader()
-        lines.extend(self._get_chapters())
-        lines.extend(self._get_characters())
-        lines.extend(self._get_locations())
-        lines.extend(self._get_items())
-        lines.extend(self._get_plotlines())
-        lines.extend(self._get_projectNotes())
-        lines.extend(self._get_fileFooter())
-        return ''.join(lines)
+        yield from self._get_fileHeader()
+        yield from self._get_chapter_parts()
+        yield from self._get_characters()
+        yield from self._get_locations()
+        yield from self._get_items()
+        yield from self._get_plotlines()
+        yield from self._get_projectNotes()
+        yield from self._get_fileFooter()
+
+    def _overrides(self, methodName):
+        # Return True if a subclass overrides the FileExport method.
+        return (
+            getattr(type(self), methodName)
+            is not getattr(FileExport, methodName)
+        )
+
+    def _overrides_processing(self, baseClass):
+        # Return True if a subclass overrides any method of baseClass
+        # that processes the project data.
+        for methodName in (
+            '_get_text',
+            '_get_text_parts',
+            '_get_chapters',
+            '_iterate_chapters',
+            '_get_sections',
+            '_get_characters',
+            '_get_locations',
+            '_get_items',
+            '_get_plotlines',
+            '_get_projectNotes',
+        ):
+            if (
+                getattr(type(self), methodName)
+                is not getattr(baseClass, methodName)
+            ):
+                return True
+
+        return False
 
+    def _prepare_filters(self):
+        # Let the filters evaluate their criteria once per export.
+        for expFilter in (
+            self.chapterFilter,
+            self.sectionFilter,
+            self.characterFilter,
+            self.locationFilter,
+            self.itemFilter,
+            self.arcFilter,
+            self.turningPointFilter,
+        ):
+            expFilter.prepare(self)
@@ -0,0 +1,103 @@
+"""Provide a class for detecting changes of files on disk.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import sys
+
+from nvlib.model.file.inotify import Inotify
+
+
+class FileWatcher:
+    """Watcher for a set of files.
+
+    A file is considered changed if its modification time or its
+    size differ from the values recorded when it was last checked.
+    On Linux, inotify tells which files may have changed, so only
+    these are checked. Otherwise, all watched files are polled.
+    """
+
+    def __init__(self):
+        self._paths = {}
+        # key: str -- absolute path of a watched file
+        # value: str -- path as given by the caller
+        self._signatures = {}
+        # key: str -- absolute path of a watched file
+        # value: tuple -- (modification time, size), or None
+        self._inotify = None
+        self._useInotify = sys.platform.startswith('linux')
+
+    def add(self, filePath):
+        """Watch a file, assuming its current state as unchanged.
+
+        Positional arguments:
+            filePath: str -- path of the file, which may not exist yet.
+        """
+        absPath = os.path.abspath(filePath)
+        self._paths[absPath] = filePath
+        self._signatures[absPath] = self._get_signature(absPath)
+        if not self._useInotify:
+            return
+
+        try:
+            if self._inotify is None:
+                self._inotify = Inotify()
+            self._inotify.add_directory(os.path.dirname(absPath))
+        except OSError:
+            # falling back to polling
+            self._useInotify = False
+            self._close_inotify()
+
+    def clear(self):
+        """Stop watching all files."""
+        self._paths.clear()
+        self._signatures.clear()
+        self._close_inotify()
+        self._useInotify = sys.platform.startswith('linux')
+
+    def get_changed_files(self):
+        """Return a list of the files changed since last checked.
+
+        The returned paths are the ones passed to the add() method.
+        """
+        candidates = None
+        if self._inotify is not None:
+            candidates = self._inotify.read_events()
+        if candidates is None:
+            candidates = list(self._signatures)
+        changedFiles = []
+        for absPath in candidates:
+            if not absPath in self._signatures:
+                continue
+
+            signature = self._get_signature(absPath)
+            if signature != self._signatures[absPath]:
+                self._signatures[absPath] = signature
+                changedFiles.append(self._paths[absPath])
+        return changedFiles
+
+    def update(self, filePath):
+        """Assume the current state of a watched file as unchanged.
+
+        Positional arguments:
+            filePath: str -- path of the file.
+        """
+        absPath = os.path.abspath(filePath)
+        if absPath in self._signatures:
+            self._signatures[absPath] = self._get_signature(absPath)
+
+    def _close_inotify(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _get_signature(self, absPath):
+        # Return a tuple that changes whenever the file is modified.
+        try:
+            stat = os.stat(absPath)
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,131 @@
+"""Provide a class for Linux inotify based change notification.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import ctypes
+import ctypes.util
+import os
+import struct
+
+
+class Inotify:
+    """Non-blocking inotify instance watching directories.
+
+    The C library is accessed via ctypes.
+    The constructor raises the "OSError" exception
+    if inotify is not available on the system.
+    """
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_MODIFY
+        | IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+    )
+    # events indicating a change of a file's content or existence
+
+    _EVENT_HEADER = struct.Struct('iIII')
+    # wd, mask, cookie, length of the name
+
+    def __init__(self):
+        try:
+            self._libc = ctypes.CDLL(
+                ctypes.util.find_library('c') or 'libc.so.6',
+                use_errno=True,
+            )
+            self._fd = self._libc.inotify_init1(
+                self.IN_NONBLOCK | self.IN_CLOEXEC
+            )
+        except AttributeError:
+            raise OSError('inotify is not supported')
+
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._directories = {}
+        # key: int -- watch descriptor
+        # value: str -- path of the watched directory
+        self._descriptors = {}
+        # key: str -- path of the watched directory
+        # value: int -- watch descriptor
+
+    def add_directory(self, dirPath):
+        """Watch the files in a directory.
+
+        Positional arguments:
+            dirPath: str -- path of the directory to watch.
+
+        Raise the "OSError" exception in case of error.
+        """
+        if dirPath in self._descriptors:
+            return
+
+        wd = self._libc.inotify_add_watch(
+            self._fd,
+            os.fsencode(dirPath),
+            self.WATCH_MASK,
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), dirPath)
+
+        self._directories[wd] = dirPath
+        self._descriptors[dirPath] = wd
+
+    def close(self):
+        """Stop watching and release the inotify instance."""
+        if self._fd < 0:
+            return
+
+        os.close(self._fd)
+        self._fd = -1
+        self._directories.clear()
+        self._descriptors.clear()
+
+    def read_events(self):
+        """Return a set of the paths of the files changed since last read.
+
+        Return None if events were lost, so any file may have changed.
+        Do not block, if no event is pending.
+        """
+        paths = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return paths
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, __, length = self._EVENT_HEADER.unpack_from(
+                    data,
+                    offset,
+                )
+                offset += self._EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & self.IN_Q_OVERFLOW:
+                    paths = None
+                    continue
+
+                dirPath = self._directories.get(wd, None)
+                if dirPath is None or not name or paths is None:
+                    continue
+
+                paths.add(os.path.join(dirPath, os.fsdecode(name)))
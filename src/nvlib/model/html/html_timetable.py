@@ -196,16 +196,14 @@ class HtmlTimetable(HtmlTable):
 
     def _sort_sections_by_date(self):
         # Return a dictionary with lists of section IDs by timestamp.
-        referenceDate = self.novel.referenceDate
-        if not referenceDate:
-            referenceDate = PyCalendar.min
         scIdsByDate = {}
         for scId in self.novel.sections:
             if self.novel.sections[scId].scType == 0:
-                timestamp = PyCalendar.get_timestamp(
-                    self.novel.sections[scId],
-                    referenceDate,
-                )
+                span = self.novel.timelineIndex.get_span(scId)
+                if span is None:
+                    continue
+
+                timestamp = span[0]
                 if timestamp:
                     if not timestamp in scIdsByDate:
                         scIdsByDate[timestamp] = []
@@ -0,0 +1,81 @@
+"""Provide a base class for XML data file readers.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from abc import abstractmethod
+
+from nvlib.model.novx.novx_file import NovxFile
+import xml.etree.ElementTree as ET
+
+
+class DataReader(NovxFile):
+    """Abstract XML data file reader.
+
+    The data file is parsed incrementally, so only the elements
+    to be read are held in memory.
+    """
+    EXTENSION = '.xml'
+    _BRANCH = ''
+    # tag of the data file's root element, e.g. "CHARACTERS"
+    _ELEMENT = ''
+    # tag of the elements to read, e.g. "CHARACTER"
+
+    def read(self, elementIds=None):
+        """Parse the xml file and get the instance variables.
+
+        Optional arguments:
+            elementIds -- collection of the IDs of the elements to read.
+                          If None, read all elements.
+
+        Overrides the superclass method.
+        """
+        root = ET.Element('ROOT')
+        xmlBranch = ET.SubElement(root, self._BRANCH)
+        for xmlElement in self._iter_elements():
+            if elementIds is None or xmlElement.get('id') in elementIds:
+                xmlBranch.append(xmlElement)
+        self._read_elements(root)
+
+    def read_index(self):
+        """Return a dictionary of the element titles by ID.
+
+        Only the IDs and the titles are extracted,
+        so large files can be indexed quickly.
+        """
+        index = {}
+        for xmlElement in self._iter_elements():
+            index[xmlElement.get('id')] = xmlElement.findtext('Title', '')
+            xmlElement.clear()
+        return index
+
+    def _iter_elements(self):
+        # Yield the data elements one by one, while parsing the file.
+        # The elements are removed from their parent, so memory
+        # is only held for the elements kept by the caller.
+        depth = 0
+        parent = None
+        for event, xmlElement in ET.iterparse(
+            self.filePath,
+            events=('start', 'end'),
+        ):
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    parent = xmlElement
+                continue
+
+            depth -= 1
+            if (
+                depth == 1
+                and xmlElement.tag == self._ELEMENT
+                and parent.tag == self._BRANCH
+            ):
+                parent.remove(xmlElement)
+                yield xmlElement
+
+    @abstractmethod
+    def _read_elements(self, root):
+        # Read the elements below root into the novel.
+        pass
@@ -4,23 +4,15 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.data_reader import DataReader
 from nvlib.nv_locale import _
-import xml.etree.ElementTree as ET
 
 
-class LocationDataReader(NovxFile):
+class LocationDataReader(DataReader):
     """XML location data file reader."""
     DESCRIPTION = _('XML location data file')
-    EXTENSION = '.xml'
+    _BRANCH = 'LOCATIONS'
+    _ELEMENT = 'LOCATION'
 
-    def read(self):
-        """Parse the xml files and get the instance variables.
-        
-        Overrides the superclass method.
-        """
-        tree = ET.parse(self.filePath)
-        root = ET.Element('ROOT')
-        root.append(tree.getroot())
+    def _read_elements(self, root):
         self._read_locations(root)
-
@@ -4,15 +4,21 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from copy import copy
+from copy import deepcopy
 from datetime import date
+from datetime import timedelta
 import os
+from sys import intern
 
 from nvlib.model.data.basic_element import BasicElement
 from nvlib.model.data.chapter import Chapter
 from nvlib.model.data.character import Character
+from nvlib.model.data.nv_tree import NvTree
 from nvlib.model.data.plot_line import PlotLine
 from nvlib.model.data.plot_point import PlotPoint
 from nvlib.model.data.section import Section
+from nvlib.model.data.word_count_log import WordCountLog
 from nvlib.model.data.world_element import WorldElement
 from nvlib.model.file.file import File
 from nvlib.model.novx.basic_element_novx import BasicElementNovx
@@ -51,9 +57,13 @@ class NovxFile(File):
 
     Public instance variables:
         xmlTree -- xml element tree of the novelibre project
-        wcLog: dict[str, list[int, int]] -- Daily word count logs.
+        wcLog: WordCountLog -- Daily word count logs.
         wcLogUpdate: dict[str, list[int, int]] -- Word counts missing 
                                                   in the log.
+        wcLogGranularity: str -- 'weekly' or 'monthly' for compacting
+                                 the old log entries when writing;
+                                 None: no compaction.
+        wcLogFullDays: int -- Number of days with the log uncompacted.
         timestamp: float -- Time of last file modification.
 
 
@@ -75,6 +85,16 @@ class NovxFile(File):
 
     fileOpener = NovxOpener
 
+    _elementAttributes = {}
+    # key: element class, value: list of the slot names
+    _INDEX_ATTRIBUTES = (
+        'languageRegistry',
+        'sectionTable',
+        'timelineIndex',
+        'titleIndex',
+    )
+    # references to the model's indexes, not set in element copies
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
 
@@ -89,9 +109,11 @@ class NovxFile(File):
         super().__init__(filePath)
         self.xmlTree = None
 
-        self.wcLog = {}
+        self.wcLog = WordCountLog()
         # key: str -- date (iso formatted)
-        # value: list -- [word count: int, with unused: int]
+        # value: tuple -- (word count: int, with unused: int)
+        self.wcLogGranularity = None
+        self.wcLogFullDays = 365
 
         self.wcLogUpdate = {}
         # key: str -- date (iso formatted)
@@ -124,6 +146,71 @@ class NovxFile(File):
                         self.novel.chapters[chId].chType
                     )
 
+    def build_element_xml(self, elemId):
+        """Return the novx xml element built from a single novel element.
+
+        Positional arguments:
+            elemId: str -- ID of a chapter, section, character, location,
+                           item, plot line, plot point, or project note.
+
+        Child elements, e.g. the sections of a chapter, are not included.
+        """
+        elements, converter, tag = {
+            CHAPTER_PREFIX: (self.novel.chapters, self.chapterCnv, 'CHAPTER'),
+            SECTION_PREFIX: (self.novel.sections, self.sectionCnv, 'SECTION'),
+            CHARACTER_PREFIX: (
+                self.novel.characters,
+                self.characterCnv,
+                'CHARACTER',
+            ),
+            LOCATION_PREFIX: (
+                self.novel.locations,
+                self.worldElementCnv,
+                'LOCATION',
+            ),
+            ITEM_PREFIX: (self.novel.items, self.worldElementCnv, 'ITEM'),
+            PLOT_LINE_PREFIX: (self.novel.plotLines, self.plotLineCnv, 'ARC'),
+            PLOT_POINT_PREFIX: (
+                self.novel.plotPoints,
+                self.plotPointCnv,
+                'POINT',
+            ),
+            PRJ_NOTE_PREFIX: (
+                self.novel.projectNotes,
+                self.basicElementCnv,
+                'PROJECTNOTE',
+            ),
+        }[elemId[:2]]
+        xmlElement = ET.Element(tag, attrib={'id': elemId})
+        converter.export_data(elements[elemId], xmlElement)
+        return xmlElement
+
+    def build_xml_root(self):
+        """Return the novx xml root element built from the novel.
+
+        The xml tree is not indented.
+        """
+        self.novel.get_languages()
+
+        if self.novel.countryCode:
+            countryCode = f'-{self.novel.countryCode}'
+        else:
+            countryCode = ''
+        attrib = {
+            'version': f'{self.MAJOR_VERSION}.{self.MINOR_VERSION}',
+            'xml:lang': f'{self.novel.languageCode}{countryCode}',
+        }
+        xmlRoot = ET.Element('novx', attrib=attrib)
+        self._build_project(xmlRoot)
+        self._build_chapters_and_sections(xmlRoot)
+        self._build_characters(xmlRoot)
+        self._build_locations(xmlRoot)
+        self._build_items(xmlRoot)
+        self._build_plot_lines_and_points(xmlRoot)
+        self._build_project_notes(xmlRoot)
+        self._build_word_count_log(xmlRoot)
+        return xmlRoot
+
     def count_words(self):
         """Return a tuple of word count totals.
 
@@ -181,33 +268,75 @@ class NovxFile(File):
         self._get_timestamp()
         self._keep_word_count()
 
+    def compact_word_count_log(self):
+        """Compact the word count log, if a granularity is set.
+
+        This discards log entries, so call it only before writing
+        the project file, not when building an xml tree for comparison.
+        Raise the "RuntimeError" exception in case of error.
+        """
+        if not self.wcLog or not self.wcLogGranularity:
+            return
+
+        try:
+            self.wcLog.compact(
+                self.wcLogGranularity,
+                (
+                    date.today() - timedelta(days=self.wcLogFullDays)
+                ).isoformat(),
+            )
+        except ValueError as ex:
+            raise RuntimeError(
+                f'{_("Cannot compact the word count log")} ({str(ex)})'
+            )
+
+    def copy_for_writing(self):
+        """Update and compact the word count log, and return a file copy.
+
+        This accesses the novel, so it must run on the thread
+        that owns the model. The copy refers to copies of the
+        elements, the project structure, and the word count log.
+        So it can build and write the xml tree on a worker thread,
+        while the novel is being changed.
+        """
+        self._update_word_count_log()
+        self.compact_word_count_log()
+        self.adjust_section_types()
+        prjFile = copy(self)
+        prjFile.novel = self._copy_novel()
+        prjFile.wcLog = WordCountLog(self.wcLog)
+        prjFile.wcLogUpdate = {}
+        prjFile.xmlTree = None
+        return prjFile
+
+    def prepare_xml_root(self):
+        """Update and compact the word count log, and return the xml root.
+
+        This accesses the novel, so it must run on the thread
+        that owns the model. The xml tree returned is detached
+        from the novel, i.e. a consistent snapshot for writing.
+        """
+        self._update_word_count_log()
+        self.compact_word_count_log()
+        self.adjust_section_types()
+        return self.build_xml_root()
+
     def write(self):
         """Build the xml tree and write the novx file.
 
         Overrides the superclass method.
         """
-        self._update_word_count_log()
-        self.adjust_section_types()
-        self.novel.get_languages()
+        self.write_xml_root(self.prepare_xml_root())
 
-        if self.novel.countryCode:
-            countryCode = f'-{self.novel.countryCode}'
-        else:
-            countryCode = ''
-        attrib = {
-            'version': f'{self.MAJOR_VERSION}.{self.MINOR_VERSION}',
-            'xml:lang': f'{self.novel.languageCode}{countryCode}',
-        }
-        xmlRoot = ET.Element('novx', attrib=attrib)
-        self._build_project(xmlRoot)
-        self._build_chapters_and_sections(xmlRoot)
-        self._build_characters(xmlRoot)
-        self._build_locations(xmlRoot)
-        self._build_items(xmlRoot)
-        self._build_plot_lines_and_points(xmlRoot)
-        self._build_project_notes(xmlRoot)
-        self._build_word_count_log(xmlRoot)
+    def write_xml_root(self, xmlRoot):
+        """Indent the xml tree and write the novx file.
+        
+        Positional arguments:
+            xmlRoot -- xml root element returned by prepare_xml_root().
 
+        The novel is not accessed, so this can run on a worker thread.
+        Raise the "RuntimeError" exception in case of error.
+        """
         indent(xmlRoot)
         # using a custom routine,
         # making sure not to indent inline elements within paragraphs
@@ -311,8 +440,7 @@ class NovxFile(File):
         xmlWcLog = ET.SubElement(root, 'PROGRESS')
         wcLastCount = None
         wcLastTotalCount = None
-        for wc in self.wcLog:
-            wcCount, wcTotalCount = self.wcLog[wc]
+        for wc, wcCount, wcTotalCount in self.wcLog.get_range():
             if self.novel.saveWordCount:
                 # Skip entries with unchanged word count.
                 if (
@@ -332,6 +460,70 @@ class NovxFile(File):
         if not elemId.startswith(elemPrefix):
             raise RuntimeError(f"bad ID: '{elemId}'")
 
+    def _copy_element(self, element):
+        # Return a copy of element that shares no mutable data with it,
+        # and is detached from the model's indexes and callbacks.
+        elementClass = type(element)
+        try:
+            attributes = self._elementAttributes[elementClass]
+        except KeyError:
+            attributes = []
+            for cls in elementClass.__mro__:
+                attributes.extend(getattr(cls, '__slots__', ()))
+            self._elementAttributes[elementClass] = attributes
+        elementCopy = elementClass.__new__(elementClass)
+        for attribute in attributes:
+            try:
+                value = getattr(element, attribute)
+            except AttributeError:
+                continue
+
+            if attribute in self._INDEX_ATTRIBUTES:
+                value = None
+            elif type(value) in (list, dict):
+                value = value.copy()
+            object.__setattr__(elementCopy, attribute, value)
+        if hasattr(element, '__dict__'):
+            elementCopy.__dict__.update(element.__dict__)
+            for attribute in self._INDEX_ATTRIBUTES:
+                if attribute in elementCopy.__dict__:
+                    elementCopy.__dict__[attribute] = None
+        elementCopy.on_element_change = elementCopy.do_nothing
+        # not notifying the model from the worker thread
+        if elementClass is Section:
+            # The content may be edited paragraph by paragraph.
+            elementCopy._sectionContent = element.sectionContent
+            elementCopy._structuredContent = None
+        return elementCopy
+
+    def _copy_novel(self):
+        # Return a copy of the novel with copies of all elements
+        # and a copy of the project structure.
+        novel = self._copy_element(self.novel)
+        novel.languageRegistry = deepcopy(self.novel.languageRegistry)
+        novel.elementsByPrefix = {}
+        for prefix, elements in self.novel.elementsByPrefix.items():
+            novel.elementsByPrefix[prefix] = {
+                elemId: self._copy_element(elements[elemId])
+                for elemId in elements
+            }
+        novel.chapters = novel.elementsByPrefix[CHAPTER_PREFIX]
+        novel.characters = novel.elementsByPrefix[CHARACTER_PREFIX]
+        novel.items = novel.elementsByPrefix[ITEM_PREFIX]
+        novel.locations = novel.elementsByPrefix[LOCATION_PREFIX]
+        novel.plotLines = novel.elementsByPrefix[PLOT_LINE_PREFIX]
+        novel.plotPoints = novel.elementsByPrefix[PLOT_POINT_PREFIX]
+        novel.projectNotes = novel.elementsByPrefix[PRJ_NOTE_PREFIX]
+        novel.sections = novel.elementsByPrefix[SECTION_PREFIX]
+        novel.tree = NvTree()
+        for root in self.novel.tree.get_children(''):
+            for elemId in self.novel.tree.get_children(root):
+                novel.tree.append(root, elemId)
+                if root in (CH_ROOT, PL_ROOT):
+                    for childId in self.novel.tree.get_children(elemId):
+                        novel.tree.append(elemId, childId)
+        return novel
+
     def _get_timestamp(self):
         try:
             self.timestamp = os.path.getmtime(self.filePath)
@@ -345,9 +537,7 @@ class NovxFile(File):
             return
 
         actualCount, actualTotalCount = self.count_words()
-        latestDate = list(self.wcLog)[-1]
-        latestCount = self.wcLog[latestDate][0]
-        latestTotalCount = self.wcLog[latestDate][1]
+        __, latestCount, latestTotalCount = self.wcLog.latest()
         if (
             actualCount != latestCount
             or actualTotalCount != latestTotalCount
@@ -380,14 +570,14 @@ class NovxFile(File):
             return
 
         for xmlChapter in xmlChapters.iterfind('CHAPTER'):
-            chId = xmlChapter.attrib['id']
+            chId = intern(xmlChapter.attrib['id'])
             self._check_id(chId, CHAPTER_PREFIX)
             self.novel.chapters[chId] = Chapter()
             self.chapterCnv.import_data(self.novel.chapters[chId], xmlChapter)
             self.novel.tree.append(CH_ROOT, chId)
 
             for xmlSection in xmlChapter.iterfind('SECTION'):
-                scId = xmlSection.attrib['id']
+                scId = intern(xmlSection.attrib['id'])
                 self._check_id(scId, SECTION_PREFIX)
                 self._read_section(xmlSection, scId)
                 self.novel.tree.append(chId, scId)
@@ -398,7 +588,7 @@ class NovxFile(File):
             return
 
         for xmlCharacter in xmlCharacters.iterfind('CHARACTER'):
-            crId = xmlCharacter.attrib['id']
+            crId = intern(xmlCharacter.attrib['id'])
             self._check_id(crId, CHARACTER_PREFIX)
             self.novel.characters[crId] = Character()
             self.characterCnv.import_data(
@@ -413,7 +603,7 @@ class NovxFile(File):
             return
 
         for xmlItem in xmlItems.iterfind('ITEM'):
-            itId = xmlItem.attrib['id']
+            itId = intern(xmlItem.attrib['id'])
             self._check_id(itId, ITEM_PREFIX)
             self.novel.items[itId] = WorldElement()
             self.worldElementCnv.import_data(self.novel.items[itId], xmlItem)
@@ -425,7 +615,7 @@ class NovxFile(File):
             return
 
         for xmlLocation in xmlLocations.iterfind('LOCATION'):
-            lcId = xmlLocation.attrib['id']
+            lcId = intern(xmlLocation.attrib['id'])
             self._check_id(lcId, LOCATION_PREFIX)
             self.novel.locations[lcId] = WorldElement()
             self.worldElementCnv.import_data(
@@ -440,7 +630,7 @@ class NovxFile(File):
             return
 
         for xmlPlotLine in xmlPlotLines.iterfind('ARC'):
-            plId = xmlPlotLine.attrib['id']
+            plId = intern(xmlPlotLine.attrib['id'])
             self._check_id(plId, PLOT_LINE_PREFIX)
             self.novel.plotLines[plId] = PlotLine()
             self.plotLineCnv.import_data(self.novel.plotLines[plId], xmlPlotLine)
@@ -455,7 +645,7 @@ class NovxFile(File):
                 self.novel.sections[scId].scPlotLines.append(plId)
 
             for xmlPlotPoint in xmlPlotLine.iterfind('POINT'):
-                ppId = xmlPlotPoint.attrib['id']
+                ppId = intern(xmlPlotPoint.attrib['id'])
                 self._check_id(ppId, PLOT_POINT_PREFIX)
                 self._read_plot_point(xmlPlotPoint, ppId, plId)
                 self.novel.tree.append(plId, ppId)
@@ -485,7 +675,7 @@ class NovxFile(File):
             return
 
         for xmlProjectNote in xmlProjectNotes.iterfind('PROJECTNOTE'):
-            pnId = xmlProjectNote.attrib['id']
+            pnId = intern(xmlProjectNote.attrib['id'])
             self._check_id(pnId, PRJ_NOTE_PREFIX)
             self.novel.projectNotes[pnId] = BasicElement()
             self.basicElementCnv.import_data(
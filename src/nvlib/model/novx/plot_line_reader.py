@@ -4,37 +4,28 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.data_reader import DataReader
 from nvlib.nv_locale import _
-import xml.etree.ElementTree as ET
 
 
-class PlotLineReader(NovxFile):
+class PlotLineReader(DataReader):
     """XML iplot line file reader."""
     DESCRIPTION = _('XML plot line file')
-    EXTENSION = '.xml'
+    _BRANCH = 'ARCS'
+    _ELEMENT = 'ARC'
+    _REFERENCES = (
+        'Sections',
+        'Section',
+    )
 
-    def read(self):
-        """Parse the xml files and get the instance variables.
-        
-        Overrides the superclass method.
-        """
-        self._references = [
-            'Sections',
-            'Section',
-        ]
-        tree = ET.parse(self.filePath)
-        root = ET.Element('ROOT')
-        root.append(tree.getroot())
-        xmlPlotLines = root.find('ARCS')
-        if xmlPlotLines is not None:
-            for xmlPlotLine in xmlPlotLines.iterfind('ARC'):
-                self._remove_references(xmlPlotLine)
-                for xmlPlotPoint in xmlPlotLine.iterfind('POINT'):
-                    self._remove_references(xmlPlotPoint)
+    def _read_elements(self, root):
+        for xmlPlotLine in root.find('ARCS').iterfind('ARC'):
+            self._remove_references(xmlPlotLine)
+            for xmlPlotPoint in xmlPlotLine.iterfind('POINT'):
+                self._remove_references(xmlPlotPoint)
         self._read_plot_lines_and_points(root)
 
     def _remove_references(self, xmlElement):
-        for ref in self._references:
+        for ref in self._REFERENCES:
             for xmlRef in xmlElement.findall(ref):
                 xmlElement.remove(xmlRef)
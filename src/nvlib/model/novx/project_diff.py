@@ -0,0 +1,162 @@
+"""Provide a class for an element-level three-way project comparison.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.novx.project_snapshot import ProjectSnapshot
+
+
+class ProjectDiff:
+    """Changes of a project on disk, relative to the project in memory.
+
+    Compare the snapshots of the project in memory ("local") and
+    on disk ("remote") with the snapshot of the project as last
+    read or written ("base").
+    Changes made on one side only are taken from that side.
+    Elements changed differently on both sides are conflicts;
+    the local version is kept.
+
+    Public instance variables:
+        changed: list -- IDs of the elements added or modified on disk.
+        removed: list -- IDs of the elements removed on disk.
+        conflicts: list -- IDs of the elements modified on both sides.
+        structure: dict -- key: parent ID, value: tuple of the merged
+                           child IDs, if different from the local ones.
+        localChanges: bool -- True if the merged project differs
+                              from the project on disk.
+
+    The ID '' refers to the project settings.
+    """
+
+    def __init__(self, base, local, remote):
+        """Compare the snapshots.
+
+        Positional arguments:
+            base -- ProjectSnapshot of the project as last read or written.
+            local -- ProjectSnapshot of the project in memory.
+            remote -- ProjectSnapshot of the project on disk.
+        """
+        self.changed = []
+        self.removed = []
+        self.conflicts = []
+        self.structure = {}
+        self.localChanges = False
+
+        elemIds = dict.fromkeys(remote.digests)
+        elemIds.update(dict.fromkeys(local.digests))
+        elemIds.update(dict.fromkeys(base.digests))
+        # all IDs in a reproducible order
+        for elemId in elemIds:
+            baseDigest = base.digests.get(elemId, None)
+            localDigest = local.digests.get(elemId, None)
+            remoteDigest = remote.digests.get(elemId, None)
+            if remoteDigest == localDigest:
+                continue
+
+            if remoteDigest == baseDigest:
+                self.localChanges = True
+            elif localDigest != baseDigest:
+                self.conflicts.append(elemId)
+                self.localChanges = True
+            elif remoteDigest is None:
+                self.removed.append(elemId)
+            else:
+                self.changed.append(elemId)
+        self._merge_structure(base, local, remote)
+
+    def is_empty(self):
+        """Return True if there is nothing to merge or to report."""
+        return not (
+            self.changed
+            or self.removed
+            or self.conflicts
+            or self.structure
+        )
+
+    def _get_parents(self, base, local, remote, elemIds):
+        # Return a dictionary with the merged parent of each element.
+        baseParents = base.get_parents()
+        localParents = local.get_parents()
+        remoteParents = remote.get_parents()
+        parents = {}
+        for elemId in elemIds:
+            baseParent = baseParents.get(elemId, None)
+            localParent = localParents.get(elemId, None)
+            remoteParent = remoteParents.get(elemId, None)
+            if (
+                remoteParent != baseParent
+                and localParent == baseParent
+                and self._is_present(remoteParent, elemIds)
+            ):
+                parents[elemId] = remoteParent
+            elif localParent is not None:
+                parents[elemId] = localParent
+            else:
+                parents[elemId] = remoteParent
+        return parents
+
+    def _is_present(self, parentId, elemIds):
+        # Return True if the parent is present after merging.
+        return (
+            parentId in elemIds
+            or parentId in ProjectSnapshot.BRANCHES.values()
+        )
+
+    def _merge_structure(self, base, local, remote):
+        # Determine the merged child lists.
+        elemIds = set(local.digests).difference(self.removed)
+        elemIds.update(self.changed)
+        elemIds.discard(ProjectSnapshot.PROJECT_ID)
+        while True:
+            parents = self._get_parents(base, local, remote, elemIds)
+            orphans = [
+                elemId for elemId in elemIds
+                if not self._is_present(parents[elemId], elemIds)
+            ]
+            if not orphans:
+                break
+
+            for elemId in orphans:
+                parentId = parents[elemId]
+                if parentId in elemIds:
+                    continue
+
+                if parentId in self.removed:
+                    # Keep the parent of children kept in memory.
+                    self.removed.remove(parentId)
+                    self.conflicts.append(parentId)
+                    elemIds.add(parentId)
+                else:
+                    # Drop the new child of a parent removed in memory.
+                    self.changed.remove(elemId)
+                    self.conflicts.append(elemId)
+                    elemIds.discard(elemId)
+            self.localChanges = True
+
+        parentIds = dict.fromkeys(remote.structure)
+        parentIds.update(dict.fromkeys(local.structure))
+        for parentId in parentIds:
+            if not self._is_present(parentId, elemIds):
+                continue
+
+            baseChildren = base.structure.get(parentId, None)
+            localChildren = local.structure.get(parentId, None)
+            remoteChildren = remote.structure.get(parentId, None)
+            if localChildren is None or (
+                remoteChildren is not None
+                and localChildren == baseChildren
+            ):
+                order = remoteChildren + (localChildren or ())
+            else:
+                order = localChildren + (remoteChildren or ())
+            children = tuple(
+                dict.fromkeys(
+                    childId for childId in order
+                    if parents.get(childId, None) == parentId
+                )
+            )
+            if children != remoteChildren:
+                self.localChanges = True
+            if children != localChildren:
+                self.structure[parentId] = children
@@ -0,0 +1,314 @@
+"""Provide a class for the three-way merge of novelibre projects.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.basic_element import BasicElement
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.character import Character
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.plot_line import PlotLine
+from nvlib.model.data.plot_point import PlotPoint
+from nvlib.model.data.section import Section
+from nvlib.model.data.world_element import WorldElement
+from nvlib.model.novx.basic_element_novx import BasicElementNovx
+from nvlib.model.novx.chapter_novx import ChapterNovx
+from nvlib.model.novx.character_novx import CharacterNovx
+from nvlib.model.novx.novel_novx import NovelNovx
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.plot_line_novx import PlotLineNovx
+from nvlib.model.novx.plot_point_novx import PlotPointNovx
+from nvlib.model.novx.project_diff import ProjectDiff
+from nvlib.model.novx.project_snapshot import ProjectSnapshot
+from nvlib.model.novx.section_novx import SectionNovx
+from nvlib.model.novx.world_element_novx import WorldElementNovx
+from nvlib.novx_globals import CHAPTER_PREFIX
+from nvlib.novx_globals import CHARACTER_PREFIX
+from nvlib.novx_globals import CR_FIELD_1_DEFAULT
+from nvlib.novx_globals import CR_FIELD_2_DEFAULT
+from nvlib.novx_globals import ITEM_PREFIX
+from nvlib.novx_globals import LOCATION_PREFIX
+from nvlib.novx_globals import NO_SCENE_FIELD_1_DEFAULT
+from nvlib.novx_globals import NO_SCENE_FIELD_2_DEFAULT
+from nvlib.novx_globals import NO_SCENE_FIELD_3_DEFAULT
+from nvlib.novx_globals import OTHER_SCENE_FIELD_1_DEFAULT
+from nvlib.novx_globals import OTHER_SCENE_FIELD_2_DEFAULT
+from nvlib.novx_globals import OTHER_SCENE_FIELD_3_DEFAULT
+from nvlib.novx_globals import PLOT_LINE_PREFIX
+from nvlib.novx_globals import PLOT_POINT_PREFIX
+from nvlib.novx_globals import PRJ_NOTE_PREFIX
+from nvlib.novx_globals import ROOT_PREFIX
+from nvlib.novx_globals import SECTION_PREFIX
+from nvlib.novx_globals import intersection
+import xml.etree.ElementTree as ET
+
+
+class ProjectMerger:
+    """Three-way merge of novelibre projects, keyed by element ID.
+
+    Elements changed on one side only are taken from that side.
+    Elements changed on both sides are merged field by field.
+    Fields are the xml attributes and child elements of an element,
+    e.g. "status", "Title", "Content", or "Field:<tag>" for custom
+    fields. Fields changed differently on both sides are conflicts,
+    resolved by the resolutions dictionary or by the preferred side.
+
+    Public instance variables:
+        conflicts: list -- (element ID, field) tuples of the conflicts.
+                           field is None if an element is removed on
+                           one side and changed on the other side.
+        preferred: str -- LOCAL or REMOTE; side taken for conflicts.
+        resolutions: dict -- key: field, value: LOCAL or REMOTE.
+    """
+    LOCAL = 'local'
+    REMOTE = 'remote'
+
+    ELEMENT_TYPES = {
+        CHAPTER_PREFIX: (Chapter, ChapterNovx),
+        SECTION_PREFIX: (Section, SectionNovx),
+        PLOT_LINE_PREFIX: (PlotLine, PlotLineNovx),
+        PLOT_POINT_PREFIX: (PlotPoint, PlotPointNovx),
+        CHARACTER_PREFIX: (Character, CharacterNovx),
+        LOCATION_PREFIX: (WorldElement, WorldElementNovx),
+        ITEM_PREFIX: (WorldElement, WorldElementNovx),
+        PRJ_NOTE_PREFIX: (BasicElement, BasicElementNovx),
+    }
+    # key: element ID prefix, value: (element class, converter class)
+
+    def __init__(self, preferred=LOCAL, resolutions=None):
+        """Optional arguments:
+            preferred: str -- LOCAL or REMOTE; side taken for conflicts.
+            resolutions: dict -- key: field, value: LOCAL or REMOTE.
+        """
+        self.preferred = preferred
+        self.resolutions = resolutions or {}
+        self.conflicts = []
+
+    def apply_changes(self, novel, remoteNovel, diff):
+        """Take over the elements changed on the remote side.
+
+        Positional arguments:
+            novel -- local Novel instance to be changed.
+            remoteNovel -- remote Novel instance.
+            diff -- ProjectDiff instance.
+
+        The elements are taken over as a whole. Back references
+        are not updated.
+        """
+        newIds = []
+        for elemId in diff.changed:
+            if elemId == ProjectSnapshot.PROJECT_ID:
+                xmlProject = ET.Element('PROJECT')
+                NovelNovx().export_data(remoteNovel, xmlProject)
+                NovelNovx().import_data(novel, xmlProject)
+                novel.languageCode = remoteNovel.languageCode
+                novel.countryCode = remoteNovel.countryCode
+                continue
+
+            elements = novel.elementsByPrefix[elemId[:2]]
+            if not elemId in elements:
+                newIds.append(elemId)
+            elements[elemId] = remoteNovel.elementsByPrefix[
+                elemId[:2]][elemId]
+
+        parentIds = sorted(
+            diff.structure,
+            key=lambda parentId: not parentId.startswith(ROOT_PREFIX),
+        )
+        # tree roots first, so new parents exist before their children
+        for parentId in parentIds:
+            for childId in diff.structure[parentId]:
+                if childId in newIds:
+                    novel.tree.append(parentId, childId)
+            novel.tree.set_children(parentId, *diff.structure[parentId])
+
+        removedIds = sorted(
+            diff.removed,
+            key=lambda elemId: not elemId[:2] in (
+                SECTION_PREFIX,
+                PLOT_POINT_PREFIX,
+            ),
+        )
+        # children first, because deleting a parent deletes its children
+        for elemId in removedIds:
+            novel.tree.delete(elemId)
+            del novel.elementsByPrefix[elemId[:2]][elemId]
+
+    def merge_conflicts(self, novel, diff, base, local, remote):
+        """Merge the elements changed on both sides field by field.
+
+        Positional arguments:
+            novel -- local Novel instance to be changed.
+            diff -- ProjectDiff instance.
+            base, local, remote -- ProjectSnapshot instances
+                                   taken with keepElements.
+
+        Add the conflicting fields to the conflicts list.
+        """
+        for elemId in diff.conflicts:
+            xmlBase = base.elements.get(elemId, None)
+            xmlLocal = local.elements.get(elemId, None)
+            xmlRemote = remote.elements.get(elemId, None)
+            if xmlBase is None or xmlLocal is None or xmlRemote is None:
+                # The element is new on both sides,
+                # or removed on one side and changed on the other side.
+                if xmlBase is not None or xmlLocal is None:
+                    self.conflicts.append((elemId, None))
+                    continue
+
+                xmlBase = ET.Element(xmlLocal.tag)
+            xmlMerged = self._merge_element(
+                elemId,
+                xmlBase,
+                xmlLocal,
+                xmlRemote,
+            )
+            if elemId == ProjectSnapshot.PROJECT_ID:
+                NovelNovx().import_data(novel, xmlMerged)
+                codes = xmlMerged.get('xml:lang', '').split('-')
+                novel.languageCode = codes[0] or None
+                if len(codes) > 1:
+                    novel.countryCode = codes[1]
+                else:
+                    novel.countryCode = None
+                continue
+
+            elementClass, converterClass = self.ELEMENT_TYPES[elemId[:2]]
+            element = elementClass()
+            converterClass().import_data(element, xmlMerged)
+            novel.elementsByPrefix[elemId[:2]][elemId] = element
+
+    def merge_files(self, basePath, localPath, remotePath, targetPath=None):
+        """Merge two versions of a project with a common base.
+
+        Positional arguments:
+            basePath: str -- path to the common ancestor.
+            localPath: str -- path to the local version.
+            remotePath: str -- path to the remote version.
+
+        Optional arguments:
+            targetPath: str -- path to the merged project.
+                               If None, overwrite the local version.
+
+        Return True if the merge is free of conflicts.
+        Raise the "RuntimeError" exception in case of error.
+        """
+        self.conflicts = []
+        baseFile = self._read_project(basePath)
+        localFile = self._read_project(localPath)
+        remoteFile = self._read_project(remotePath)
+        base = ProjectSnapshot(baseFile.build_xml_root(), keepElements=True)
+        local = ProjectSnapshot(localFile.build_xml_root(), keepElements=True)
+        remote = ProjectSnapshot(
+            remoteFile.build_xml_root(),
+            keepElements=True,
+        )
+        diff = ProjectDiff(base, local, remote)
+        novel = localFile.novel
+        self.apply_changes(novel, remoteFile.novel, diff)
+        self.merge_conflicts(novel, diff, base, local, remote)
+        self._remove_dead_references(novel)
+        novel.update_plot_lines()
+
+        for wcDate, wcCounts in remoteFile.wcLog.items():
+            if not wcDate in localFile.wcLog:
+                localFile.wcLog[wcDate] = wcCounts
+
+        if targetPath is not None:
+            localFile.filePath = targetPath
+        localFile.compact_word_count_log()
+        localFile.adjust_section_types()
+        localFile.write_xml_root(localFile.build_xml_root())
+        # not updating the word count log, because nobody wrote anything
+        return not self.conflicts
+
+    def _merge_element(self, elemId, xmlBase, xmlLocal, xmlRemote):
+        # Return a new xml element with the fields merged.
+        baseFields = self._get_fields(xmlBase)
+        localFields = self._get_fields(xmlLocal)
+        remoteFields = self._get_fields(xmlRemote)
+        fieldNames = dict.fromkeys(localFields)
+        fieldNames.update(dict.fromkeys(remoteFields))
+        fieldNames.update(dict.fromkeys(baseFields))
+        xmlMerged = ET.Element(xmlLocal.tag)
+        for fieldName in fieldNames:
+            baseValue = baseFields.get(fieldName, None)
+            localValue = localFields.get(fieldName, None)
+            remoteValue = remoteFields.get(fieldName, None)
+            if remoteValue == baseValue or remoteValue == localValue:
+                value = localValue
+            elif localValue == baseValue:
+                value = remoteValue
+            else:
+                self.conflicts.append((elemId, fieldName))
+                side = self.resolutions.get(fieldName, self.preferred)
+                if side == self.REMOTE:
+                    value = remoteValue
+                else:
+                    value = localValue
+            if value is None:
+                continue
+
+            if isinstance(value, str):
+                xmlMerged.set(fieldName, value)
+            else:
+                for xmlField in value:
+                    xmlMerged.append(ET.fromstring(xmlField))
+        return xmlMerged
+
+    def _get_fields(self, xmlElement):
+        # Return a dictionary of the element's fields.
+        # Attribute values are strings,
+        # child elements are tuples of serialized xml elements.
+        fields = dict(xmlElement.attrib)
+        for xmlChild in xmlElement:
+            if xmlChild.tag == 'Field':
+                fieldName = f"Field:{xmlChild.get('tag', '')}"
+            else:
+                fieldName = xmlChild.tag
+            fields[fieldName] = fields.get(fieldName, ()) + (
+                ET.tostring(xmlChild, encoding='unicode'),
+            )
+        return fields
+
+    def _read_project(self, filePath):
+        # Return a NovxFile instance with the project read.
+        novxFile = NovxFile(filePath)
+        novxFile.novel = Novel(
+            tree=NvTree(),
+            noSceneField1=NO_SCENE_FIELD_1_DEFAULT,
+            noSceneField2=NO_SCENE_FIELD_2_DEFAULT,
+            noSceneField3=NO_SCENE_FIELD_3_DEFAULT,
+            otherSceneField1=OTHER_SCENE_FIELD_1_DEFAULT,
+            otherSceneField2=OTHER_SCENE_FIELD_2_DEFAULT,
+            otherSceneField3=OTHER_SCENE_FIELD_3_DEFAULT,
+            crField1=CR_FIELD_1_DEFAULT,
+            crField2=CR_FIELD_2_DEFAULT,
+        )
+        novxFile.read()
+        return novxFile
+
+    def _remove_dead_references(self, novel):
+        # Remove references to elements removed by the merge.
+        for section in novel.sections.values():
+            if section.viewpoint and not section.viewpoint in novel.characters:
+                section.viewpoint = None
+            section.characters = intersection(
+                section.characters,
+                novel.characters,
+            )
+            section.locations = intersection(
+                section.locations,
+                novel.locations,
+            )
+            section.items = intersection(section.items, novel.items)
+        for plotLine in novel.plotLines.values():
+            plotLine.sections = intersection(
+                plotLine.sections,
+                novel.sections,
+            )
+        for plotPoint in novel.plotPoints.values():
+            if not plotPoint.sectionAssoc in novel.sections:
+                plotPoint.sectionAssoc = None
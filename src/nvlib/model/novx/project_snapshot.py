@@ -0,0 +1,132 @@
+"""Provide a class for an element-level project snapshot.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from hashlib import sha1
+
+from nvlib.novx_globals import CH_ROOT
+from nvlib.novx_globals import CR_ROOT
+from nvlib.novx_globals import IT_ROOT
+from nvlib.novx_globals import LC_ROOT
+from nvlib.novx_globals import PL_ROOT
+from nvlib.novx_globals import PN_ROOT
+import xml.etree.ElementTree as ET
+
+
+class ProjectSnapshot:
+    """Digests and structure of a novx project.
+
+    The snapshot is taken from a novx xml tree, as built by
+    NovxFile.build_xml_root(). So the snapshots of a project
+    on disk and of a project in memory are comparable.
+
+    Public instance variables:
+        digests: dict -- key: element ID, value: digest of the
+                         element's own data. The key '' refers
+                         to the project settings.
+        structure: dict -- key: parent ID, value: tuple of the
+                           child IDs.
+        elements: dict -- key: element ID, value: xml element with
+                          the element's own data. Only filled if
+                          the snapshot is taken with keepElements.
+                          The project's language is stored as
+                          "xml:lang" attribute.
+    """
+    PROJECT_ID = ''
+
+    BRANCHES = {
+        'CHAPTERS': CH_ROOT,
+        'CHARACTERS': CR_ROOT,
+        'LOCATIONS': LC_ROOT,
+        'ITEMS': IT_ROOT,
+        'ARCS': PL_ROOT,
+        'PROJECTNOTES': PN_ROOT,
+    }
+    # key: xml branch tag, value: ID of the tree root
+    NESTED = ('SECTION', 'POINT')
+    # tags of the elements with a parent other than a tree root
+
+    def __init__(self, xmlRoot, keepElements=False):
+        """Take the snapshot.
+
+        Positional arguments:
+            xmlRoot -- novx xml root element.
+
+        Optional arguments:
+            keepElements: bool -- if True, keep the elements' xml data.
+        """
+        self.digests = {}
+        self.structure = {}
+        self.elements = {}
+        self._keepElements = keepElements
+        for xmlBranch in xmlRoot:
+            if xmlBranch.tag == 'PROJECT':
+                language = xmlRoot.attrib.get('xml:lang', '')
+                self.digests[self.PROJECT_ID] = self._get_digest(
+                    xmlBranch,
+                    language,
+                )
+                if keepElements:
+                    xmlProject = ET.Element('PROJECT', attrib=xmlBranch.attrib)
+                    xmlProject.set('xml:lang', language)
+                    xmlProject.extend(xmlBranch)
+                    self.elements[self.PROJECT_ID] = xmlProject
+                continue
+
+            rootId = self.BRANCHES.get(xmlBranch.tag, None)
+            if rootId is None:
+                continue
+
+            self.structure[rootId] = self._add_children(xmlBranch)
+
+    def get_parents(self):
+        """Return a dictionary with the parent of each listed element."""
+        parents = {}
+        for parentId in self.structure:
+            for elemId in self.structure[parentId]:
+                parents[elemId] = parentId
+        return parents
+
+    def _add_children(self, xmlParent):
+        # Add the digests of the parent's children to the snapshot.
+        # Return a tuple of the child IDs.
+        childIds = []
+        for xmlElement in xmlParent:
+            elemId = xmlElement.attrib.get('id', None)
+            if elemId is None:
+                continue
+
+            childIds.append(elemId)
+            xmlData = ET.Element(xmlElement.tag, attrib=xmlElement.attrib)
+            xmlData.text = xmlElement.text
+            xmlChildren = []
+            for xmlChild in xmlElement:
+                if xmlChild.tag in self.NESTED:
+                    xmlChildren.append(xmlChild)
+                else:
+                    xmlData.append(xmlChild)
+            self.digests[elemId] = self._get_digest(xmlData)
+            if self._keepElements:
+                self.elements[elemId] = xmlData
+            if xmlChildren or xmlElement.tag in ('CHAPTER', 'ARC'):
+                self.structure[elemId] = self._add_nested(xmlChildren)
+        return tuple(childIds)
+
+    def _add_nested(self, xmlChildren):
+        # Add the digests of sections or plot points to the snapshot.
+        # Return a tuple of the child IDs.
+        childIds = []
+        for xmlElement in xmlChildren:
+            elemId = xmlElement.attrib['id']
+            childIds.append(elemId)
+            self.digests[elemId] = self._get_digest(xmlElement)
+            if self._keepElements:
+                self.elements[elemId] = xmlElement
+        return tuple(childIds)
+
+    def _get_digest(self, xmlElement, suffix=''):
+        # Return the digest of the element's serialized data.
+        data = ET.tostring(xmlElement, encoding='unicode')
+        return sha1(f'{data}\0{suffix}'.encode('utf-8')).digest()
@@ -0,0 +1,194 @@
+"""Provide a class for multi-file novx project representation.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from hashlib import sha1
+import os
+
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.split_novx_opener import SplitNovxOpener
+from nvlib.model.xml.xml_filter import strip_illegal_characters
+from nvlib.model.xml.xml_indent import indent
+from nvlib.novx_globals import norm_path
+from nvlib.nv_locale import _
+import xml.etree.ElementTree as ET
+
+
+class SplitNovxFile(NovxFile):
+    """Multi-file novx project representation.
+
+    The project consists of a manifest file, and a directory
+    with one file per chapter and one file per element collection.
+    Each file is a novx document with only one branch of the project.
+
+    Saving rewrites only the files whose content has changed.
+    """
+    DESCRIPTION = _('Multi-file novelibre project')
+    EXTENSION = '.novxm'
+
+    XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n'
+
+    _PARTS_DIR_SUFFIX = '_files'
+    _CHAPTERS_DIR = 'chapters'
+
+    fileOpener = SplitNovxOpener
+
+    def __init__(self, filePath, **kwargs):
+        """Initialize instance variables.
+
+        Positional arguments:
+            filePath: str -- path to the manifest file.
+
+        Optional arguments:
+            kwargs -- keyword arguments (not used here).
+
+        Extends the superclass constructor.
+        """
+        super().__init__(filePath, **kwargs)
+        self._partDigests = {}
+        # key: str -- path to a file written or verified
+        # value: bytes -- digest of the file content
+
+    def _get_parts_dir(self):
+        # Return the path to the directory containing the project's parts.
+        path, __ = os.path.splitext(self.filePath)
+        return f'{path}{self._PARTS_DIR_SUFFIX}'
+
+    def _get_timestamp(self):
+        # Use the latest modification time of all project files.
+        try:
+            timestamps = [os.path.getmtime(self.filePath)]
+        except Exception:
+            self.timestamp = None
+            return
+
+        for root, __, files in os.walk(self._get_parts_dir()):
+            for fileName in files:
+                timestamps.append(
+                    os.path.getmtime(os.path.join(root, fileName))
+                )
+        self.timestamp = max(timestamps)
+
+    def _new_part(self, xmlRoot, xmlBranch, parentTag=None):
+        # Return a novx root element containing only xmlBranch.
+        xmlPart = ET.Element('novx', attrib=xmlRoot.attrib)
+        if parentTag is None:
+            xmlPart.append(xmlBranch)
+        else:
+            ET.SubElement(xmlPart, parentTag).append(xmlBranch)
+        indent(xmlPart)
+        return xmlPart
+
+    def _postprocess_xml_file(self, filePath):
+        """Do nothing.
+
+        Positional argument:
+            filePath: str -- not used by this method.
+
+        The parts are postprocessed before being written.
+        Overrides the superclass method.
+        """
+        pass
+
+    def _remove_obsolete_parts(self, partPaths):
+        # Delete the chapter files no longer referred to by the manifest.
+        chaptersDir = f'{self._get_parts_dir()}/{self._CHAPTERS_DIR}'
+        try:
+            fileNames = os.listdir(chaptersDir)
+        except FileNotFoundError:
+            return
+
+        for fileName in fileNames:
+            partPath = f'{chaptersDir}/{fileName}'
+            if partPath in partPaths or not fileName.endswith('.xml'):
+                continue
+
+            try:
+                os.remove(partPath)
+            except OSError:
+                pass
+            self._partDigests.pop(partPath, None)
+
+    def _write_element_tree(self, xmlProject):
+        """Save the project as a manifest and a set of part files.
+
+        Positional argument:
+            xmlProject -- NovxFile instance.
+
+        Split the project's xml tree into the chapters and the
+        element collections, and write each part to a file,
+        if its content has changed.
+        The manifest is written last, after all files it refers to.
+        Raise the "RuntimeError" exception in case of error.
+        """
+        xmlRoot = xmlProject.xmlTree.getroot()
+        xmlManifest = ET.Element('novx', attrib=xmlRoot.attrib)
+        manifestDir = os.path.dirname(self.filePath)
+        partsDirName = os.path.basename(self._get_parts_dir())
+        parts = {}
+        # key: str -- path relative to the manifest
+        # value: xml root of the part
+        for xmlBranch in list(xmlRoot):
+            if xmlBranch.tag == 'CHAPTERS':
+                xmlChapterRefs = ET.SubElement(xmlManifest, 'CHAPTERS')
+                for xmlChapter in list(xmlBranch):
+                    chId = xmlChapter.attrib['id']
+                    href = f'{partsDirName}/{self._CHAPTERS_DIR}/{chId}.xml'
+                    ET.SubElement(
+                        xmlChapterRefs,
+                        'CHAPTER',
+                        attrib={'id': chId, 'href': href},
+                    )
+                    parts[href] = self._new_part(
+                        xmlRoot,
+                        xmlChapter,
+                        parentTag='CHAPTERS',
+                    )
+            else:
+                href = f'{partsDirName}/{xmlBranch.tag.lower()}.xml'
+                ET.SubElement(xmlManifest, xmlBranch.tag, attrib={'href': href})
+                parts[href] = self._new_part(xmlRoot, xmlBranch)
+        indent(xmlManifest)
+
+        partPaths = set()
+        for href in parts:
+            partPath = os.path.join(manifestDir, href).replace('\\', '/')
+            partPaths.add(partPath)
+            self._write_part(parts[href], partPath)
+        self._write_part(xmlManifest, self.filePath)
+        self._remove_obsolete_parts(partPaths)
+
+    def _write_part(self, xmlPart, filePath):
+        # Write xmlPart to the file at filePath, if the content has changed.
+        # Raise the "RuntimeError" exception in case of error.
+        text = strip_illegal_characters(
+            ET.tostring(xmlPart, encoding='unicode')
+        )
+        data = f'{self.XML_HEADER}{text}'.encode('utf-8')
+        digest = sha1(data).digest()
+        if self._partDigests.get(filePath, None) == digest:
+            return
+
+        try:
+            with open(filePath, 'rb') as f:
+                if sha1(f.read()).digest() == digest:
+                    self._partDigests[filePath] = digest
+                    return
+
+        except OSError:
+            pass
+        try:
+            os.makedirs(os.path.dirname(filePath) or '.', exist_ok=True)
+            with open(f'{filePath}.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(f'{filePath}.tmp', filePath)
+            # replacing the file only after it has been completely written
+        except Exception as ex:
+            msg = _("Cannot write file")
+            msg = f'{msg}: "{norm_path(filePath)}"'
+            msg = f'{msg} - {str(ex)}'
+            raise RuntimeError(msg)
+
+        self._partDigests[filePath] = digest
@@ -0,0 +1,111 @@
+"""Provide a class for opening and preprocessing multi-file novx projects.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+from nvlib.model.novx.novx_opener import NovxOpener
+from nvlib.novx_globals import norm_path
+from nvlib.nv_locale import _
+import xml.etree.ElementTree as ET
+
+
+class SplitNovxOpener(NovxOpener):
+    """Multi-file novx XML data reader, verifier, and preprocessor.
+
+    The manifest is a novx document whose branches refer to
+    the files containing the data. The referenced files are
+    novx documents containing only the referring branch.
+    """
+
+    MAX_WORKERS = 8
+    # maximum number of files read in parallel
+
+    @classmethod
+    def get_xml_root(cls, filePath, majorVersion, minorVersion):
+        """Return a reference to the XML root of the assembled project.
+
+        majorVersion and minorVersion are integers.
+        Read the files referred to by the manifest at filePath
+        in parallel, and insert their branches into the manifest tree.
+        Check the file version and preprocess the data, if applicable.
+        """
+        xmlRoot = cls._parse(filePath)
+        if xmlRoot.tag != 'novx':
+            msg = _("No valid xml root element found in file")
+            raise RuntimeError(f'{msg}: "{norm_path(filePath)}".')
+
+        fileMajorVersion, fileMinorVersion = cls._get_file_version(
+            xmlRoot,
+            filePath,
+        )
+        cls._check_version(
+            fileMajorVersion,
+            fileMinorVersion,
+            filePath,
+            majorVersion,
+            minorVersion,
+        )
+        cls._insert_parts(xmlRoot, filePath)
+        fileMajorVersion, fileMinorVersion = cls._upgrade_file_version(
+            xmlRoot,
+            fileMajorVersion,
+            fileMinorVersion,
+        )
+        return xmlRoot
+
+    @classmethod
+    def _insert_parts(cls, xmlRoot, filePath):
+        # Replace the manifest's references with the referred branches.
+        references = []
+        # list of (parent element, index, path to the branch) tuples
+        for i, xmlReference in enumerate(xmlRoot):
+            if xmlReference.tag == 'CHAPTERS':
+                for j, xmlChapterReference in enumerate(xmlReference):
+                    references.append(
+                        (xmlReference, j, 'CHAPTERS/CHAPTER')
+                    )
+            else:
+                references.append((xmlRoot, i, xmlReference.tag))
+
+        projectDir = os.path.dirname(filePath)
+        try:
+            partPaths = [
+                os.path.join(projectDir, parent[i].attrib['href'])
+                for parent, i, __ in references
+            ]
+        except KeyError:
+            msg = _("Cannot process file")
+            raise RuntimeError(
+                f'{msg}: "{norm_path(filePath)}" - href missing.'
+            )
+
+        with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS) as executor:
+            xmlParts = list(executor.map(cls._parse, partPaths))
+        for reference, xmlPart, partPath in zip(
+            references,
+            xmlParts,
+            partPaths,
+        ):
+            parent, i, branchPath = reference
+            xmlBranch = xmlPart.find(branchPath)
+            if xmlBranch is None:
+                msg = _("No valid xml root element found in file")
+                raise RuntimeError(f'{msg}: "{norm_path(partPath)}".')
+
+            parent[i] = xmlBranch
+
+    @classmethod
+    def _parse(cls, filePath):
+        # Return the XML root of the file at filePath.
+        try:
+            return ET.parse(filePath).getroot()
+
+        except Exception as ex:
+            normPath = norm_path(filePath)
+            raise RuntimeError(
+                f'{_("Cannot process file")}: "{normPath}" - {str(ex)}'
+            )
@@ -4,8 +4,15 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from threading import Thread
+from time import perf_counter
+
 from nvlib.controller.services.nv_service import NvService
 from nvlib.model.data.id_generator import new_id
+from nvlib.model.data.id_generator import new_ids
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.novx.project_merger import ProjectMerger
+from nvlib.model.novx.project_snapshot import ProjectSnapshot
 from nvlib.model.nv_work_file import NvWorkFile
 from nvlib.novx_globals import CHAPTER_PREFIX
 from nvlib.novx_globals import CHARACTER_PREFIX
@@ -29,6 +36,7 @@ from nvlib.novx_globals import PL_ROOT
 from nvlib.novx_globals import PN_ROOT
 from nvlib.novx_globals import PRJ_NOTE_PREFIX
 from nvlib.novx_globals import SECTION_PREFIX
+from nvlib.novx_globals import norm_path
 from nvlib.nv_locale import _
 
 
@@ -38,8 +46,32 @@ class NvModel:
     def __init__(self):
         self._observers = []
         # list of Observer instance references
+        self._hiddenObservers = set()
+        # Observer instances not on screen; they are not refreshed
+        self._staleObservers = set()
+        # hidden Observer instances to be refreshed when shown
+        self._refreshTimes = {}
+        # key: Observer class
+        # value: list -- [number of refreshes, total seconds]
         self._isModified = False
         # internal modification flag
+        self._batchLevel = 0
+        # greater than zero while a batch of changes is in progress
+        self._batchChanges = False
+        # True if changes were made during the batch
+        self._idGenerators = {}
+        # key: ID prefix; value: generator of new IDs during the batch
+        self._changeCount = 0
+        # incremented on each change; tells whether changes were made
+        # while saving
+        self._saveThread = None
+        # worker thread writing the project file
+        self._saveError = None
+        # exception raised by the worker thread
+        self._savedChangeCount = 0
+        self._savedFile = None
+        self._savedSnapshot = None
+        # state of the project being saved
 
         self.tree = None
         # strategy class
@@ -50,6 +82,11 @@ class NvModel:
         self.trashBin = None
         self.wordCount = 0
 
+        self.keepSnapshots = False
+        # if True, take a snapshot whenever the project is read or written
+        self.baseSnapshot = None
+        # ProjectSnapshot of the project as last read or written
+
         self.nvService = NvService()
 
     @property
@@ -59,9 +96,16 @@ class NvModel:
 
     @isModified.setter
     def isModified(self, setFlag):
+        if setFlag:
+            self._changeCount += 1
         self._isModified = setFlag
         self.notify_observers()
 
+    @property
+    def isSaving(self):
+        # Boolean -- True if saving is started but not finished.
+        return self._saveThread is not None
+
     def add_new_chapter(self, **kwargs):
         """Create a chapter instance and add it to the novel.
              
@@ -84,7 +128,7 @@ class NvModel:
         if targetNode.startswith(CHAPTER_PREFIX):
             index = self.tree.index(targetNode) + 1
             targetNode = self.tree.parent(targetNode)
-        chId = new_id(self.novel.chapters, prefix=CHAPTER_PREFIX)
+        chId = self._new_id(self.novel.chapters, CHAPTER_PREFIX)
         self.novel.chapters[chId] = self.nvService.new_chapter(
             title=kwargs.get('title', f'{_("New Chapter")} ({chId})'),
             desc='',
@@ -117,7 +161,7 @@ class NvModel:
         index = 'end'
         if targetNode.startswith(CHARACTER_PREFIX):
             index = self.tree.index(targetNode) + 1
-        crId = new_id(self.novel.characters, prefix=CHARACTER_PREFIX)
+        crId = self._new_id(self.novel.characters, CHARACTER_PREFIX)
         self.novel.characters[crId] = self.nvService.new_character(
             title=kwargs.get('title', f'{_("New Character")} ({crId})'),
             desc='',
@@ -149,7 +193,7 @@ class NvModel:
         index = 'end'
         if targetNode.startswith(ITEM_PREFIX):
             index = self.tree.index(targetNode) + 1
-        itId = new_id(self.novel.items, prefix=ITEM_PREFIX)
+        itId = self._new_id(self.novel.items, ITEM_PREFIX)
         self.novel.items[itId] = self.nvService.new_world_element(
             title=kwargs.get('title', f'{_("New Item")} ({itId})'),
             desc='',
@@ -176,7 +220,7 @@ class NvModel:
         index = 'end'
         if targetNode.startswith(LOCATION_PREFIX):
             index = self.tree.index(targetNode) + 1
-        lcId = new_id(self.novel.locations, prefix=LOCATION_PREFIX)
+        lcId = self._new_id(self.novel.locations, LOCATION_PREFIX)
         self.novel.locations[lcId] = self.nvService.new_world_element(
             title=kwargs.get('title', f'{_("New Location")} ({lcId})'),
             desc='',
@@ -208,7 +252,7 @@ class NvModel:
         if targetNode.startswith(CHAPTER_PREFIX):
             index = self.tree.index(targetNode) + 1
             targetNode = self.tree.parent(targetNode)
-        chId = new_id(self.novel.chapters, prefix=CHAPTER_PREFIX)
+        chId = self._new_id(self.novel.chapters, CHAPTER_PREFIX)
         self.novel.chapters[chId] = self.nvService.new_chapter(
             title=kwargs.get('title', f'{_("New Part")} ({chId})'),
             desc='',
@@ -239,7 +283,7 @@ class NvModel:
         index = 'end'
         if targetNode.startswith(PLOT_LINE_PREFIX):
             index = self.tree.index(targetNode) + 1
-        plId = new_id(self.novel.plotLines, prefix=PLOT_LINE_PREFIX)
+        plId = self._new_id(self.novel.plotLines, PLOT_LINE_PREFIX)
         self.novel.plotLines[plId] = self.nvService.new_plot_line(
             title=kwargs.get('title', f'{_("New Plot line")} ({plId})'),
             desc='',
@@ -275,7 +319,7 @@ class NvModel:
         else:
             return
 
-        ppId = new_id(self.novel.plotPoints, prefix=PLOT_POINT_PREFIX)
+        ppId = self._new_id(self.novel.plotPoints, PLOT_POINT_PREFIX)
         self.novel.plotPoints[ppId] = self.nvService.new_plot_point(
             title=kwargs.get('title', f'{_("New Plot point")} ({ppId})'),
             desc='',
@@ -301,7 +345,7 @@ class NvModel:
         index = 'end'
         if targetNode.startswith(PRJ_NOTE_PREFIX):
             index = self.tree.index(targetNode) + 1
-        pnId = new_id(self.novel.projectNotes, prefix=PRJ_NOTE_PREFIX)
+        pnId = self._new_id(self.novel.projectNotes, PRJ_NOTE_PREFIX)
         self.novel.projectNotes[pnId] = self.nvService.new_basic_element(
             title=kwargs.get('title', f'{_("New Note")} ({pnId})'),
             desc='',
@@ -348,7 +392,7 @@ class NvModel:
             newType = parentType
         else:
             newType = kwargs.get('scType', 0)
-        scId = new_id(self.novel.sections, prefix=SECTION_PREFIX)
+        scId = self._new_id(self.novel.sections, SECTION_PREFIX)
         self.novel.sections[scId] = self.nvService.new_section(
             title=kwargs.get('title', f'{_("New Section")} ({scId})'),
             desc=kwargs.get('desc', ''),
@@ -390,7 +434,7 @@ class NvModel:
         else:
             return
 
-        scId = new_id(self.novel.sections, prefix=SECTION_PREFIX)
+        scId = self._new_id(self.novel.sections, SECTION_PREFIX)
         self.novel.sections[scId] = self.nvService.new_section(
             title=kwargs.get('title', f'{_("Stage")}'),
             desc=kwargs.get('desc', ''),
@@ -407,6 +451,15 @@ class NvModel:
         if not client in self._observers:
             self._observers.append(client)
 
+    def begin_batch(self):
+        """Start a batch of changes.
+
+        Until end_batch() is called, the observers are not refreshed,
+        and the IDs of new elements are allocated in bulk.
+        Batches can be nested.
+        """
+        self._batchLevel += 1
+
     def clone_section(self, scId):
         """Create a duplicate of the section scId and add it to the novel.
         
@@ -454,7 +507,7 @@ class NvModel:
         clone.scPlotLines = original.scPlotLines[:]
         parent = self.tree.parent(scId)
         index = self.tree.index(scId) + 1
-        cloneId = new_id(self.novel.sections, prefix=SECTION_PREFIX)
+        cloneId = self._new_id(self.novel.sections, SECTION_PREFIX)
         self.novel.sections[cloneId] = clone
         self.tree.insert(parent, index, cloneId)
         for plId in clone.scPlotLines:
@@ -670,6 +723,61 @@ class NvModel:
         """Remove an Observer instance from the list."""
         if client in self._observers:
             self._observers.remove(client)
+        self._hiddenObservers.discard(client)
+        self._staleObservers.discard(client)
+
+    def end_batch(self):
+        """Finish a batch of changes.
+
+        If changes were made, refresh the observers once.
+        """
+        self._batchLevel -= 1
+        if self._batchLevel > 0:
+            return
+
+        self._idGenerators.clear()
+        if self._batchChanges:
+            self._batchChanges = False
+            self.isModified = True
+
+    def finish_saving(self, wait=True):
+        """Complete saving, if started; set "unchanged" status if applicable.
+
+        Optional arguments:
+            wait: Boolean -- If False, return at once if the worker
+                             thread is still writing.
+
+        Return True if saving is finished, otherwise return False.
+        Raise the "RuntimeError" exception if writing the file failed.
+
+        The project is set "unchanged" only if it was not modified
+        after saving was started.
+        """
+        if self._saveThread is None:
+            return True
+
+        if self._saveThread.is_alive() and not wait:
+            return False
+
+        self._saveThread.join()
+        self._saveThread = None
+        savedFile = self._savedFile
+        self._savedFile = None
+        saveError = self._saveError
+        self._saveError = None
+        if saveError is not None:
+            self._savedSnapshot = None
+            raise saveError
+
+        self.prjFile.xmlTree = savedFile.xmlTree
+        self.prjFile.timestamp = savedFile.timestamp
+        self.prjFile.wcLog = savedFile.wcLog
+        # compacted when writing
+        self.baseSnapshot = self._savedSnapshot
+        self._savedSnapshot = None
+        if self._changeCount == self._savedChangeCount:
+            self.isModified = False
+        return True
 
     def get_color(self, elemId):
         """Get the color assigned to an element specified by elemId.
@@ -694,21 +802,36 @@ class NvModel:
         """
         partCount = 0
         chapterCount = 0
-        sectionCount = 0
-        wordCount = 0
+        scIds = []
         for chId in self.tree.get_children(CH_ROOT):
             if self.novel.chapters[chId].chType == 0:
-                for scId in self.tree.get_children(chId):
-                    if self.novel.sections[scId].scType == 0:
-                        sectionCount += 1
-                        wordCount += self.novel.sections[scId].wordCount
+                scIds.extend(self.tree.get_children(chId))
                 if self.novel.chapters[chId].chLevel == 1:
                     partCount += 1
                 else:
                     chapterCount += 1
+        sectionCount, wordCount = self.novel.sectionTable.get_totals(scIds)
         self.wordCount = wordCount
         return wordCount, sectionCount, chapterCount, partCount
 
+    def get_refresh_times(self):
+        """Return a list of the time spent refreshing the observers.
+        
+        The list items are tuples:
+        (class name: str, number of refreshes: int, total seconds: float),
+        sorted by the total time, starting with the most expensive.
+        """
+        refreshTimes = [
+            (observerClass.__name__, count, seconds)
+            for observerClass, (count, seconds) in self._refreshTimes.items()
+        ]
+        refreshTimes.sort(key=lambda entry: entry[2], reverse=True)
+        return refreshTimes
+
+    def get_snapshot(self):
+        """Return a ProjectSnapshot of the project in memory."""
+        return ProjectSnapshot(self.prjFile.build_xml_root())
+
     def get_status_counts(self):
         """Return a list with word count totals depending of section status.
         
@@ -719,13 +842,18 @@ class NvModel:
         Position 4 -- Total number of words in "2nd Edit" sections
         Position 5 -- Total number of words in "Done" sections
         """
-        counts = [None, 0, 0, 0, 0, 0]
-        for scId in self.novel.sections:
-            if self.novel.sections[scId].scType == 0:
-                if self.novel.sections[scId].status is not None:
-                    counts[self.novel.sections[scId].status
-                           ] += self.novel.sections[scId].wordCount
-        return counts
+        return self.novel.sectionTable.get_status_counts()
+
+    def hide_observer(self, client):
+        """Stop refreshing an Observer instance that is not on screen.
+        
+        Positional arguments:
+            client -- Observer instance.
+
+        The client is refreshed once when shown again,
+        if the model has changed in the meantime.
+        """
+        self._hiddenObservers.add(client)
 
     def join_sections(self, scId0, scId1):
         """Join section 0 with section 1.
@@ -889,6 +1017,27 @@ class NvModel:
         self.tree.delete(scId1)
         # removing section 1 reference from the tree
 
+    def merge_changes(self, remoteFile, remoteSnapshot, diff):
+        """Take over the changes of the project file on disk.
+
+        Positional arguments:
+            remoteFile -- NvWorkFile instance read from disk.
+            remoteSnapshot -- ProjectSnapshot of remoteFile.
+            diff -- ProjectDiff instance.
+
+        Replace only the elements changed on disk, and keep
+        the changes made in memory.
+        """
+        self.tree.on_element_change = self.novel.do_nothing
+        # avoiding a refresh on each tree operation
+        ProjectMerger().apply_changes(self.novel, remoteFile.novel, diff)
+        self.prjFile.wcLog = remoteFile.wcLog
+        self.prjFile.timestamp = remoteFile.timestamp
+        self.baseSnapshot = remoteSnapshot
+        self.novel.update_plot_lines()
+        self._initialize_tree(self.on_element_change)
+        self.isModified = diff.localChanges
+
     def move_node(self, node, targetNode):
         """Move a node to another position.
         
@@ -924,10 +1073,17 @@ class NvModel:
 
     def notify_observers(self):
         for client in self._observers:
-            client.refresh()
+            if client in self._hiddenObservers:
+                self._staleObservers.add(client)
+            else:
+                self._refresh_observer(client)
 
     def on_element_change(self):
         """Callback function that reports changes."""
+        if self._batchLevel > 0:
+            self._batchChanges = True
+            return
+
         self.isModified = True
 
     def open_project(self, filePath):
@@ -955,6 +1111,28 @@ class NvModel:
         else:
             self.isModified = False
         self._initialize_tree(self.on_element_change)
+        self._update_snapshot()
+
+    def read_changes(self):
+        """Read the project file on disk for comparison.
+
+        Return a tuple: (NvWorkFile instance, ProjectSnapshot instance).
+        The tree of the project read is not linked with the GUI.
+        """
+        remoteFile = NvWorkFile(self.prjFile.filePath)
+        remoteFile.novel = self.nvService.new_novel(
+            tree=NvTree(),
+            noSceneField1=NO_SCENE_FIELD_1_DEFAULT,
+            noSceneField2=NO_SCENE_FIELD_2_DEFAULT,
+            noSceneField3=NO_SCENE_FIELD_3_DEFAULT,
+            otherSceneField1=OTHER_SCENE_FIELD_1_DEFAULT,
+            otherSceneField2=OTHER_SCENE_FIELD_2_DEFAULT,
+            otherSceneField3=OTHER_SCENE_FIELD_3_DEFAULT,
+            crField1=CR_FIELD_1_DEFAULT,
+            crField2=CR_FIELD_2_DEFAULT,
+        )
+        remoteFile.read()
+        return remoteFile, ProjectSnapshot(remoteFile.build_xml_root())
 
     def renumber_chapters(self):
         """Modify chapter headings."""
@@ -1042,10 +1220,8 @@ class NvModel:
 
     def save_project(self, filePath=None):
         """Write the novelibre project file, and set "unchanged" status."""
-        if filePath is not None:
-            self.prjFile.filePath = filePath
-        self.prjFile.write()
-        self.isModified = False
+        self.start_saving(filePath)
+        self.finish_saving()
 
     def set_color(self, color, elemIds):
         """Set element color.
@@ -1160,6 +1336,43 @@ class NvModel:
                 )
                 # going one level down
 
+    def show_observer(self, client):
+        """Resume refreshing an Observer instance that is on screen again.
+        
+        Positional arguments:
+            client -- Observer instance.
+
+        Refresh the client, if the model has changed while hidden.
+        """
+        self._hiddenObservers.discard(client)
+        if client in self._staleObservers:
+            self._staleObservers.discard(client)
+            self._refresh_observer(client)
+
+    def start_saving(self, filePath=None):
+        """Start writing the novelibre project file on a worker thread.
+
+        Optional arguments:
+            filePath: str -- New project file path.
+
+        The worker thread builds and writes the xml tree from a copy
+        of the project taken on the calling thread. So the file gets
+        a consistent state of the project, even if it is changed
+        while saving. Call finish_saving() to complete.
+        """
+        self.finish_saving()
+        # only one save at a time, because of the backup file rotation
+        if filePath is not None:
+            self.prjFile.filePath = filePath
+        self._savedFile = self.prjFile.copy_for_writing()
+        self._savedSnapshot = None
+        self._savedChangeCount = self._changeCount
+        self._saveThread = Thread(
+            target=self._write_project,
+            args=(self._savedFile, self.keepSnapshots),
+        )
+        self._saveThread.start()
+
     def _initialize_tree(self, on_element_change):
         """Iterate the tree and configure the elements."""
 
@@ -1186,3 +1399,46 @@ class NvModel:
         self.novel.on_element_change = on_element_change
         self.tree.on_element_change = on_element_change
 
+    def _new_id(self, elements, prefix):
+        # Return an unused ID for a new element.
+        # During a batch, continue the search after the last ID allocated.
+        if self._batchLevel == 0:
+            return new_id(elements, prefix=prefix)
+
+        if not prefix in self._idGenerators:
+            self._idGenerators[prefix] = new_ids(elements, prefix=prefix)
+        return next(self._idGenerators[prefix])
+
+    def _refresh_observer(self, client):
+        # Refresh an Observer instance, and measure the time it takes.
+        startTime = perf_counter()
+        client.refresh()
+        refreshTime = self._refreshTimes.setdefault(type(client), [0, 0.0])
+        refreshTime[0] += 1
+        refreshTime[1] += perf_counter() - startTime
+
+    def _update_snapshot(self):
+        # Take a snapshot of the project as read or written, if required.
+        if self.keepSnapshots:
+            self.baseSnapshot = self.get_snapshot()
+        else:
+            self.baseSnapshot = None
+
+    def _write_project(self, prjFile, keepSnapshot):
+        # Build and write the project file. This runs on the worker thread.
+        #    prjFile -- copy of the project file returned by
+        #               NovxFile.copy_for_writing(); not shared.
+        #    keepSnapshot: Boolean -- if True, take a snapshot
+        #                             of the project saved.
+        try:
+            xmlRoot = prjFile.build_xml_root()
+            if keepSnapshot:
+                self._savedSnapshot = ProjectSnapshot(xmlRoot)
+            prjFile.write_xml_root(xmlRoot)
+        except RuntimeError as ex:
+            self._saveError = ex
+        except Exception as ex:
+            self._saveError = RuntimeError(
+                f'{_("Cannot write file")}: '
+                f'"{norm_path(prjFile.filePath)}" - {str(ex)}'
+            )
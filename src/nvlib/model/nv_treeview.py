@@ -20,6 +20,8 @@ class NvTreeview(ttk.Treeview):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.on_element_change = self.do_nothing
+        self.structureChanges = 0
+        # incremented on each structural change
 
         #--- Variables for the undo/redo function.
         self.moving = False
@@ -42,6 +44,7 @@ class NvTreeview(ttk.Treeview):
 
     def delete(self, *items):
         super().delete(*items)
+        self.structureChanges += 1
         self.on_element_change()
         self.moves.clear()
 
@@ -55,6 +58,7 @@ class NvTreeview(ttk.Treeview):
 
     def insert(self, parent, index, iid=None, **kw):
         super().insert(parent, index, iid, **kw)
+        self.structureChanges += 1
         self.on_element_change()
         self.moves.clear()
 
@@ -63,6 +67,7 @@ class NvTreeview(ttk.Treeview):
             self.moving = True
             self.moves.append((item, self.parent(item), self.index(item)))
         super().move(item, parent, index)
+        self.structureChanges += 1
         self.on_element_change()
 
     def reset(self):
@@ -77,5 +82,11 @@ class NvTreeview(ttk.Treeview):
         if self.moves:
             item, parent, index = self.moves.pop()
             super().move(item, parent, index)
+            self.structureChanges += 1
             return item
 
+    def set_children(self, item, *newchildren):
+        super().set_children(item, *newchildren)
+        self.structureChanges += 1
+        self.on_element_change()
+        self.moves.clear()
@@ -7,8 +7,10 @@ License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 from datetime import datetime
 import os
 
+from nvlib.model.data.word_count_log import WordCountLog
 from nvlib.model.novx.novx_file import NovxFile
 from nvlib.novx_globals import CH_ROOT
+from nvlib.nv_globals import prefs
 from nvlib.nv_locale import _
 
 
@@ -24,6 +26,23 @@ class NvWorkFile(NovxFile):
     _LOCKFILE_PREFIX = '.LOCK.'
     _LOCKFILE_SUFFIX = '#'
 
+    def __init__(self, filePath, **kwargs):
+        """Set up the word count log compaction as configured.
+
+        Extends the superclass constructor.
+        """
+        super().__init__(filePath, **kwargs)
+        granularity = prefs.get('wc_log_granularity', None)
+        if granularity in WordCountLog.GRANULARITIES:
+            self.wcLogGranularity = granularity
+        # otherwise, no compaction
+        try:
+            self.wcLogFullDays = int(
+                prefs.get('wc_log_full_days', self.wcLogFullDays)
+            )
+        except ValueError:
+            pass
+
     @property
     def fileDate(self):
         if self.timestamp is None:
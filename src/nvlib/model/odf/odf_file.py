@@ -12,6 +12,7 @@ from shutil import rmtree
 from string import Template
 import tempfile
 from xml import sax
+import xml.etree.ElementTree as ET
 import zipfile
 
 from nvlib.model.file.file_export import FileExport
@@ -28,6 +29,9 @@ class OdfFile(FileExport):
     _STYLES_XML = ''
     _META_XML = ''
 
+    FINGERPRINT_NAME = 'novelibre-fingerprint'
+    # name of the user-defined meta property holding the fingerprint
+
     NAMESPACES = dict(
         office='urn:oasis:names:tc:opendocument:xmlns:office:1.0',
         style='urn:oasis:names:tc:opendocument:xmlns:style:1.0',
@@ -85,6 +89,28 @@ class OdfFile(FileExport):
         """Return True if the file is locked by its application."""
         return odf_is_locked(self.filePath)
 
+    def read_fingerprint(self):
+        """Return the fingerprint recorded in the existing document.
+        
+        Return None, if the document does not exist, 
+        or if it has no fingerprint.
+        """
+        try:
+            with zipfile.ZipFile(self.filePath, 'r') as odfFile:
+                root = ET.fromstring(odfFile.read('meta.xml'))
+        except:
+            return None
+
+        for userDefined in root.iterfind(
+            'office:meta/meta:user-defined',
+            self.NAMESPACES,
+        ):
+            name = userDefined.get(f'{{{self.NAMESPACES["meta"]}}}name')
+            if name == self.FINGERPRINT_NAME:
+                return userDefined.text or None
+
+        return None
+
     def write_content_xml(self):
         super().write()
 
@@ -157,6 +183,15 @@ class OdfFile(FileExport):
         stylesXmlStr = template.safe_substitute(localeMapping)
         return stylesXmlStr
 
+    def _get_fingerprint_data(self):
+        """Generate the strings that the exported document depends on.
+        
+        Add the styles.
+        Extends the superclass method.
+        """
+        yield from super()._get_fingerprint_data()
+        yield self._get_styles_xml_str()
+
     def _set_up(self):
         # Helper method for ZIP file generation.
         # Prepare the temporary directory containing the internal structure
@@ -213,6 +248,8 @@ class OdfFile(FileExport):
             Title=self._escape(self.novel.title),
             Summary=self._escape(self.novel.desc),
             Datetime=datetime.today().replace(microsecond=0).isoformat(),
+            FingerprintName=self.FINGERPRINT_NAME,
+            Fingerprint=self.get_fingerprint(),
         )
         template = Template(self._META_XML)
         stylesXmlStr = template.safe_substitute(metaMapping)
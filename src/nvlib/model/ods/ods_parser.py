@@ -19,6 +19,16 @@ class OdsParser:
     Return a list of rows, containing lists of column cells.
     The novxlib csv import classes thus can be reused.
     """
+    _TABLE = f'{{{OdfFile.NAMESPACES["table"]}}}table'
+    _ROW = f'{{{OdfFile.NAMESPACES["table"]}}}table-row'
+    _ROWS_REPEATED = (
+        f'{{{OdfFile.NAMESPACES["table"]}}}number-rows-repeated'
+    )
+    _COLUMNS_REPEATED = (
+        f'{{{OdfFile.NAMESPACES["table"]}}}number-columns-repeated'
+    )
+    _DATE_VALUE = f'{{{OdfFile.NAMESPACES["office"]}}}date-value'
+    _TIME_VALUE = f'{{{OdfFile.NAMESPACES["office"]}}}time-value'
 
     def get_rows(self, filePath, cellsPerRow):
         """Return a nested list with rows and cells from an ODS document.
@@ -26,78 +36,101 @@ class OdsParser:
         Positional arguments:
             filePath: str -- ODS document path.
             cellsPerRow: int -- Number of cells per row.
-        
-        First unzip the ODS file located at self.filePath, 
-        then parse content.xml.
         """
-        root = ET.fromstring(self._unzip_ods_file(filePath))
-
-        #--- Parse 'content.xml'.
-        body = root.find('office:body', OdfFile.NAMESPACES)
-        spreadsheet = body.find('office:spreadsheet', OdfFile.NAMESPACES)
-        table = spreadsheet.find('table:table', OdfFile.NAMESPACES)
-        rows = []
-        for row in table.iterfind('table:table-row', OdfFile.NAMESPACES):
-            cells = []
-            i = 0
-            for cell in row.iterfind('table:table-cell', OdfFile.NAMESPACES):
-                content = ''
-                odfDate = cell.get(
-                    f'{{{OdfFile.NAMESPACES["office"]}}}date-value'
-                )
-                odfTime = cell.get(
-                    f'{{{OdfFile.NAMESPACES["office"]}}}time-value'
-                )
-                if odfDate:
-                    cells.append(odfDate)
-                elif odfTime:
-                    t = re.search(r'PT(..)H(..)M(..)S', odfTime)
-                    cells.append(f'{t.group(1)}:{t.group(2)}:{t.group(3)}')
-                elif cell.find('text:p', OdfFile.NAMESPACES) is not None:
-                    lines = []
-                    for paragraph in cell.iterfind(
-                        'text:p',
-                        OdfFile.NAMESPACES
-                    ):
-                        lines.append(''.join(t for t in paragraph.itertext()))
-                    content = '\n'.join(lines)
-                    cells.append(content)
-                else:
-                    cells.append(content)
-
-                i += 1
-                if i >= cellsPerRow:
-                    # The cell is excess, created by Calc.
-                    break
+        return list(self.iterate_rows(filePath, cellsPerRow))
 
-                # Add repeated cells.
-                attribute = cell.get(
-                    f'{{{OdfFile.NAMESPACES["table"]}}}'
-                    'number-columns-repeated'
-                )
-                if attribute:
-                    repeat = int(attribute) - 1
-                    for __ in range(repeat):
-                        if i >= cellsPerRow:
-                            # The cell is excess, created by Calc.
-                            break
-
-                        cells.append(content)
-                        i += 1
-            if cells:
-                rows.append(cells)
-                # print(cells)
-        return rows
-
-    def _unzip_ods_file(self, filePath):
-        """Return an xml string from an ODS file specified by filePath."""
+    def iterate_rows(self, filePath, cellsPerRow):
+        """Generate lists of cells from the rows of an ODS document.
+        
+        Positional arguments:
+            filePath: str -- ODS document path.
+            cellsPerRow: int -- Number of cells per row.
+        
+        Parse content.xml incrementally, streaming it 
+        from the zip archive. Only the first table is read.
+        Processed rows are discarded, so the memory needed 
+        does not grow with the number of rows.
+        """
         try:
-            with zipfile.ZipFile(filePath, 'r') as odfFile:
-                content = odfFile.read('content.xml')
-            return content
-
+            odfFile = zipfile.ZipFile(filePath, 'r')
+            content = odfFile.open('content.xml')
         except:
             raise RuntimeError(
                 f'{_("Cannot read file")}: "{norm_path(filePath)}".'
             )
+        with odfFile, content:
+            table = None
+            depth = 0
+            # nesting level within the table
+            for event, element in ET.iterparse(
+                content,
+                events=('start', 'end')
+            ):
+                if event == 'start':
+                    if table is not None:
+                        depth += 1
+                    elif element.tag == self._TABLE:
+                        table = element
+                    continue
+
+                if table is None:
+                    continue
+
+                if element is table:
+                    # Only the first table is read.
+                    break
+
+                depth -= 1
+                if depth > 0 or element.tag != self._ROW:
+                    # Skip rows in row groups, like the tree parser did.
+                    continue
+
+                cells = self._get_cells(element, cellsPerRow)
+                repeat = self._get_repeat(element, self._ROWS_REPEATED)
+                table.remove(element)
+                if not cells:
+                    continue
+
+                if not any(cells):
+                    # Empty rows have the same effect, however repeated.
+                    repeat = 1
+                for __ in range(repeat):
+                    yield cells[:]
+
+    def _get_cell_content(self, cell):
+        # Return the content of a table cell as a string.
+        odfDate = cell.get(self._DATE_VALUE)
+        if odfDate:
+            return odfDate
+
+        odfTime = cell.get(self._TIME_VALUE)
+        if odfTime:
+            t = re.search(r'PT(..)H(..)M(..)S', odfTime)
+            return f'{t.group(1)}:{t.group(2)}:{t.group(3)}'
+
+        lines = []
+        for paragraph in cell.iterfind('text:p', OdfFile.NAMESPACES):
+            lines.append(''.join(t for t in paragraph.itertext()))
+        return '\n'.join(lines)
+
+    def _get_cells(self, row, cellsPerRow):
+        # Return a list with the contents of the row's cells.
+        cells = []
+        for cell in row.iterfind('table:table-cell', OdfFile.NAMESPACES):
+            content = self._get_cell_content(cell)
+            repeat = self._get_repeat(cell, self._COLUMNS_REPEATED)
+            for __ in range(repeat):
+                if len(cells) >= cellsPerRow:
+                    # The cell is excess, created by Calc.
+                    return cells
+
+                cells.append(content)
+        return cells
+
+    def _get_repeat(self, element, attribute):
+        # Return the number of repetitions given by the attribute.
+        try:
+            return max(1, int(element.get(attribute, 1)))
 
+        except ValueError:
+            return 1
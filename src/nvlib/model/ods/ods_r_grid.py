@@ -83,7 +83,7 @@ class OdsRGrid(OdsReader):
         self._read_sections()
 
         #--- plot line titles
-        for i, column in enumerate(self._rows[0]):
+        for i, column in enumerate(self._headerRows[0]):
             if column.startswith(PLOT_LINE_PREFIX):
-                self.novel.plotLines[column].title = self._rows[1][i]
+                self.novel.plotLines[column].title = self._headerRows[1][i]
 
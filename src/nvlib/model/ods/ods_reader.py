@@ -13,6 +13,7 @@ from nvlib.model.file.file_export import FileExport
 from nvlib.model.odf.odf_reader import OdfReader
 from nvlib.model.ods.duration_parser import DurationParser
 from nvlib.model.ods.ods_parser import OdsParser
+from nvlib.novx_globals import CHARACTER_PREFIX
 from nvlib.novx_globals import MAJOR_MARKER
 from nvlib.novx_globals import MINOR_MARKER
 from nvlib.novx_globals import SCENE
@@ -45,9 +46,11 @@ class OdsReader(OdfReader, ABC):
         super().__init__(filePath)
         self._columnDict = None
         # dict: {column title, {element ID, cell content}}
-        self._rows = None
-        # list of lists of cell contents
+        self._headerRows = None
+        # list of lists of cell contents: the first two rows
         self.parser = OdsParser()
+        self.ambiguousTitles = {}
+        # key: element ID, value: list of IDs matching the name given
 
     def add_new_element(self, prevId, row):
         return ''
@@ -56,24 +59,31 @@ class OdsReader(OdfReader, ABC):
     def read(self):
         """Parse the file and get the instance variables.
         
-        Parse the ODS file located at filePath, fetching the rows.
+        Parse the ODS file located at filePath, 
+        filling the column dictionary row by row.
 
         Overrides the superclass method.
         """
         self._columnDict = {}
+        self._headerRows = []
+        self.ambiguousTitles = {}
         cellsPerRow = len(self._columnTitles)
-        self._rows = self.parser.get_rows(self.filePath, cellsPerRow)
-        for title in self._rows[0]:
-            self._columnDict[title] = {}
+        columns = None
         elemId = None
-        for row in self._rows:
+        for row in self.parser.iterate_rows(self.filePath, cellsPerRow):
+            if columns is None:
+                columns = row
+                for title in columns:
+                    self._columnDict[title] = {}
+            if len(self._headerRows) < 2:
+                self._headerRows.append(row)
             if not row[0]:
                 elemId = self.add_new_element(elemId, row)
             else:
                 elemId = row[0]
             if elemId and elemId[:2] in self._idPrefix:
-                for i, col in enumerate(self._columnDict):
-                    self._columnDict[col][elemId] = row[i]
+                for title, cell in zip(columns, row):
+                    self._columnDict[title][elemId] = cell
             else:
                 elemId = None
 
@@ -277,15 +287,17 @@ class OdsReader(OdfReader, ABC):
             except:
                 pass
             else:
-                viewpoint = viewpoint.strip()
-
                 # Get the vp character ID.
-                vpId = None
-                for crId in self.novel.characters:
-                    if self.novel.characters[crId].title == viewpoint:
-                        vpId = crId
-                        break
-
+                vpIds = self.novel.get_ids_by_title(
+                    CHARACTER_PREFIX,
+                    viewpoint
+                ) or [None]
+                vpId = vpIds[0]
+                if len(vpIds) > 1:
+                    self.ambiguousTitles[scId] = vpIds
+                    if self.novel.sections[scId].viewpoint in vpIds:
+                        # Keep the assignment rather than guessing.
+                        vpId = self.novel.sections[scId].viewpoint
                 self.novel.sections[scId].viewpoint = vpId
 
             #--- Scene
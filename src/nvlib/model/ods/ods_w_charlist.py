@@ -4,7 +4,6 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-from string import Template
 
 from nvlib.model.ods.ods_writer import OdsWriter
 from nvlib.novx_globals import CHARLIST_SUFFIX
@@ -210,7 +209,7 @@ class OdsWCharList(OdsWriter):
         #--- $BirthDateCell:
         #    if no section date is given, the whole cell must be empty.
         if characterMapping['BirthDate']:
-            characterMapping['BirthDateCell'] = Template(
+            characterMapping['BirthDateCell'] = self._get_template(
                 self._validBirthDateCell
             ).safe_substitute(characterMapping)
         else:
@@ -219,7 +218,7 @@ class OdsWCharList(OdsWriter):
         #--- $DeathDateCell:
         #    if no section date is given, the whole cell must be empty.
         if characterMapping['DeathDate']:
-            characterMapping['DeathDateCell'] = Template(
+            characterMapping['DeathDateCell'] = self._get_template(
                 self._validDeathDateCell
             ).safe_substitute(characterMapping)
         else:
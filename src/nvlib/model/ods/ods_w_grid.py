@@ -357,10 +357,14 @@ class OdsWGrid(OdsWriter):
                 ),
             )
             plotlineIdCells.append(
-                Template(self._plotlineIdCell).safe_substitute(mapping)
+                self._get_template(
+                    self._plotlineIdCell
+                ).safe_substitute(mapping)
             )
             plotlineTitleCells.append(
-                Template(self._plotlineTitleCell).safe_substitute(mapping)
+                self._get_template(
+                    self._plotlineTitleCell
+                ).safe_substitute(mapping)
             )
         fileHeaderMapping['PlotlineColumns'] = '\n'.join(plotlineColumns)
         fileHeaderMapping['PlotlineIdCells'] = '\n'.join(plotlineIdCells)
@@ -399,7 +403,7 @@ class OdsWGrid(OdsWriter):
         #--- $DateCell: if no section date is given,
         #               the whole cell must be empty.
         if sectionMapping['Date']:
-            sectionMapping['DateCell'] = Template(
+            sectionMapping['DateCell'] = self._get_template(
                 self._validDateCell
             ).safe_substitute(sectionMapping)
         else:
@@ -408,7 +412,7 @@ class OdsWGrid(OdsWriter):
         #--- $TimeCell: if no section time is given,
         #               the whole cell must be empty.
         if sectionMapping['Time']:
-            sectionMapping['TimeCell'] = Template(
+            sectionMapping['TimeCell'] = self._get_template(
                 self._validTimeCell
             ).safe_substitute(sectionMapping)
         else:
@@ -427,7 +431,9 @@ class OdsWGrid(OdsWriter):
                 'ID':plId,
             }
             plotlineCells.append(
-                Template(self._plotlineNoteCell).safe_substitute(mapping)
+                self._get_template(
+                    self._plotlineNoteCell
+                ).safe_substitute(mapping)
             )
         sectionMapping['PlotlineNoteCells'] = '\n'.join(plotlineCells)
 
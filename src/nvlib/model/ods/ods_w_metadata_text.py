@@ -4,7 +4,6 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-from string import Template
 
 from nvlib.model.ods.ods_writer import OdsWriter
 from nvlib.novx_globals import METADATA_TEXT_SUFFIX
@@ -273,10 +272,11 @@ class OdsWMetadataText(OdsWriter):
                 ),
             )
             arcIdCells.append(
-                Template(self._arcIdCell
-            ).safe_substitute(arcMapping))
+                self._get_template(
+                    self._arcIdCell
+                ).safe_substitute(arcMapping))
             arcTitleCells.append(
-                Template(
+                self._get_template(
                     self._arcTitleCell
                 ).safe_substitute(arcMapping))
         mapping['ArcColumns'] = '\n'.join(arcColumns)
@@ -358,7 +358,7 @@ class OdsWMetadataText(OdsWriter):
                 arcNote = ''
             arcMapping = {'ArcNote':arcNote}
             arcNoteCells.append(
-                Template(
+                self._get_template(
                     self._arcNoteCell
                 ).safe_substitute(arcMapping))
         mapping['ArcNoteCells'] = '\n'.join(arcNoteCells)
@@ -167,6 +167,13 @@ class OdsWPlotList(OdsWriter):
         fileHeaderMapping = {'Styles': f'{extraStyles}{extraHeadingStyles}'}
         return fileHeaderMapping
 
+    def _get_project_fingerprint_data(self):
+        """Generate the whole project, serialized as novx XML.
+        
+        Overrides the superclass method.
+        """
+        yield from self._get_novx_fingerprint_data()
+
     def _new_cell(self, text, attr='', link=''):
         """Return the markup for a table cell with text and attributes."""
         if link:
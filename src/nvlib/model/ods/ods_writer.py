@@ -155,6 +155,8 @@ class OdsWriter(OdfFile):
         '    <dc:creator></dc:creator>\n'
         '    <meta:creation-date>${Datetime}Z</meta:creation-date>\n'
         '    <dc:date></dc:date>\n'
+        '    <meta:user-defined meta:name="$FingerprintName">'
+        '$Fingerprint</meta:user-defined>\n'
         '  </office:meta>\n'
         '</office:document-meta>\n'
     )
@@ -0,0 +1,96 @@
+"""Provide a class for caching ODT fragments converted from novx markup.
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from collections import OrderedDict
+from hashlib import sha1
+
+
+class OdtFragmentCache:
+    """Least recently used cache of ODT XML fragments.
+
+    A fragment is identified by the converting function,
+    the hash of the novx markup, and the rendering flags.
+    The cache is emptied when the styles or the document's
+    languages change. If the cached fragments exceed the maximum size,
+    the least recently used fragments are discarded.
+    Since the cache is shared by all ODT writers, fragments not used
+    by one export are kept for the others.
+    """
+
+    def __init__(self, maxSize=10000000):
+        """Optional arguments:
+            maxSize: int -- Maximum number of cached characters.
+        """
+        self.maxSize = maxSize
+        self.size = 0
+        # number of cached characters
+        self._fragments = OrderedDict()
+        self._stylesKey = None
+        self._languages = None
+
+    def begin(self, stylesKey, languages):
+        """Prepare the cache for an export run.
+
+        Positional arguments:
+            stylesKey -- hashable value identifying the styles in use.
+            languages: list[str] -- Ordered list of the document's languages.
+        """
+        languages = tuple(languages or ())
+        if stylesKey != self._stylesKey or languages != self._languages:
+            self.clear()
+        self._stylesKey = stylesKey
+        self._languages = languages
+
+    def clear(self):
+        """Discard all fragments."""
+        self._fragments.clear()
+        self.size = 0
+
+    def get(self, key):
+        """Return the cached fragment, or None if not cached."""
+        fragment = self._fragments.get(key, None)
+        if fragment is not None:
+            self._fragments.move_to_end(key)
+        return fragment
+
+    def get_key(
+        self,
+        converter,
+        xmlString,
+        append,
+        firstInChapter,
+        isEpigraph,
+    ):
+        """Return a cache key for the fragment and its rendering flags.
+
+        Positional arguments:
+            converter -- hashable value identifying the conversion,
+                         e.g. the converting function.
+        """
+        return (
+            converter,
+            sha1(xmlString.encode('utf-8')).digest(),
+            bool(append),
+            bool(firstInChapter),
+            bool(isEpigraph),
+            self._languages,
+        )
+
+    def store(self, key, fragment):
+        """Add a fragment to the cache."""
+        if key in self._fragments:
+            self._discard(key)
+        if len(fragment) > self.maxSize:
+            return
+
+        self._fragments[key] = fragment
+        self.size += len(fragment)
+        while self.size > self.maxSize:
+            self._discard(next(iter(self._fragments)))
+
+    def _discard(self, key):
+        # Remove a fragment from the cache.
+        self.size -= len(self._fragments.pop(key))
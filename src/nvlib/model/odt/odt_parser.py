@@ -74,14 +74,29 @@ class OdtParser(sax.ContentHandler):
         Positional arguments:
             filePath: str -- ODT document path.
         
-        First unzip the ODT file located at self.filePath, 
-        and get languageCode, countryCode, title, desc, and authorName,        
-        Then call the sax parser for content.xml.
+        First get languageCode, countryCode, title, desc, and authorName
+        from the ODT file located at filePath.
+        Then call the sax parser for content.xml, streaming it
+        from the zip archive instead of reading it into memory.
         """
-        styles, meta, content = self._unzip_odt_file(filePath)
-        self._read_styles_xml(styles, OdfFile.NAMESPACES)
-        self._read_meta_xml(meta, OdfFile.NAMESPACES)
-        sax.parseString(content, self)
+        try:
+            odfFile = zipfile.ZipFile(filePath, 'r')
+        except:
+            raise RuntimeError(
+                f'{_("Cannot read file")}: "{norm_path(filePath)}".'
+            )
+        with odfFile:
+            styles, meta = self._read_odt_components(odfFile, filePath)
+            self._read_styles_xml(styles, OdfFile.NAMESPACES)
+            self._read_meta_xml(meta, OdfFile.NAMESPACES)
+            try:
+                content = odfFile.open('content.xml')
+            except:
+                raise RuntimeError(
+                    f'{_("Cannot read file")}: "{norm_path(filePath)}".'
+                )
+            with content:
+                sax.parse(content, self)
 
     def characters(self, content):
         """Receive notification of character data.
@@ -395,23 +410,19 @@ class OdtParser(sax.ContentHandler):
                 )
                 return
 
-    def _unzip_odt_file(self, filePath):
-        # Return three xml strings from from an ODS file
-        # specified by filePath.
+    def _read_odt_components(self, odfFile, filePath):
+        # Return the styles and meta xml strings from the open ODT file.
         try:
-            with zipfile.ZipFile(filePath, 'r') as odfFile:
-                content = odfFile.read('content.xml')
-                styles = odfFile.read('styles.xml')
-                try:
-                    meta = odfFile.read('meta.xml')
-                except KeyError:
-                    # meta.xml may be missing in outlines
-                    # created with e.g. FreeMind
-                    meta = None
-                return styles, meta, content
+            styles = odfFile.read('styles.xml')
+            try:
+                meta = odfFile.read('meta.xml')
+            except KeyError:
+                # meta.xml may be missing in outlines
+                # created with e.g. FreeMind
+                meta = None
+            return styles, meta
 
         except:
             raise RuntimeError(
                 f'{_("Cannot read file")}: "{norm_path(filePath)}".'
             )
-
@@ -18,18 +18,32 @@ class OdtRFormatted(OdtReader):
     def __init__(self, filePath, **kwargs):
         super().__init__(filePath)
         self.splitter = self.SPLITTER()
+        self.changedSections = []
+        # list of IDs of the sections whose content has changed
+        self._sectionContents = {}
+        self._sectionChanged = False
+        # True if the section being updated has changed
 
     def read(self):
         """Parse the file and get the instance variables.
         
+        Update only the sections whose content has changed,
+        and list their IDs in changedSections.
         Extends the superclass method.
         """
         self.novel.languages = []
+        self.changedSections = []
+        self._sectionContents = {}
         super().read()
+        self._update_sections()
 
         # Split sections, if necessary.
         self.projectStructureModified = self.splitter.split_sections(self.novel)
 
+    def _register_change(self):
+        # Callback for the section being updated.
+        self._sectionChanged = True
+
     def _remove_redundant_tags(self, text):
         for tag in(
             'em',
@@ -37,3 +51,28 @@ class OdtRFormatted(OdtReader):
         ):
             text = text.replace(f'</{tag}><{tag}>', '')
         return text
+
+    def _set_section_content(self, scId, text):
+        # Collect the section content for the batch update after parsing.
+        if not scId in self.novel.sections:
+            raise KeyError(scId)
+
+        self._sectionContents[scId] = text
+
+    def _update_sections(self):
+        # Assign the collected content to the changed sections only.
+        # Notify the owner once for the whole batch.
+        for scId in self._sectionContents:
+            section = self.novel.sections[scId]
+            on_element_change = section.on_element_change
+            section.on_element_change = self._register_change
+            self._sectionChanged = False
+            try:
+                section.sectionContent = self._sectionContents[scId]
+            finally:
+                section.on_element_change = on_element_change
+            if self._sectionChanged:
+                self.changedSections.append(scId)
+        self._sectionContents = {}
+        if self.changedSections:
+            self.novel.on_element_change()
@@ -68,7 +68,7 @@ class OdtRManuscript(OdtRFormatted):
         if tag == 'div':
             text = ''.join(self._lines)
             text = self._remove_redundant_tags(text)
-            self.novel.sections[self._scId].sectionContent = text
+            self._set_section_content(self._scId, text)
             self._lines.clear()
             self._scId = None
             return
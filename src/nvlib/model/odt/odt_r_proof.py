@@ -60,9 +60,7 @@ class OdtRProof(OdtRFormatted):
                     self._lines.pop()
                     # remove the paragraph tag
                     text = ''.join(self._lines)
-                    self.novel.sections[
-                        self._scId
-                    ].sectionContent = text.strip()
+                    self._set_section_content(self._scId, text.strip())
                     self._lines.clear()
                 self._scId = None
                 self._content = False
@@ -105,15 +105,28 @@ class OdtWFormatted(OdtWriter):
         )
         return projectTemplateMapping
 
-    def _get_text(self):
+    def _get_project_fingerprint_data(self):
+        """Generate the strings of the project data read by the export.
+        
+        Only the file header and the chapters are processed.
+        Overrides the superclass method.
+        """
+        if self._overrides_processing(OdtWFormatted):
+            yield from self._get_novx_fingerprint_data()
+            return
+
+        self._prepare_filters()
+        yield from self._get_novel_fingerprint_data()
+        yield from self._get_fileHeader()
+        yield from self._get_chapters_fingerprint_data()
+
+    def _get_text_parts(self):
         """Call all processing methods.
         
-        Return a string to be written to the output file.
+        Generate the strings to be written to the output file.
         Overrides the superclass method.
         """
-        lines = self._get_fileHeader()
-        lines.extend(self._get_chapters())
-        lines.append(self._fileFooter)
-        text = ''.join(lines)
-        return text
+        yield from self._get_fileHeader()
+        yield from self._get_chapter_parts()
+        yield self._fileFooter
 
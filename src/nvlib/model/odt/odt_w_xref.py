@@ -4,7 +4,6 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-from string import Template
 
 from nvlib.model.data.cross_references import CrossReferences
 from nvlib.model.odt.odt_writer import OdtWriter
@@ -101,7 +100,7 @@ class OdtWXref(OdtWriter):
         Overrides the superclass method.
         """
         lines = []
-        headerTemplate = Template(self._scnPerChrTemplate)
+        headerTemplate = self._get_template(self._scnPerChrTemplate)
         for crId in self._xr.scnPerChr:
             if self._xr.scnPerChr[crId]:
                 lines.append(
@@ -122,8 +121,8 @@ class OdtWXref(OdtWriter):
         Return a list of strings.
         """
         lines = []
-        headerTemplate = Template(self._chrPerTagTemplate)
-        template = Template(self._characterTemplate)
+        headerTemplate = self._get_template(self._chrPerTagTemplate)
+        template = self._get_template(self._characterTemplate)
         for tag in self._xr.chrPerTag:
             if self._xr.chrPerTag[tag]:
                 lines.append(
@@ -146,7 +145,7 @@ class OdtWXref(OdtWriter):
         Overrides the superclass method.
         """
         lines = []
-        headerTemplate = Template(self._scnPerItmTemplate)
+        headerTemplate = self._get_template(self._scnPerItmTemplate)
         for itId in self._xr.scnPerItm:
             if self._xr.scnPerItm[itId]:
                 lines.append(
@@ -163,8 +162,8 @@ class OdtWXref(OdtWriter):
         Return a list of strings.
         """
         lines = []
-        headerTemplate = Template(self._itmPerTagTemplate)
-        template = Template(self._itemTemplate)
+        headerTemplate = self._get_template(self._itmPerTagTemplate)
+        template = self._get_template(self._itemTemplate)
         for tag in self._xr.itmPerTag:
             if self._xr.itmPerTag[tag]:
                 lines.append(
@@ -187,7 +186,7 @@ class OdtWXref(OdtWriter):
         Overrides the superclass method.
         """
         lines = []
-        headerTemplate = Template(self._scnPerLocTemplate)
+        headerTemplate = self._get_template(self._scnPerLocTemplate)
         for lcId in self._xr.scnPerLoc:
             if self._xr.scnPerLoc[lcId]:
                 lines.append(
@@ -204,8 +203,8 @@ class OdtWXref(OdtWriter):
         Return a list of strings.
         """
         lines = []
-        headerTemplate = Template(self._locPerTagTemplate)
-        template = Template(self._locationTemplate)
+        headerTemplate = self._get_template(self._locPerTagTemplate)
+        template = self._get_template(self._locationTemplate)
         for tag in self._xr.locPerTag:
             if self._xr.locPerTag[tag]:
                 lines.append(
@@ -253,9 +252,9 @@ class OdtWXref(OdtWriter):
         lines = []
         for scId in sections:
             if self.novel.sections[scId].scType == 0:
-                template = Template(self._sectionTemplate)
+                template = self._get_template(self._sectionTemplate)
             elif self.novel.sections[scId].scType == 1:
-                template = Template(self._unusedSectionTemplate)
+                template = self._get_template(self._unusedSectionTemplate)
             else:
                 continue
 
@@ -270,7 +269,7 @@ class OdtWXref(OdtWriter):
         Return a list of strings.
         """
         lines = []
-        headerTemplate = Template(self._scnPerTagtemplate)
+        headerTemplate = self._get_template(self._scnPerTagtemplate)
         for tag in self._xr.scnPerTag:
             if self._xr.scnPerTag[tag]:
                 lines.append(
@@ -292,20 +291,19 @@ class OdtWXref(OdtWriter):
         )
         return tagMapping
 
-    def _get_text(self):
+    def _get_text_parts(self):
         """Call all processing methods.
         
-        Return a string to be written to the output file.
+        Generate the strings to be written to the output file.
         Overrides the superclass method.
         """
         self._xr.generate_xref(self.novel)
-        lines = self._get_fileHeader()
-        lines.extend(self._get_characters())
-        lines.extend(self._get_locations())
-        lines.extend(self._get_items())
-        lines.extend(self._get_sectionTags())
-        lines.extend(self._get_characterTags())
-        lines.extend(self._get_locationTags())
-        lines.extend(self._get_itemTags())
-        lines.append(self._fileFooter)
-        return ''.join(lines)
+        yield from self._get_fileHeader()
+        yield from self._get_characters()
+        yield from self._get_locations()
+        yield from self._get_items()
+        yield from self._get_sectionTags()
+        yield from self._get_characterTags()
+        yield from self._get_locationTags()
+        yield from self._get_itemTags()
+        yield self._fileFooter
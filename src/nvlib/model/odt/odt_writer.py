@@ -6,11 +6,13 @@ Copyright (c) Peter Triesberger
 For further information see https://github.com/peter88213/novelibre
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+import os
 import re
 from xml import sax
 from xml.etree import ElementTree as ET
 
 from nvlib.model.odf.odf_file import OdfFile
+from nvlib.model.odt.odt_fragment_cache import OdtFragmentCache
 from nvlib.model.odt.novx_to_odt import NovxToOdt
 from nvlib.nv_locale import _
 
@@ -107,6 +109,8 @@ class OdtWriter(OdfFile):
         '    <dc:creator></dc:creator>\n'
         '    <meta:creation-date>${Datetime}Z</meta:creation-date>\n'
         '    <dc:date></dc:date>\n'
+        '    <meta:user-defined meta:name="$FingerprintName">'
+        '$Fingerprint</meta:user-defined>\n'
         '  </office:meta>\n'
         '</office:document-meta>\n'
     )
@@ -585,6 +589,12 @@ class OdtWriter(OdfFile):
 
     _MIMETYPE = 'application/vnd.oasis.opendocument.text'
 
+    _fragmentCache = OdtFragmentCache()
+    # Converted section content, shared by all ODT writers,
+    # so that re-exporting skips the unchanged sections.
+    # The cache size is limited; the fragments are keyed
+    # by the converting method and the content parser.
+
     def __init__(self, filePath, **kwargs):
         """Create a temporary directory for zipfile generation.
         
@@ -656,8 +666,11 @@ class OdtWriter(OdfFile):
         
         Extends the superclass method.
         """
-        if self.novel.languages is None:
-            self.novel.get_languages()
+        self.novel.get_languages()
+        self._fragmentCache.begin(
+            self._get_styles_key(),
+            self.novel.languages,
+        )
         return super().write()
 
     def _convert_from_novx(
@@ -694,14 +707,25 @@ class OdtWriter(OdfFile):
             return sax.saxutils.escape(text)
 
         if xml:
-            self._contentParser.feed(
+            key = self._fragmentCache.get_key(
+                (type(self)._convert_from_novx, type(self._contentParser)),
                 text,
-                self.novel.languages,
                 append,
                 firstInChapter,
                 isEpigraph,
             )
-            return ''.join(self._contentParser.odtLines)
+            fragment = self._fragmentCache.get(key)
+            if fragment is None:
+                self._contentParser.feed(
+                    text,
+                    self.novel.languages,
+                    append,
+                    firstInChapter,
+                    isEpigraph,
+                )
+                fragment = ''.join(self._contentParser.odtLines)
+                self._fragmentCache.store(key, fragment)
+            return fragment
 
         # Convert plain text into XML.
         lines = sax.saxutils.escape(text).split('\n')
@@ -733,6 +757,16 @@ class OdtWriter(OdfFile):
             ).replace('<text:p', '\n<text:p')
         return fileHeaderMapping
 
+    def _get_fingerprint_data(self):
+        """Generate the strings that the exported document depends on.
+        
+        Add the languages used in the document.
+        Extends the superclass method.
+        """
+        self.novel.get_languages()
+        yield from super()._get_fingerprint_data()
+        yield ' '.join(self.novel.languages)
+
     def _get_sectionMapping(
             self,
             scId,
@@ -760,6 +794,19 @@ class OdtWriter(OdfFile):
         sectionMapping['sectionTitle'] = _('Section')
         return sectionMapping
 
+    def _get_styles_key(self):
+        # Return a value that changes when the styles change.
+        try:
+            stylesTimestamp = os.path.getmtime(self.userStylesXml)
+        except:
+            stylesTimestamp = None
+        return (
+            self.userStylesXml,
+            stylesTimestamp,
+            self.novel.languageCode,
+            self.novel.countryCode,
+        )
+
     def _get_styles_xml_str(self):
         """Return the styles.xml data as a string.
         
@@ -0,0 +1,115 @@
+"""Measure the memory footprint of a 10,000-section project.
+
+Compare the compact element representation with a per-instance
+__dict__ layout holding the same attributes.
+
+Usage: benchmark_memory.py [number of sections]
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import sys
+import tracemalloc
+
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.character import Character
+from nvlib.model.data.section import Section
+from nvlib.novx_globals import CHAPTER_PREFIX
+from nvlib.novx_globals import CHARACTER_PREFIX
+from nvlib.novx_globals import SECTION_PREFIX
+
+SECTIONS_PER_CHAPTER = 20
+CHARACTERS = 50
+
+
+class DictElement:
+    """Element with a per-instance __dict__, as used up to now."""
+
+    def __init__(self, attributes):
+        for attribute, value in attributes.items():
+            if isinstance(value, dict):
+                value = dict(value)
+            elif isinstance(value, (list, tuple)):
+                value = list(value)
+            elif isinstance(value, str):
+                value = ''.join(list(value))
+                # a new string object, like the XML parser creates
+            setattr(self, attribute, value)
+
+
+def slot_values(element):
+    """Return a dictionary of the element's slot values."""
+    values = {}
+    for cls in type(element).__mro__:
+        for attribute in getattr(cls, '__slots__', ()):
+            values[attribute] = getattr(element, attribute)
+    return values
+
+
+def build_project(numberOfSections):
+    """Return a dictionary with chapters, sections, and characters."""
+    elements = {}
+    for i in range(1, CHARACTERS + 1):
+        elements[f'{CHARACTER_PREFIX}{i}'] = Character(
+            title=f'Character {i}',
+            desc='',
+            notes='',
+            isMajor=i < 5,
+        )
+    chapterCount = 0
+    for i in range(1, numberOfSections + 1):
+        if i % SECTIONS_PER_CHAPTER == 1:
+            chapterCount += 1
+            elements[f'{CHAPTER_PREFIX}{chapterCount}'] = Chapter(
+                title=f'Chapter {chapterCount}',
+                chLevel=2,
+                chType=0,
+            )
+        viewpoint = f'{CHARACTER_PREFIX}{i % CHARACTERS + 1}'
+        section = Section(
+            title=f'Section {i}',
+            desc='A short description of the section.',
+            scType=0,
+            scene=1,
+            status=2,
+            viewpoint=viewpoint,
+            characters=[viewpoint],
+            tags=['draft'],
+        )
+        section.sectionContent = f'<p>Section {i} content.</p>'
+        elements[f'{SECTION_PREFIX}{i}'] = section
+    return elements
+
+
+def measure(function, *args):
+    """Return the result of function and the allocated memory in bytes."""
+    tracemalloc.start()
+    result = function(*args)
+    size, __ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def run(numberOfSections):
+    compactElements, compactSize = measure(build_project, numberOfSections)
+    dictElements, dictSize = measure(
+        lambda elements: {
+            elemId: DictElement(slot_values(elements[elemId]))
+            for elemId in elements
+        },
+        compactElements,
+    )
+    print(f'Sections:         {numberOfSections}')
+    print(f'Elements:         {len(compactElements)}')
+    print(f'__dict__ layout:  {dictSize / 1024 / 1024:.2f} MiB')
+    print(f'Compact layout:   {compactSize / 1024 / 1024:.2f} MiB')
+    print(f'Savings:          {(1 - compactSize / dictSize) * 100:.0f} %')
+    return dictElements
+
+
+if __name__ == '__main__':
+    try:
+        run(int(sys.argv[1]))
+    except IndexError:
+        run(10000)
@@ -0,0 +1,235 @@
+"""Compare the section splitter with the previous implementation.
+
+Split a reimported manuscript with many chapter and section dividers,
+and check that both implementations produce the same project.
+
+Usage: benchmark_splitter.py [number of chapters]
+
+Copyright (c) Peter Triesberger
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import sys
+from time import perf_counter
+
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.content_splitter import ContentSplitter
+from nvlib.model.data.id_generator import new_id
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+from nvlib.novx_globals import CHAPTER_PREFIX
+from nvlib.novx_globals import CH_ROOT
+from nvlib.novx_globals import SECTION_PREFIX
+from nvlib.nv_locale import _
+
+SECTIONS_PER_CHAPTER = 5
+PARAGRAPHS_PER_SECTION = 10
+
+
+class LegacyContentSplitter(ContentSplitter):
+    """Content splitter with the previous split algorithm."""
+
+    def split_sections(self, novel):
+        """Split sections like the previous implementation.
+
+        Overrides the superclass method.
+        """
+
+        # Process chapters and sections.
+        sectionsSplit = False
+        chIndex = 0
+        newLines = []
+        for scanChId in list(novel.tree.get_children(CH_ROOT)):
+            # a copy, as returned by ttk.Treeview.get_children()
+            scList = novel.tree.get_children(scanChId)
+            novel.tree.delete_children(scanChId)
+            chId = scanChId
+            for scanScId in scList:
+                scId = scanScId
+                novel.tree.append(chId, scId)
+                if not self._contains_heading(novel, scId):
+                    continue
+
+                lines = self._get_lines(novel, scanScId)
+                newLines.clear()
+                inSection = True
+                sectionSplitCount = 0
+
+                # Search section content for dividers.
+                for line in lines:
+                    plainLine = self._stripped_line(line)
+
+                    if '#' in plainLine:
+                        heading = plainLine.strip('# ').split(
+                            self.DESC_SEPARATOR)
+                        title = heading[0]
+                        if len(heading) > 1:
+                            desc = heading[1].strip()
+                        else:
+                            desc = ''
+
+                    if plainLine.startswith(self.SECTION_SEPARATOR):
+                        # Split the section.
+                        if inSection:
+                            self._set_text(novel, scId, newLines)
+                        newLines.clear()
+                        sectionSplitCount += 1
+                        newScId = new_id(
+                            novel.sections,
+                            prefix=SECTION_PREFIX,
+                        )
+                        self.create_section(
+                            novel,
+                            newScId,
+                            novel.sections[scId],
+                            sectionSplitCount,
+                            title,
+                            desc,
+                            plainLine.startswith(
+                                self.APPENDED_SECTION_SEPARATOR)
+                        )
+                        novel.tree.append(chId, newScId)
+                        scId = newScId
+                        sectionsSplit = True
+                        inSection = True
+
+                    elif plainLine.startswith(self.CHAPTER_SEPARATOR):
+                        # Start a new chapter.
+                        if inSection:
+                            self._set_text(novel, scId, newLines)
+                            newLines.clear()
+                            inSection = False
+                        newChId = new_id(
+                            novel.chapters,
+                            prefix=CHAPTER_PREFIX,
+                        )
+                        if not title:
+                            title = _('New Chapter')
+                        self.create_chapter(novel, newChId, title, desc, 2)
+                        chIndex += 1
+                        novel.tree.insert(CH_ROOT, chIndex, newChId)
+                        chId = newChId
+                        sectionsSplit = True
+
+                    elif plainLine.startswith(self.PART_SEPARATOR):
+                        # start a new part.
+                        if inSection:
+                            self._set_text(novel, scId, newLines)
+                            newLines.clear()
+                            inSection = False
+                        newChId = new_id(
+                            novel.chapters,
+                            prefix=CHAPTER_PREFIX,
+                        )
+                        if not title:
+                            title = _('New Part')
+                        self.create_chapter(novel, newChId, title, desc, 1)
+                        chIndex += 1
+                        novel.tree.insert(CH_ROOT, chIndex, newChId)
+                        chId = newChId
+
+                    elif not inSection:
+                        # Append a section without heading to
+                        # a new chapter or part.
+                        newLines.append(line)
+                        sectionSplitCount += 1
+                        newScId = new_id(
+                            novel.sections,
+                            prefix=SECTION_PREFIX,
+                        )
+                        self.create_section(
+                            novel,
+                            newScId,
+                            novel.sections[scId],
+                            sectionSplitCount,
+                            '',
+                            '',
+                            False,
+                        )
+                        novel.tree.append(chId, newScId)
+                        scId = newScId
+                        sectionsSplit = True
+                        inSection = True
+
+                    else:
+                        newLines.append(line)
+
+                if inSection:
+                    self._set_text(novel, scId, newLines)
+            chIndex += 1
+        return sectionsSplit
+
+
+def build_project(numberOfChapters):
+    """Return a novel as reimported from a manuscript with dividers.
+
+    The first chapter of each part holds all the part's text,
+    with dividers for the following chapters and sections.
+    """
+    novel = Novel(tree=NvTree())
+    paragraphs = ''.join(
+        f'<p>Paragraph {i} with <em>some</em> words.</p>'
+        for i in range(PARAGRAPHS_PER_SECTION)
+    )
+    scCount = 0
+    for chCount in range(1, numberOfChapters + 1, 10):
+        chId = f'{CHAPTER_PREFIX}{chCount}'
+        novel.chapters[chId] = Chapter(title=f'Chapter {chCount}')
+        novel.tree.append(CH_ROOT, chId)
+        lines = []
+        for i in range(chCount, min(chCount + 10, numberOfChapters + 1)):
+            if i > chCount:
+                lines.append(f'<h2>## Chapter {i}|Description {i}</h2>')
+            for j in range(SECTIONS_PER_CHAPTER):
+                if i > chCount or j > 0:
+                    lines.append(f'<h3>### Section {i}.{j}</h3>')
+                lines.append(paragraphs)
+        scCount += 1
+        scId = f'{SECTION_PREFIX}{scCount}'
+        novel.sections[scId] = Section(scType=0, status=1)
+        novel.sections[scId].sectionContent = ''.join(lines)
+        novel.tree.append(chId, scId)
+    return novel
+
+
+def get_structure(novel):
+    """Return a comparable representation of the novel's structure."""
+    structure = []
+    for chId in novel.tree.get_children(CH_ROOT):
+        structure.append((chId, novel.chapters[chId].title))
+        for scId in novel.tree.get_children(chId):
+            section = novel.sections[scId]
+            structure.append((scId, section.title, section.sectionContent))
+    return structure
+
+
+def measure(splitter, novel):
+    """Return the seconds spent splitting the novel's sections."""
+    start = perf_counter()
+    splitter.split_sections(novel)
+    return perf_counter() - start
+
+
+def run(numberOfChapters):
+    legacyNovel = build_project(numberOfChapters)
+    novel = build_project(numberOfChapters)
+    legacyTime = measure(LegacyContentSplitter(), legacyNovel)
+    newTime = measure(ContentSplitter(), novel)
+    print(f'Chapters:         {numberOfChapters}')
+    print(f'Sections:         {len(novel.sections)}')
+    print(f'Previous:         {legacyTime * 1000:.0f} ms')
+    print(f'Single pass:      {newTime * 1000:.0f} ms')
+    print(f'Speedup:          {legacyTime / newTime:.1f}')
+    if get_structure(novel) != get_structure(legacyNovel):
+        print('The results differ!')
+        return False
+
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        run(int(sys.argv[1]))
+    except IndexError:
+        run(300)
@@ -0,0 +1,222 @@
+"""Regression test for the multi-element clipboard transfer.
+
+Test copying, cutting, and pasting several elements
+as a single batch of changes.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.controller.services.clipboard_manager import ClipboardManager
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.nv_model import NvModel
+from nvlib.novx_globals import CH_ROOT
+from nvlib.novx_globals import CR_ROOT
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+
+
+class Tree(NvTree):
+    """NvTree with the Treeview behavior used by the clipboard."""
+
+    def __init__(self):
+        super().__init__()
+        self.on_element_change = self.do_nothing
+
+    def delete(self, *items):
+        super().delete(*items)
+        self.on_element_change()
+
+    def do_nothing(self):
+        pass
+
+    def index(self, item):
+        return self.get_children(self.parent(item)).index(item)
+
+    def insert(self, parent, index, iid):
+        if index == 'end':
+            index = len(self.get_children(parent))
+        super().insert(parent, index, iid)
+        self.on_element_change()
+
+    def parent(self, item):
+        for root, children in self.roots.items():
+            if item in children:
+                return root
+
+        return super().parent(item)
+
+    def prev(self, item):
+        index = self.index(item)
+        if index == 0:
+            return ''
+
+        return self.get_children(self.parent(item))[index - 1]
+
+
+class Root:
+
+    def __init__(self):
+        self.clipboard = ''
+
+    def clipboard_append(self, text):
+        self.clipboard += text.decode()
+
+    def clipboard_clear(self):
+        self.clipboard = ''
+
+    def clipboard_get(self):
+        return self.clipboard
+
+    def update(self):
+        pass
+
+
+class TreeView:
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.selection = []
+
+    def go_to_node(self, node):
+        self.selection = [node]
+
+
+class View:
+
+    def __init__(self, tree):
+        self.root = Root()
+        self.tv = TreeView(tree)
+
+    @property
+    def selectedNode(self):
+        return self.tv.selection[0]
+
+    @property
+    def selectedNodes(self):
+        return self.tv.selection
+
+
+class Controller:
+
+    def __init__(self, model):
+        self._mdl = model
+
+    def check_lock(self):
+        return False
+
+    def refresh_tree(self):
+        self._mdl.renumber_chapters()
+
+
+class Observer:
+
+    def __init__(self):
+        self.refreshes = 0
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+class ClipboardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = NvModel()
+        self.model.tree = Tree()
+        self.model.open_project(f'{DATA_PATH}normal.novx')
+        self.observer = Observer()
+        self.model.add_observer(self.observer)
+        self.view = View(self.model.tree)
+        self.clipboard = ClipboardManager(
+            self.model,
+            self.view,
+            Controller(self.model),
+        )
+
+    def test_batch(self):
+        self.model.begin_batch()
+        chIds = [
+            self.model.add_new_chapter(targetNode='')
+            for __ in range(3)
+        ]
+        self.assertEqual(self.observer.refreshes, 0)
+        self.model.end_batch()
+        self.assertEqual(self.observer.refreshes, 1)
+        self.assertTrue(self.model.isModified)
+        self.assertEqual(len(set(chIds)), 3)
+        for chId in chIds:
+            self.assertIn(chId, self.model.novel.chapters)
+
+    def test_copy_paste(self):
+        chIds = self.model.tree.get_children(CH_ROOT)[:2]
+        crIds = self.model.tree.get_children(CR_ROOT)[:2]
+        scIds = self.model.tree.get_children(chIds[0])
+        self.view.tv.selection = chIds + scIds + crIds
+        self.clipboard.copy_element()
+        self.assertEqual(
+            self.view.root.clipboard.count('<CHAPTER'),
+            2,
+        )
+        self.assertEqual(
+            self.view.root.clipboard.count('<SECTION'),
+            len(scIds) + len(self.model.tree.get_children(chIds[1])),
+        )
+
+        numberOfChapters = len(self.model.novel.chapters)
+        numberOfCharacters = len(self.model.novel.characters)
+        self.view.tv.selection = [chIds[1]]
+        self.observer.refreshes = 0
+        self.clipboard.paste_element()
+        self.assertEqual(self.observer.refreshes, 1)
+        self.assertEqual(
+            len(self.model.novel.chapters),
+            numberOfChapters + 2,
+        )
+        self.assertEqual(
+            len(self.model.novel.characters),
+            numberOfCharacters + 2,
+        )
+
+        # The pasted chapters follow the selected chapter.
+        chapters = self.model.tree.get_children(CH_ROOT)
+        index = chapters.index(chIds[1])
+        for i, chId in enumerate(chapters[index + 1:index + 3]):
+            self.assertEqual(
+                self.model.novel.chapters[chId].title,
+                self.model.novel.chapters[chIds[i]].title,
+            )
+            self.assertEqual(
+                len(self.model.tree.get_children(chId)),
+                len(self.model.tree.get_children(chIds[i])),
+            )
+        self.assertEqual(self.view.selectedNode, chapters[index + 1])
+
+    def test_cut(self):
+        crIds = self.model.tree.get_children(CR_ROOT)[:3]
+        titles = [
+            self.model.novel.characters[crId].title for crId in crIds
+        ]
+        self.view.tv.selection = list(crIds)
+        self.observer.refreshes = 0
+        self.clipboard.cut_element()
+        self.assertEqual(self.observer.refreshes, 1)
+        for crId in crIds:
+            self.assertNotIn(crId, self.model.novel.characters)
+
+        self.view.tv.selection = [CR_ROOT]
+        self.clipboard.paste_element()
+        self.assertEqual(
+            [
+                self.model.novel.characters[crId].title
+                for crId in self.model.tree.get_children(CR_ROOT)[-3:]
+            ],
+            titles,
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
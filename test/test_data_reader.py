@@ -0,0 +1,93 @@
+"""Regression test for the XML data file readers.
+
+Test indexing and selectively reading the XML data files.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.novx.character_data_reader import CharacterDataReader
+from nvlib.model.novx.data_writer import DataWriter
+from nvlib.model.novx.location_data_reader import LocationDataReader
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.plot_line_reader import PlotLineReader
+import unittest
+
+DATA_PATH = '../test/data/_full/'
+TEST_EXEC_PATH = '../test/tmp/'
+TEST_PROJECT = f'{TEST_EXEC_PATH}data.novx'
+
+
+class DataReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(TEST_EXEC_PATH, exist_ok=True)
+        self.source = NovxFile(f'{DATA_PATH}normal.novx')
+        self.source.novel = Novel(tree=NvTree())
+        self.source.read()
+        target = DataWriter(TEST_PROJECT)
+        target.novel = self.source.novel
+        target.write()
+
+    def tearDown(self):
+        for suffix in ('Characters', 'Locations', 'Items', 'Plotlines'):
+            try:
+                os.remove(f'{TEST_EXEC_PATH}data_{suffix}.xml')
+            except:
+                pass
+
+    def test_read_index(self):
+        reader = CharacterDataReader(
+            f'{TEST_EXEC_PATH}data_Characters.xml'
+        )
+        self.assertEqual(
+            reader.read_index(),
+            {
+                crId: character.title
+                for crId, character in self.source.novel.characters.items()
+            },
+        )
+
+        # A data file of another type has no matching elements.
+        reader = LocationDataReader(f'{TEST_EXEC_PATH}data_Characters.xml')
+        self.assertEqual(reader.read_index(), {})
+
+    def test_read_selection(self):
+        crIds = list(self.source.novel.characters)
+        reader = CharacterDataReader(
+            f'{TEST_EXEC_PATH}data_Characters.xml'
+        )
+        reader.novel = Novel(tree=NvTree())
+        reader.read(elementIds={crIds[-1]})
+        self.assertEqual(list(reader.novel.characters), [crIds[-1]])
+        self.assertEqual(
+            reader.novel.characters[crIds[-1]].desc,
+            self.source.novel.characters[crIds[-1]].desc,
+        )
+
+        reader.novel = Novel(tree=NvTree())
+        reader.read()
+        self.assertEqual(list(reader.novel.characters), crIds)
+
+    def test_read_plot_lines(self):
+        plIds = list(self.source.novel.plotLines)
+        reader = PlotLineReader(f'{TEST_EXEC_PATH}data_Plotlines.xml')
+        reader.novel = Novel(tree=NvTree())
+        reader.read(elementIds={plIds[0]})
+        self.assertEqual(list(reader.novel.plotLines), [plIds[0]])
+        self.assertEqual(
+            reader.novel.tree.get_children(plIds[0]),
+            self.source.novel.tree.get_children(plIds[0]),
+        )
+        self.assertEqual(reader.novel.plotLines[plIds[0]].sections, [])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Regression test for the compact element representation.
+
+Test the slots, the shared empty defaults, pickling, and copying.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import copy
+import pickle
+
+from nvlib.model.data.basic_element import EMPTY_DICT
+from nvlib.model.data.basic_element import EMPTY_LIST
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.character import Character
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.plot_line import PlotLine
+from nvlib.model.data.plot_point import PlotPoint
+from nvlib.model.data.section import Section
+from nvlib.model.data.world_element import WorldElement
+from nvlib.model.novx.novx_file import NovxFile
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+
+
+class ElementSlotsTest(unittest.TestCase):
+
+    def test_slots(self):
+        for elementClass in (
+            Chapter,
+            Character,
+            PlotLine,
+            PlotPoint,
+            Section,
+            WorldElement,
+        ):
+            element = elementClass()
+            self.assertFalse(hasattr(element, '__dict__'))
+
+    def test_shared_defaults(self):
+        section = Section()
+        self.assertIs(section._links, EMPTY_DICT)
+        self.assertIs(section._tags, EMPTY_LIST)
+        self.assertIs(Section()._links, section._links)
+
+        # The getters return mutable copies.
+        section.tags.append('tag')
+        section.links['path'] = 'full path'
+        self.assertEqual(section.tags, [])
+        self.assertEqual(section.links, {})
+        self.assertIs(section._tags, EMPTY_LIST)
+
+        section.tags = ['tag']
+        section.tags.append('other tag')
+        self.assertEqual(section.tags, ['tag'])
+
+        section.tags = None
+        self.assertIsNone(section.tags)
+
+    def test_pickle(self):
+        section = Section(title='Title', tags=['tag'], scType=0)
+        section.sectionContent = '<p>Text</p>'
+        restored = pickle.loads(pickle.dumps(section))
+        self.assertIs(restored._links, EMPTY_DICT)
+        self.assertIs(restored._fields, EMPTY_DICT)
+        self.assertEqual(restored.title, 'Title')
+        self.assertEqual(restored.tags, ['tag'])
+        self.assertEqual(restored.sectionContent, '<p>Text</p>')
+
+        source = NovxFile(f'{DATA_PATH}normal.novx')
+        source.novel = Novel(tree=NvTree())
+        source.read()
+        novel = pickle.loads(pickle.dumps(source.novel))
+        for scId, section in source.novel.sections.items():
+            self.assertEqual(novel.sections[scId].title, section.title)
+            self.assertEqual(
+                novel.sections[scId].sectionContent,
+                section.sectionContent,
+            )
+
+    def test_copy(self):
+        character = Character(title='Name', links={'path': 'full path'})
+        for duplicate in (copy.copy(character), copy.deepcopy(character)):
+            self.assertEqual(duplicate.title, 'Name')
+            self.assertEqual(duplicate.links, {'path': 'full path'})
+            self.assertIs(duplicate._fields, EMPTY_DICT)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Regression test for the template-based file export.
+
+Test the streamed output, the template method hooks,
+and the error handling.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.file.file_export import FileExport
+from nvlib.model.novx.novx_file import NovxFile
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+TEST_EXEC_PATH = '../test/tmp/'
+TEST_EXP = f'{TEST_EXEC_PATH}export.txt'
+
+
+class TextExport(FileExport):
+    EXTENSION = '.txt'
+    _fileHeader = 'Header\n'
+    _chapterTemplate = '# $Title\n'
+    _sectionTemplate = '## $Title\n'
+    _characterTemplate = '* $Title\n'
+    _fileFooter = 'Footer\n'
+
+
+class ChaptersOverridden(TextExport):
+
+    def _get_chapters(self):
+        lines = super()._get_chapters()
+        lines.append('Extra chapter\n')
+        return lines
+
+
+class TextOverridden(TextExport):
+
+    def _get_text(self):
+        return f'{super()._get_text()}Extra text\n'
+
+
+class BrokenExport(TextExport):
+
+    def _get_characters(self):
+        raise ValueError
+
+
+class FileExportTest(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(TEST_EXEC_PATH, exist_ok=True)
+        self.source = NovxFile(f'{DATA_PATH}normal.novx')
+        self.source.novel = Novel(tree=NvTree())
+        self.source.read()
+
+    def tearDown(self):
+        for filePath in (TEST_EXP, f'{TEST_EXP}.bak'):
+            try:
+                os.remove(filePath)
+            except:
+                pass
+
+    def test_streamed_output(self):
+        target = TextExport(TEST_EXP)
+        target.novel = self.source.novel
+        expected = target._get_text()
+        self.assertTrue(expected.startswith('Header\n# '))
+        self.assertTrue(expected.endswith('Footer\n'))
+        target.write()
+        self.assertEqual(self._read_export(), expected)
+
+    def test_overridden_chapters(self):
+        target = ChaptersOverridden(TEST_EXP)
+        target.novel = self.source.novel
+        target.write()
+        text = self._read_export()
+        self.assertIn('Extra chapter\n* ', text)
+
+    def test_overridden_text(self):
+        target = TextOverridden(TEST_EXP)
+        target.novel = self.source.novel
+        target.write()
+        self.assertTrue(self._read_export().endswith('Footer\nExtra text\n'))
+
+    def test_write_error(self):
+        with open(TEST_EXP, 'w', encoding='utf-8') as f:
+            f.write('Previous export')
+        target = BrokenExport(TEST_EXP)
+        target.novel = self.source.novel
+        with self.assertRaises(RuntimeError):
+            target.write()
+
+        # The previous export is restored.
+        self.assertEqual(self._read_export(), 'Previous export')
+
+    def _read_export(self):
+        with open(TEST_EXP, 'r', encoding='utf-8') as f:
+            return f.read()
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
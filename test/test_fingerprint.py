@@ -0,0 +1,122 @@
+"""Regression test for the fingerprint of exported documents.
+
+Test the round trip through meta.xml, and the data hashed.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.exporter.sc_vp_filter import ScVpFilter
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.odt.odt_w_characters import OdtWCharacters
+from nvlib.model.odt.odt_w_manuscript import OdtWManuscript
+from nvlib.novx_globals import LC_ROOT
+import unittest
+import xml.sax.saxutils
+# imported by the application, and used by the ODF writers
+
+DATA_PATH = '../test/data/_manuscript/'
+TEST_EXEC_PATH = '../test/tmp/'
+TEST_ODT = f'{TEST_EXEC_PATH}fingerprint{OdtWManuscript.SUFFIX}.odt'
+TEST_CHARACTERS_ODT = f'{TEST_EXEC_PATH}fingerprint{OdtWCharacters.SUFFIX}.odt'
+
+
+class OdtWNotRendered(OdtWManuscript):
+
+    def _get_text_parts(self):
+        raise AssertionError('The document is rendered.')
+
+
+class FingerprintTest(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(TEST_EXEC_PATH, exist_ok=True)
+        source = NovxFile(f'{DATA_PATH}normal.novx')
+        source.novel = Novel(tree=NvTree())
+        source.read()
+        self.novel = source.novel
+
+    def tearDown(self):
+        for filePath in (TEST_ODT, TEST_CHARACTERS_ODT):
+            try:
+                os.remove(filePath)
+            except:
+                pass
+
+    def test_round_trip(self):
+        for targetClass, filePath in (
+            (OdtWManuscript, TEST_ODT),
+            (OdtWCharacters, TEST_CHARACTERS_ODT),
+        ):
+            target = self._new_target(targetClass, filePath)
+            self.assertIsNone(target.read_fingerprint())
+            target.write()
+            fingerprint = target.read_fingerprint()
+            self.assertEqual(len(fingerprint), 64)
+            self.assertEqual(
+                self._new_target(targetClass, filePath).get_fingerprint(),
+                fingerprint,
+            )
+
+    def test_project_data(self):
+        fingerprint = self._new_target(OdtWManuscript).get_fingerprint()
+        self.novel.sections['sc2'].sectionContent = '<p>Changed</p>'
+        self.assertNotEqual(
+            self._new_target(OdtWManuscript).get_fingerprint(),
+            fingerprint,
+        )
+
+    def test_unread_data(self):
+        manuscriptFingerprint = self._new_target(
+            OdtWManuscript
+        ).get_fingerprint()
+        charactersFingerprint = self._new_target(
+            OdtWCharacters
+        ).get_fingerprint()
+        self.novel.characters['cr1'].notes = 'Changed'
+        lcId = self.novel.tree.get_children(LC_ROOT)[0]
+        self.novel.locations[lcId].desc = 'Changed'
+        self.assertEqual(
+            self._new_target(OdtWManuscript).get_fingerprint(),
+            manuscriptFingerprint,
+        )
+        self.assertNotEqual(
+            self._new_target(OdtWCharacters).get_fingerprint(),
+            charactersFingerprint,
+        )
+
+        # A character's title is read by the sections referencing it.
+        self.novel.characters['cr1'].title = 'Changed'
+        self.assertNotEqual(
+            self._new_target(OdtWManuscript).get_fingerprint(),
+            manuscriptFingerprint,
+        )
+
+    def test_export_settings(self):
+        target = self._new_target(OdtWManuscript)
+        fingerprint = target.get_fingerprint()
+        self.assertNotEqual(
+            self._new_target(OdtWCharacters).get_fingerprint(),
+            fingerprint,
+        )
+        target.sectionFilter = ScVpFilter('cr1')
+        self.assertNotEqual(target.get_fingerprint(), fingerprint)
+
+    def test_not_rendered(self):
+        self._new_target(OdtWNotRendered).get_fingerprint()
+
+    def _new_target(self, targetClass, filePath=TEST_ODT):
+        target = targetClass(filePath)
+        target.novel = self.novel
+        return target
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
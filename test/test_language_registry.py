@@ -0,0 +1,100 @@
+"""Regression test for the section language registry.
+
+Test the reference counting, and the order of the novel's languages.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+import unittest
+
+
+def content(*languages):
+    spans = ''.join(
+        f'<span xml:lang="{language}">Text</span>' for language in languages
+    )
+    return f'<p>Standard text {spans}</p>'
+
+
+def new_section(*languages):
+    section = Section()
+    section.sectionContent = content(*languages)
+    return section
+
+
+class LanguageRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.novel = Novel(tree=NvTree())
+        self.registry = self.novel.languageRegistry
+        self.novel.sections['sc1'] = new_section('en-AU', 'de-CH')
+        self.novel.sections['sc2'] = new_section('en-AU')
+
+    def test_reference_count(self):
+        del self.novel.sections['sc1']
+        self.assertEqual(self.registry.get_languages(), ['en-AU'])
+        del self.novel.sections['sc2']
+        self.assertEqual(self.registry.get_languages(), [])
+
+    def test_content_change(self):
+        self.novel.sections['sc2'].sectionContent = content('fr-CA')
+        self.assertEqual(
+            self.registry.get_languages(),
+            ['en-AU', 'de-CH', 'fr-CA'],
+        )
+        self.novel.sections['sc1'].sectionContent = content()
+        self.assertEqual(self.registry.get_languages(), ['fr-CA'])
+
+        # Sections removed no longer update the registry.
+        section = self.novel.sections.pop('sc2')
+        section.sectionContent = content('en-AU')
+        self.assertEqual(self.registry.get_languages(), [])
+
+    def test_replace_section(self):
+        self.novel.sections['sc1'] = new_section('fr-CA')
+        self.assertEqual(self.registry.get_languages(), ['en-AU', 'fr-CA'])
+        self.novel.sections.clear()
+        self.assertEqual(self.registry.get_languages(), [])
+
+    def test_move_to_other_novel(self):
+        otherNovel = Novel(tree=NvTree())
+        section = self.novel.sections['sc1']
+        otherNovel.sections['sc9'] = section
+        # The section is no longer counted in the first novel.
+        self.assertEqual(self.registry.get_languages(), ['en-AU'])
+        self.assertEqual(
+            otherNovel.languageRegistry.get_languages(),
+            ['en-AU', 'de-CH'],
+        )
+
+        # Removing the stale entry does not affect the other novel.
+        del self.novel.sections['sc1']
+        self.assertEqual(self.registry.get_languages(), ['en-AU'])
+        self.assertEqual(
+            otherNovel.languageRegistry.get_languages(),
+            ['en-AU', 'de-CH'],
+        )
+        section.sectionContent = content('fr-CA')
+        self.assertEqual(otherNovel.languageRegistry.get_languages(), ['fr-CA'])
+        self.assertEqual(self.registry.get_languages(), ['en-AU'])
+
+    def test_registration_order(self):
+        self.novel.sections['sc1'].sectionContent = content()
+        self.novel.sections['sc1'].sectionContent = content('de-CH', 'en-AU')
+        # en-AU is listed first, because sc2 still used it.
+        self.assertEqual(self.registry.get_languages(), ['en-AU', 'de-CH'])
+        self.novel.get_languages()
+        self.assertEqual(self.novel.languages, ['en-AU', 'de-CH'])
+        self.novel.sections['sc3'] = new_section('fr-CA')
+        self.novel.get_languages()
+        self.assertEqual(self.novel.languages, ['en-AU', 'de-CH', 'fr-CA'])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Regression test for the next/previous node lookup.
+
+Test the navigation order, and its update after structural changes.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.navigation_index import NavigationIndex
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.novx_globals import CH_ROOT
+from nvlib.novx_globals import CR_ROOT
+import unittest
+
+
+class NavigationOrder(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = NvTree()
+        for chId, scIds in (
+            ('ch1', ('sc1', 'sc2')),
+            ('ch2', ()),
+            ('ch3', ('sc3',)),
+        ):
+            self.tree.append(CH_ROOT, chId)
+            for scId in scIds:
+                self.tree.append(chId, scId)
+        self.tree.append(CR_ROOT, 'cr1')
+        self.tree.append(CR_ROOT, 'cr2')
+        self.index = NavigationIndex(self.tree)
+
+    def test_navigation(self):
+        self.assertEqual(self.index.get_next('sc2'), 'sc3')
+        self.assertEqual(self.index.get_prev('sc3'), 'sc2')
+        self.assertEqual(self.index.get_next('ch1'), 'ch2')
+        self.assertIsNone(self.index.get_next('sc3'))
+        self.assertIsNone(self.index.get_prev('cr1'))
+        self.assertEqual(self.index.get_next('cr1'), 'cr2')
+        self.assertIsNone(self.index.get_next('sc99'))
+
+    def test_match(self):
+        self.assertEqual(
+            self.index.get_next('sc1', lambda scId: scId != 'sc2'),
+            'sc3',
+        )
+        self.assertIsNone(
+            self.index.get_prev('sc3', lambda scId: scId == 'sc3'),
+        )
+
+    def test_structural_change(self):
+        self.assertEqual(self.index.get_next('sc1'), 'sc2')
+        self.tree.insert('ch1', 1, 'sc4')
+        self.assertEqual(self.index.get_next('sc1'), 'sc4')
+        self.tree.delete('ch1')
+        self.assertIsNone(self.index.get_next('sc1'))
+        self.assertIsNone(self.index.get_prev('sc3'))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
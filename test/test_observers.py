@@ -0,0 +1,59 @@
+"""Regression test for the novelibre model's observer scheduling.
+
+Test that hidden observers are refreshed once when shown again.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.nv_model import NvModel
+import unittest
+
+
+class Client:
+
+    def __init__(self):
+        self.refreshCount = 0
+
+    def refresh(self):
+        self.refreshCount += 1
+
+
+class Observers(unittest.TestCase):
+
+    def setUp(self):
+        self.model = NvModel()
+        self.visibleClient = Client()
+        self.hiddenClient = Client()
+        self.model.add_observer(self.visibleClient)
+        self.model.add_observer(self.hiddenClient)
+
+    def test_hidden_observer(self):
+        self.model.hide_observer(self.hiddenClient)
+        self.model.notify_observers()
+        self.model.notify_observers()
+        self.assertEqual(self.visibleClient.refreshCount, 2)
+        self.assertEqual(self.hiddenClient.refreshCount, 0)
+
+        self.model.show_observer(self.hiddenClient)
+        self.assertEqual(self.hiddenClient.refreshCount, 1)
+        self.model.show_observer(self.hiddenClient)
+        self.assertEqual(self.hiddenClient.refreshCount, 1)
+
+        self.model.hide_observer(self.hiddenClient)
+        self.model.show_observer(self.hiddenClient)
+        self.assertEqual(self.hiddenClient.refreshCount, 1)
+
+    def test_refresh_times(self):
+        self.model.notify_observers()
+        (name, count, seconds), = self.model.get_refresh_times()
+        self.assertEqual(name, 'Client')
+        self.assertEqual(count, 2)
+        self.assertGreaterEqual(seconds, 0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
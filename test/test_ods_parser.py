@@ -0,0 +1,118 @@
+"""Regression test for the ODS table parser.
+
+Test the incremental parser with repeated rows and columns,
+and with trailing empty rows.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import zipfile
+
+from nvlib.model.ods.ods_parser import OdsParser
+import unittest
+
+TEST_EXEC_PATH = '../test/tmp/'
+TEST_ODS = f'{TEST_EXEC_PATH}parser.ods'
+CELLS_PER_ROW = 4
+CONTENT_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content
+ xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+ xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+ xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">
+<office:body><office:spreadsheet>
+<table:table table:name="Sections">
+ <table:table-column table:number-columns-repeated="1024"/>
+ <table:table-header-rows>
+  <table:table-row>
+   <table:table-cell><text:p>Header row group</text:p></table:table-cell>
+  </table:table-row>
+ </table:table-header-rows>
+ <table:table-row>
+  <table:table-cell><text:p>ID</text:p></table:table-cell>
+  <table:table-cell><text:p>Title</text:p></table:table-cell>
+  <table:table-cell><text:p>Date</text:p></table:table-cell>
+  <table:table-cell><text:p>Time</text:p></table:table-cell>
+  <table:table-cell table:number-columns-repeated="1020"/>
+ </table:table-row>
+ <table:table-row>
+  <table:table-cell><text:p>ScID:1</text:p></table:table-cell>
+  <table:table-cell>
+   <text:p>First <text:span>line</text:span></text:p><text:p>Second</text:p>
+  </table:table-cell>
+  <table:table-cell office:date-value="2024-01-31"><text:p>x</text:p>
+  </table:table-cell>
+  <table:table-cell office:time-value="PT13H45M00S"><text:p>x</text:p>
+  </table:table-cell>
+  <table:table-cell table:number-columns-repeated="1020"/>
+ </table:table-row>
+ <table:table-row table:number-rows-repeated="2">
+  <table:table-cell table:number-columns-repeated="2">
+   <text:p>Same</text:p>
+  </table:table-cell>
+  <table:table-cell table:number-columns-repeated="1022"/>
+ </table:table-row>
+ <table:table-row>
+  <table:table-cell><text:p>ScID:2</text:p></table:table-cell>
+ </table:table-row>
+ <table:table-row table:number-rows-repeated="1048570">
+  <table:table-cell table:number-columns-repeated="1024"/>
+ </table:table-row>
+</table:table>
+<table:table table:name="Second table">
+ <table:table-row>
+  <table:table-cell><text:p>Not read</text:p></table:table-cell>
+ </table:table-row>
+</table:table>
+</office:spreadsheet></office:body>
+</office:document-content>
+'''
+
+
+class OdsParserTest(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(TEST_EXEC_PATH, exist_ok=True)
+        with zipfile.ZipFile(TEST_ODS, 'w') as odfFile:
+            odfFile.writestr('content.xml', CONTENT_XML)
+
+    def tearDown(self):
+        try:
+            os.remove(TEST_ODS)
+        except:
+            pass
+
+    def test_rows(self):
+        rows = OdsParser().get_rows(TEST_ODS, CELLS_PER_ROW)
+        self.assertEqual(
+            rows,
+            [
+                ['ID', 'Title', 'Date', 'Time'],
+                ['ScID:1', 'First line\nSecond', '2024-01-31', '13:45:00'],
+                ['Same', 'Same', '', ''],
+                ['Same', 'Same', '', ''],
+                ['ScID:2'],
+                ['', '', '', ''],
+            ],
+        )
+
+        # Repeated non-empty rows are expanded; repeated empty rows are not.
+        rows[2][0] = 'Changed'
+        self.assertEqual(rows[3][0], 'Same')
+
+    def test_iterate_rows(self):
+        rows = OdsParser().iterate_rows(TEST_ODS, CELLS_PER_ROW)
+        self.assertEqual(next(rows), ['ID', 'Title', 'Date', 'Time'])
+        self.assertEqual(len(list(rows)), 5)
+
+    def test_missing_file(self):
+        with self.assertRaises(RuntimeError):
+            OdsParser().get_rows(f'{TEST_EXEC_PATH}missing.ods', 1)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Regression test for the cache of converted ODT fragments.
+
+Test the cache invalidation, the converter keys, and the size limit.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.odt.odt_fragment_cache import OdtFragmentCache
+from nvlib.model.odt.odt_w_manuscript import OdtWManuscript
+import unittest
+
+TEST_EXP = '../test/tmp/cache.odt'
+CONTENT = '<p>First paragraph</p><p>Second paragraph</p>'
+
+
+class OdtWMarked(OdtWManuscript):
+
+    def _convert_from_novx(self, text, **kwargs):
+        return f'<!-- marked -->{super()._convert_from_novx(text, **kwargs)}'
+
+
+class OdtFragmentCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = OdtFragmentCache()
+        self.writer = self._new_writer(OdtWManuscript)
+
+    def test_content_change(self):
+        self.cache.begin('styles', [])
+        fragment = self.writer._convert_from_novx(CONTENT, xml=True)
+        size = self.cache.size
+        self.assertIs(
+            self.writer._convert_from_novx(CONTENT, xml=True),
+            fragment,
+        )
+        self.assertEqual(self.cache.size, size)
+
+        changedFragment = self.writer._convert_from_novx(
+            CONTENT.replace('Second', 'Changed'),
+            xml=True,
+        )
+        self.assertIn('Changed', changedFragment)
+        self.assertNotEqual(changedFragment, fragment)
+
+    def test_alternating_exports(self):
+        self.cache.begin('styles', [])
+        fragment = self.writer._convert_from_novx(CONTENT, xml=True)
+
+        # Another export type does not discard the fragments.
+        markedWriter = self._new_writer(OdtWMarked)
+        self.cache.begin('styles', [])
+        markedWriter._convert_from_novx(CONTENT, xml=True)
+        self.cache.begin('styles', [])
+        self.assertIs(
+            self.writer._convert_from_novx(CONTENT, xml=True),
+            fragment,
+        )
+
+    def test_style_change(self):
+        self.cache.begin('styles', [])
+        self.writer._convert_from_novx(CONTENT, xml=True)
+        self.assertGreater(self.cache.size, 0)
+        self.cache.begin('changed styles', [])
+        self.assertEqual(self.cache.size, 0)
+        self.cache.begin('changed styles', ['de-DE'])
+        self.assertEqual(self.cache.size, 0)
+
+    def test_converter_key(self):
+        self.cache.begin('styles', [])
+        fragment = self.writer._convert_from_novx(CONTENT, xml=True)
+        markedWriter = self._new_writer(OdtWMarked)
+        markedFragment = markedWriter._convert_from_novx(CONTENT, xml=True)
+        self.assertEqual(markedFragment, f'<!-- marked -->{fragment}')
+        self.assertIs(
+            self.writer._convert_from_novx(CONTENT, xml=True),
+            fragment,
+        )
+
+    def test_size_limit(self):
+        self.cache = OdtFragmentCache(maxSize=10)
+        self.cache.begin('styles', [])
+        keys = [
+            self.cache.get_key(None, str(i), False, False, False)
+            for i in range(4)
+        ]
+        self.cache.store(keys[0], 'aaaa')
+        self.cache.store(keys[1], 'bbbb')
+        self.assertEqual(self.cache.get(keys[0]), 'aaaa')
+        self.cache.store(keys[2], 'cccc')
+        # The least recently used fragment is discarded.
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.get(keys[0]), 'aaaa')
+        self.assertEqual(self.cache.size, 8)
+
+        # Oversized fragments are not cached.
+        self.cache.store(keys[3], 'd' * 11)
+        self.assertIsNone(self.cache.get(keys[3]))
+        self.assertEqual(self.cache.size, 8)
+
+    def _new_writer(self, writerClass):
+        writer = writerClass(TEST_EXP)
+        writer.novel = Novel(tree=NvTree())
+        writer.novel.get_languages()
+        writer._fragmentCache = self.cache
+        return writer
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""Regression test for novelibre file processing.
+
+Test the streaming ODT parser against parsing content.xml in memory.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+from shutil import copyfile
+from xml import sax
+import zipfile
+
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.novel import Novel
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.odf.odf_file import OdfFile
+from nvlib.model.odt import odt_reader
+from nvlib.model.odt.odt_parser import OdtParser
+from nvlib.model.odt.odt_r_chapterdesc import OdtRChapterDesc
+from nvlib.model.odt.odt_r_characters import OdtRCharacters
+from nvlib.model.odt.odt_r_full import OdtRFull
+from nvlib.model.odt.odt_r_import import OdtRImport
+from nvlib.model.odt.odt_r_items import OdtRItems
+from nvlib.model.odt.odt_r_locations import OdtRLocations
+from nvlib.model.odt.odt_r_manuscript import OdtRManuscript
+from nvlib.model.odt.odt_r_outline import OdtROutline
+from nvlib.model.odt.odt_r_partdesc import OdtRPartDesc
+from nvlib.model.odt.odt_r_plotlines import OdtRPlotlines
+from nvlib.model.odt.odt_r_proof import OdtRProof
+from nvlib.model.odt.odt_r_sectiondesc import OdtRSectionDesc
+from nvlib.model.odt.odt_r_stages import OdtRStages
+from testlib.helper import read_file
+import unittest
+
+DATA_PATH = '../test/data/'
+EXEC_PATH = '../test/tmp/'
+READERS = [
+    (OdtRChapterDesc, '_chapters/', 'proofed.odt'),
+    (OdtRCharacters, '_characters/', 'proofed.odt'),
+    (OdtRFull, '_full/', 'proofed.odt'),
+    (OdtRImport, '_import/', 'normal.odt'),
+    (OdtRItems, '_items/', 'proofed.odt'),
+    (OdtRLocations, '_locations/', 'proofed.odt'),
+    (OdtRManuscript, '_manuscript/', 'proofed.odt'),
+    (OdtROutline, '_outline/', 'normal.odt'),
+    (OdtRPartDesc, '_parts/', 'proofed.odt'),
+    (OdtRPlotlines, '_plotlines/', 'proofed.odt'),
+    (OdtRProof, '_proof/', 'proofed.odt'),
+    (OdtRProof, '_proof/', 'googledocs.odt'),
+    (OdtRProof, '_proof/', 'word.odt'),
+    (OdtRSectionDesc, '_sections/', 'proofed.odt'),
+    (OdtRStages, '_structure/', 'proofed.odt'),
+]
+
+
+class InMemoryOdtParser(OdtParser):
+    """ODT parser reading content.xml into memory, as a reference."""
+
+    def feed_file(self, filePath):
+        with zipfile.ZipFile(filePath, 'r') as odfFile:
+            styles, meta = self._read_odt_components(odfFile, filePath)
+            content = odfFile.read('content.xml')
+        self._read_styles_xml(styles, OdfFile.NAMESPACES)
+        self._read_meta_xml(meta, OdfFile.NAMESPACES)
+        sax.parseString(content, self)
+
+
+class EventRecorder:
+    """Parser client recording the HTMLParser-like calls."""
+
+    def __init__(self):
+        self.events = []
+
+    def handle_data(self, data):
+        self.events.append(('data', data))
+
+    def handle_endtag(self, tag):
+        self.events.append(('end', tag))
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(('start', tag, attrs))
+
+
+class StreamingParser(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(EXEC_PATH, exist_ok=True)
+        self._tempFiles = []
+
+    def tearDown(self):
+        for filePath in self._tempFiles:
+            try:
+                os.remove(filePath)
+            except:
+                pass
+
+    def test_events(self):
+        for __, dataDir, fileName in READERS:
+            filePath = f'{DATA_PATH}{dataDir}{fileName}'
+            with self.subTest(filePath=filePath):
+                streamed = EventRecorder()
+                OdtParser(streamed).feed_file(filePath)
+                inMemory = EventRecorder()
+                InMemoryOdtParser(inMemory).feed_file(filePath)
+                self.assertTrue(streamed.events)
+                self.assertEqual(streamed.events, inMemory.events)
+
+    def test_readers(self):
+        for readerClass, dataDir, fileName in READERS:
+            with self.subTest(reader=readerClass.__name__, fileName=fileName):
+                streamed = self._read_project(
+                    readerClass,
+                    dataDir,
+                    fileName,
+                )
+                odt_reader.OdtParser = InMemoryOdtParser
+                try:
+                    inMemory = self._read_project(
+                        readerClass,
+                        dataDir,
+                        fileName,
+                    )
+                finally:
+                    odt_reader.OdtParser = OdtParser
+                self.assertEqual(streamed, inMemory)
+
+    def _read_project(self, readerClass, dataDir, fileName):
+        # Return the novx file created by readerClass from the document.
+        sourcePath = (
+            f'{EXEC_PATH}yw7 Sample Project'
+            f'{readerClass.SUFFIX}{readerClass.EXTENSION}'
+        )
+        copyfile(f'{DATA_PATH}{dataDir}{fileName}', sourcePath)
+        novxPath = f'{EXEC_PATH}yw7 Sample Project.novx'
+        self._tempFiles.extend([sourcePath, novxPath, f'{novxPath}.bak'])
+        novel = Novel(tree=NvTree())
+        if not readerClass in (OdtRImport, OdtROutline):
+            novxFile = NovxFile(f'{DATA_PATH}{dataDir}normal.novx')
+            novxFile.novel = novel
+            novxFile.read()
+        source = readerClass(sourcePath)
+        source.novel = novel
+        source.read()
+        target = NovxFile(novxPath)
+        target.novel = novel
+        target.write()
+        return read_file(novxPath)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
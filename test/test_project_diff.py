@@ -0,0 +1,131 @@
+"""Regression test for novelibre project merging.
+
+Test the element-level comparison and merging of a project
+changed on disk.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+from shutil import copyfile
+
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+from nvlib.model.novx.project_diff import ProjectDiff
+from nvlib.model.nv_model import NvModel
+from nvlib.novx_globals import CH_ROOT
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+EXEC_PATH = '../test/tmp/'
+NOVX_FILE = f'{EXEC_PATH}yw7 Sample Project.novx'
+
+
+class ProjectMerge(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(EXEC_PATH, exist_ok=True)
+        self._remove_all_tempfiles()
+        copyfile(f'{DATA_PATH}normal.novx', NOVX_FILE)
+        self.local = self._open_project()
+        self.remote = self._open_project()
+
+    def tearDown(self):
+        self._remove_all_tempfiles()
+
+    def test_unchanged(self):
+        remoteFile, remoteSnapshot = self.local.read_changes()
+        diff = ProjectDiff(
+            self.local.baseSnapshot,
+            self.local.get_snapshot(),
+            remoteSnapshot,
+        )
+        self.assertTrue(diff.is_empty())
+        self.assertFalse(diff.localChanges)
+
+    def test_merge(self):
+        self.local.novel.chapters['ch1'].title = 'Local title'
+        self.local.novel.sections['sc2'].title = 'Local section title'
+
+        self.remote.novel.sections['sc2'].title = 'Remote section title'
+        self.remote.novel.sections['sc4'].desc = 'Remote description'
+        self.remote.novel.chapters['ch99'] = Chapter(
+            title='Remote chapter',
+            chLevel=2,
+            chType=0,
+        )
+        self.remote.tree.insert(CH_ROOT, 0, 'ch99')
+        self.remote.novel.sections['sc99'] = Section(
+            title='Remote section',
+            scType=0,
+            scene=0,
+            status=1,
+        )
+        self.remote.tree.set_children('ch99', 'sc99', 'sc3')
+        self.remote.tree.delete('sc5')
+        del self.remote.novel.sections['sc5']
+        self._save_remote()
+
+        remoteFile, remoteSnapshot = self.local.read_changes()
+        diff = ProjectDiff(
+            self.local.baseSnapshot,
+            self.local.get_snapshot(),
+            remoteSnapshot,
+        )
+        self.assertEqual(diff.conflicts, ['sc2'])
+        self.assertEqual(diff.removed, ['sc5'])
+        self.assertEqual(
+            sorted(diff.changed),
+            ['ch99', 'sc4', 'sc99'],
+        )
+
+        self.local.merge_changes(remoteFile, remoteSnapshot, diff)
+        novel = self.local.novel
+        self.assertEqual(novel.chapters['ch1'].title, 'Local title')
+        self.assertEqual(novel.sections['sc2'].title, 'Local section title')
+        self.assertEqual(novel.sections['sc4'].desc, 'Remote description')
+        self.assertFalse('sc5' in novel.sections)
+        self.assertEqual(self.local.tree.get_children(CH_ROOT)[0], 'ch99')
+        self.assertEqual(
+            self.local.tree.get_children('ch99'),
+            ['sc99', 'sc3'],
+        )
+        self.assertTrue(self.local.isModified)
+
+        # Merged remote changes are no local changes.
+        remoteFile, remoteSnapshot = self.local.read_changes()
+        diff = ProjectDiff(
+            self.local.baseSnapshot,
+            self.local.get_snapshot(),
+            remoteSnapshot,
+        )
+        self.assertTrue(diff.is_empty())
+        self.assertTrue(diff.localChanges)
+
+    def _open_project(self):
+        model = NvModel()
+        model.tree = NvTree()
+        model.keepSnapshots = True
+        model.open_project(NOVX_FILE)
+        return model
+
+    def _remove_all_tempfiles(self):
+        for filePath in (NOVX_FILE, f'{NOVX_FILE}.bak'):
+            try:
+                os.remove(filePath)
+            except:
+                pass
+
+    def _save_remote(self):
+        self.remote.prjFile.adjust_section_types = lambda: None
+        # NvTree does not support moving the trash bin
+        self.remote.save_project()
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
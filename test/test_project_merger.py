@@ -0,0 +1,148 @@
+"""Regression test for the novelibre merge engine.
+
+Test the three-way merge of two project versions.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from contextlib import redirect_stderr
+from io import StringIO
+import os
+from shutil import copyfile
+
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.novel import Novel
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.project_merger import ProjectMerger
+from nvlib.novx_globals import CH_ROOT
+from novelibre_ import merge
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+EXEC_PATH = '../test/tmp/'
+BASE_FILE = f'{EXEC_PATH}base.novx'
+LOCAL_FILE = f'{EXEC_PATH}local.novx'
+REMOTE_FILE = f'{EXEC_PATH}remote.novx'
+MERGED_FILE = f'{EXEC_PATH}merged.novx'
+
+
+class ProjectMerge(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(EXEC_PATH, exist_ok=True)
+        self._remove_all_tempfiles()
+        for filePath in (BASE_FILE, LOCAL_FILE, REMOTE_FILE):
+            copyfile(f'{DATA_PATH}normal.novx', filePath)
+
+    def tearDown(self):
+        self._remove_all_tempfiles()
+
+    def test_field_merge(self):
+        local = self._read(LOCAL_FILE)
+        local.novel.sections['sc2'].title = 'Local title'
+        local.novel.sections['sc3'].title = 'Local title'
+        local.novel.tree.set_children(
+            CH_ROOT,
+            *reversed(local.novel.tree.get_children(CH_ROOT))
+        )
+        local.write()
+        remote = self._read(REMOTE_FILE)
+        remote.novel.sections['sc2'].desc = 'Remote description'
+        remote.novel.sections['sc3'].title = 'Remote title'
+        remote.novel.sections['sc4'].status = 1
+        remote.write()
+
+        merger = ProjectMerger()
+        self.assertFalse(
+            merger.merge_files(BASE_FILE, LOCAL_FILE, REMOTE_FILE, MERGED_FILE)
+        )
+        self.assertEqual(merger.conflicts, [('sc3', 'Title')])
+        merged = self._read(MERGED_FILE)
+        sections = merged.novel.sections
+        self.assertEqual(sections['sc2'].title, 'Local title')
+        self.assertEqual(sections['sc2'].desc, 'Remote description')
+        self.assertEqual(sections['sc3'].title, 'Local title')
+        self.assertEqual(sections['sc4'].status, 1)
+        self.assertEqual(
+            merged.novel.tree.get_children(CH_ROOT),
+            local.novel.tree.get_children(CH_ROOT),
+        )
+
+        merger = ProjectMerger(resolutions={'Title': ProjectMerger.REMOTE})
+        merger.merge_files(BASE_FILE, LOCAL_FILE, REMOTE_FILE, MERGED_FILE)
+        merged = self._read(MERGED_FILE)
+        self.assertEqual(merged.novel.sections['sc3'].title, 'Remote title')
+
+    def test_unchanged(self):
+        merger = ProjectMerger()
+        self.assertTrue(
+            merger.merge_files(BASE_FILE, LOCAL_FILE, REMOTE_FILE, MERGED_FILE)
+        )
+
+    def test_dead_viewpoint(self):
+        for filePath in (BASE_FILE, LOCAL_FILE, REMOTE_FILE):
+            prjFile = self._read(filePath)
+            prjFile.novel.sections['sc2'].viewpoint = 'cr1'
+            prjFile.write()
+        remote = self._read(REMOTE_FILE)
+        del remote.novel.characters['cr1']
+        remote.novel.tree.delete('cr1')
+        remote.write()
+
+        ProjectMerger().merge_files(
+            BASE_FILE,
+            LOCAL_FILE,
+            REMOTE_FILE,
+            MERGED_FILE,
+        )
+        merged = self._read(MERGED_FILE)
+        self.assertNotIn('cr1', merged.novel.characters)
+        self.assertIsNone(merged.novel.sections['sc2'].viewpoint)
+
+    def test_word_count_log(self):
+        for filePath in (BASE_FILE, LOCAL_FILE, REMOTE_FILE):
+            prjFile = self._read(filePath)
+            prjFile.novel.saveWordCount = True
+            prjFile.wcLog['2024-01-01'] = [100, 110]
+            prjFile.write_xml_root(prjFile.build_xml_root())
+        ProjectMerger().merge_files(
+            BASE_FILE,
+            LOCAL_FILE,
+            REMOTE_FILE,
+            MERGED_FILE,
+        )
+        merged = self._read(MERGED_FILE)
+        self.assertEqual(list(merged.wcLog), ['2024-01-01'])
+
+    def test_invalid_resolution(self):
+        for resolution in ('Title=both', 'Title', '=remote'):
+            with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+                merge([
+                    BASE_FILE,
+                    LOCAL_FILE,
+                    REMOTE_FILE,
+                    '--resolve',
+                    resolution,
+                ])
+
+    def _read(self, filePath):
+        novxFile = NovxFile(filePath)
+        novxFile.novel = Novel(tree=NvTree())
+        novxFile.read()
+        return novxFile
+
+    def _remove_all_tempfiles(self):
+        for filePath in (BASE_FILE, LOCAL_FILE, REMOTE_FILE, MERGED_FILE):
+            for path in (filePath, f'{filePath}.bak'):
+                try:
+                    os.remove(path)
+                except:
+                    pass
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
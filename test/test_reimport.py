@@ -0,0 +1,103 @@
+"""Regression test for the manuscript reimport.
+
+Test that only the changed sections are updated and reported.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+from shutil import copyfile
+
+from nvlib.controller.services.doc_importer import DocImporter
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.nv_model import NvModel
+from nvlib.model.odt.odt_r_manuscript import OdtRManuscript
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+TEST_EXEC_PATH = '../test/tmp/'
+TEST_NOVX = f'{TEST_EXEC_PATH}reimport.novx'
+TEST_ODT = f'{TEST_EXEC_PATH}reimport{OdtRManuscript.SUFFIX}.odt'
+
+
+class View:
+
+    def ask_yes_no(self, **kwargs):
+        return True
+
+
+class Controller:
+
+    def get_preferences(self):
+        return {'import_mode': '0'}
+
+
+class ReimportTest(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(TEST_EXEC_PATH, exist_ok=True)
+        copyfile(f'{DATA_PATH}normal.novx', TEST_NOVX)
+        copyfile(f'{DATA_PATH}proofed.odt', TEST_ODT)
+        self.normal = self._read_novel(f'{DATA_PATH}normal.novx')
+        self.proofed = self._read_novel(f'{DATA_PATH}proofed.novx')
+
+    def tearDown(self):
+        for filePath in (TEST_NOVX, f'{TEST_NOVX}.bak', TEST_ODT):
+            try:
+                os.remove(filePath)
+            except:
+                pass
+
+    def test_changed_sections(self):
+        changedIds = [
+            scId for scId in self.normal.sections
+            if self.normal.sections[scId].sectionContent
+            != self.proofed.sections[scId].sectionContent
+        ]
+        upToDate = ['sc4', 'sc6']
+        # changed sections that are not split on import
+
+        # Sections already up to date are not reported.
+        for scId in upToDate:
+            self.normal.sections[scId].sectionContent = (
+                self.proofed.sections[scId].sectionContent
+            )
+            changedIds.remove(scId)
+        source = OdtRManuscript(TEST_ODT)
+        source.novel = self.normal
+        notifications = []
+        self.normal.on_element_change = lambda: notifications.append(None)
+        source.read()
+        self.assertEqual(source.changedSections, changedIds)
+        self.assertEqual(len(notifications), 1)
+        for scId in self.proofed.sections:
+            self.assertEqual(
+                self.normal.sections[scId].sectionContent,
+                self.proofed.sections[scId].sectionContent,
+            )
+
+    def test_import_message(self):
+        importer = DocImporter(NvModel(), View(), Controller())
+        message = importer._run(TEST_ODT)
+        numberOfChanges = len([
+            scId for scId in self.normal.sections
+            if self.normal.sections[scId].sectionContent
+            != self.proofed.sections[scId].sectionContent
+        ])
+        self.assertIn(f'Sections changed: {numberOfChanges}.', message)
+
+    def _read_novel(self, filePath):
+        source = NovxFile(filePath)
+        source.novel = Novel(tree=NvTree())
+        source.read()
+        return source.novel
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Regression test for saving the novelibre project on a worker thread.
+
+Test the consistency of the file written, and the modification status.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+from shutil import copyfile
+
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.nv_model import NvModel
+from nvlib.model.nv_work_file import NvWorkFile
+from nvlib.novx_globals import SECTION_PREFIX
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+EXEC_PATH = '../test/tmp/'
+NOVX_FILE = f'{EXEC_PATH}yw7 Sample Project.novx'
+
+
+class SaveProject(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(EXEC_PATH, exist_ok=True)
+        self._remove_all_tempfiles()
+        copyfile(f'{DATA_PATH}normal.novx', NOVX_FILE)
+        self.model = NvModel()
+        self.model.tree = NvTree()
+        self.model.open_project(NOVX_FILE)
+
+    def tearDown(self):
+        self._remove_all_tempfiles()
+
+    def test_change_while_saving(self):
+        self.model.novel.sections['sc2'].title = 'Saved title'
+        xmlTree = self.model.prjFile.xmlTree
+        self.model.start_saving()
+        self.assertTrue(self.model.isSaving)
+        self.assertIs(self.model.prjFile.xmlTree, xmlTree)
+        self.model.novel.sections['sc2'].title = 'Unsaved title'
+        self.assertTrue(self.model.finish_saving())
+        self.assertFalse(self.model.isSaving)
+        self.assertIsNot(self.model.prjFile.xmlTree, xmlTree)
+        self.assertTrue(self.model.isModified)
+        self.assertTrue(os.path.isfile(f'{NOVX_FILE}.bak'))
+        self.assertFalse(self.model.prjFile.has_changed_on_disk())
+        self.assertEqual(self._read_title('sc2'), 'Saved title')
+
+        self.model.save_project()
+        self.assertFalse(self.model.isModified)
+        self.assertEqual(self._read_title('sc2'), 'Unsaved title')
+
+    def test_copy_for_writing(self):
+        section = self.model.novel.sections['sc2']
+        section.title = 'Saved title'
+        section.tags = ['saved']
+        content = section.sectionContent
+        prjFile = self.model.prjFile.copy_for_writing()
+        section.title = 'Unsaved title'
+        section.tags = ['unsaved']
+        section.structuredContent.replace(0, 1, ['<p>Unsaved</p>'])
+        self.model.novel.tree.delete('sc1')
+        copiedSection = prjFile.novel.sections['sc2']
+        self.assertIsNot(copiedSection, section)
+        self.assertEqual(copiedSection.title, 'Saved title')
+        self.assertEqual(copiedSection.tags, ['saved'])
+        self.assertEqual(copiedSection.sectionContent, content)
+        self.assertIn('sc1', prjFile.novel.tree.get_children('ch1'))
+        self.assertIsNot(prjFile.wcLog, self.model.prjFile.wcLog)
+
+        # The copies are detached from the model's indexes.
+        for attribute in (
+            'languageRegistry',
+            'sectionTable',
+            'timelineIndex',
+            'titleIndex',
+        ):
+            self.assertIsNone(getattr(copiedSection, attribute))
+        self.assertIsNone(prjFile.novel.timelineIndex)
+        self.assertIsNone(prjFile.novel.sectionTable)
+        self.assertIsNot(
+            prjFile.novel.languageRegistry,
+            self.model.novel.languageRegistry,
+        )
+        self.model.isModified = False
+        copiedSection.title = 'Changed copy'
+        copiedSection.date = '2024-01-01'
+        copiedSection.sectionContent = '<p xml:lang="de-CH">Kopie</p>'
+        self.assertFalse(self.model.isModified)
+        self.assertEqual(
+            self.model.novel.get_ids_by_title(SECTION_PREFIX, 'Changed copy'),
+            [],
+        )
+        self.assertNotIn(
+            'de-CH',
+            self.model.novel.languageRegistry.get_languages(),
+        )
+
+    def test_write_error(self):
+        os.remove(NOVX_FILE)
+        os.makedirs(NOVX_FILE)
+        self.model.isModified = True
+        try:
+            with self.assertRaises(RuntimeError):
+                self.model.save_project()
+            self.assertFalse(self.model.isSaving)
+            self.assertTrue(self.model.isModified)
+        finally:
+            os.rmdir(NOVX_FILE)
+
+    def _read_title(self, scId):
+        prjFile = NvWorkFile(NOVX_FILE)
+        prjFile.novel = self.model.nvService.new_novel(tree=NvTree())
+        prjFile.read()
+        return prjFile.novel.sections[scId].title
+
+    def _remove_all_tempfiles(self):
+        for filePath in (NOVX_FILE, f'{NOVX_FILE}.bak'):
+            try:
+                os.remove(filePath)
+            except:
+                pass
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Regression test for the derived date/time values of sections.
+
+Test that week day, locale date, start, end, and duration are
+updated when the section's date, time, day, or duration change.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.py_calendar import PyCalendar
+from nvlib.model.data.section import Section
+import unittest
+
+
+class SectionDates(unittest.TestCase):
+
+    def setUp(self):
+        self.section = Section(
+            scDate='2024-02-28',
+            scTime='23:00:00',
+            lastsHours='2',
+        )
+        self.section.on_element_change = self.section.do_nothing
+
+    def test_date(self):
+        self.assertEqual(self.section.weekDay, 2)
+        self.assertEqual(
+            self.section.localeDate,
+            PyCalendar.locale_date('2024-02-28'),
+        )
+        self.section.date = '2024-02-29'
+        self.assertEqual(self.section.weekDay, 3)
+        self.section.date = 'invalid'
+        self.assertEqual(self.section.date, '2024-02-29')
+        self.section.date = None
+        self.assertIsNone(self.section.weekDay)
+        self.assertIsNone(self.section.localeDate)
+
+    def test_end(self):
+        self.assertEqual(
+            self.section.get_end_date_time(),
+            ('2024-02-29', '01:00:00', None),
+        )
+        self.section.lastsMinutes = '30'
+        self.assertEqual(self.section.durationMinutes, 150)
+        self.assertEqual(
+            self.section.get_end_date_time(),
+            ('2024-02-29', '01:30:00', None),
+        )
+        self.section.time = '12:00:00'
+        self.assertEqual(
+            self.section.get_end_date_time(),
+            ('2024-02-28', '14:30:00', None),
+        )
+        self.section.lastsDays = 'x'
+        self.assertIsNone(self.section.durationMinutes)
+
+    def test_timestamp(self):
+        start = self.section.get_timestamp(None)
+        self.assertEqual(
+            start,
+            PyCalendar.get_timestamp(self.section, None),
+        )
+        self.section.date = None
+        self.section.day = '1'
+        self.assertEqual(
+            self.section.get_timestamp('2024-02-27'),
+            start,
+        )
+        self.assertEqual(
+            self.section.get_timestamp('2024-02-26'),
+            start - 86400,
+        )
+
+    def test_duration_out_of_range(self):
+        novel = Novel(tree=NvTree())
+        novel.sections['sc1'] = self.section
+        self.section.lastsHours = '99999999999999999999'
+        self.assertIsNone(self.section.durationMinutes)
+        self.assertEqual(
+            self.section.get_end_date_time(),
+            (None, None, None),
+        )
+        novel.sections['sc2'] = Section(
+            scDate='2024-02-28',
+            lastsDays='99999999999',
+        )
+        self.assertIsNone(novel.sections['sc2'].durationMinutes)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
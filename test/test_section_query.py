@@ -0,0 +1,110 @@
+"""Regression test for the compound export filters.
+
+Test the section queries, and the filters based on them.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.plot_line import PlotLine
+from nvlib.model.exporter.ch_query_filter import ChQueryFilter
+from nvlib.model.exporter.filter_factory import FilterFactory
+from nvlib.model.exporter.sc_query_filter import ScQueryFilter
+from nvlib.model.exporter.section_query import SectionQuery
+from nvlib.model.nv_model import NvModel
+from nvlib.novx_globals import PL_ROOT
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+
+
+class SectionQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = NvModel()
+        self.model.tree = NvTree()
+        self.model.open_project(f'{DATA_PATH}normal.novx')
+        self.novel = self.model.novel
+        self.novel.sections['sc2'].tags = ['clue']
+        self.novel.sections['sc3'].tags = ['clue', 'red herring']
+        self.novel.sections['sc4'].status = 2
+        self.novel.sections['sc4'].date = '2024-03-01'
+        self.novel.sections['sc4'].time = '22:00'
+        self.novel.sections['sc5'].date = '2024-03-03'
+        self.novel.sections['sc5'].time = '08:00'
+        self.novel.sections['sc6'].date = '2024-03-04'
+        self.novel.plotLines['pl1'] = PlotLine(sections=['sc2', 'sc6'])
+        self.novel.tree.append(PL_ROOT, 'pl1')
+
+    def test_compound_query(self):
+        query = (
+            SectionQuery.by_viewpoint('cr1')
+            & ~SectionQuery.by_location('lc2')
+            & SectionQuery.by_character('cr10')
+        ) | SectionQuery.by_tags('red herring')
+        self.assertEqual(query.get_section_ids(self.novel), {'sc3', 'sc4'})
+
+    def test_criteria(self):
+        self.assertEqual(
+            SectionQuery.by_status(2).get_section_ids(self.novel),
+            {'sc4'},
+        )
+        self.assertEqual(
+            SectionQuery.by_tags('clue').get_section_ids(self.novel),
+            {'sc2', 'sc3'},
+        )
+        self.assertEqual(
+            SectionQuery.by_plot_line('pl1').get_section_ids(self.novel),
+            {'sc2', 'sc6'},
+        )
+        self.assertEqual(
+            SectionQuery.by_location('lc2').get_section_ids(self.novel),
+            {'sc1', 'sc5'},
+        )
+        self.assertEqual(
+            SectionQuery.by_date_range(
+                '2024-03-02',
+                '2024-03-03',
+            ).get_section_ids(self.novel),
+            {'sc5'},
+        )
+        self.assertEqual(
+            SectionQuery.behind_work_phase().get_section_ids(self.novel),
+            set(),
+        )
+        self.novel.workPhase = 3
+        self.assertEqual(
+            SectionQuery.behind_work_phase().get_section_ids(self.novel),
+            {'sc4', 'sc58', 'sc120', 'sc121'},
+        )
+
+    def test_filters(self):
+        query = SectionQuery.by_tags('clue') | SectionQuery.by_status(2)
+        sectionFilter = FilterFactory.get_section_filter(query)
+        chapterFilter = FilterFactory.get_chapter_filter(query)
+        self.assertIsInstance(sectionFilter, ScQueryFilter)
+        self.assertIsInstance(chapterFilter, ChQueryFilter)
+        sectionFilter.prepare(self.model)
+        chapterFilter.prepare(self.model)
+        self.assertEqual(
+            [
+                scId for scId in self.novel.sections
+                if sectionFilter.accept(self.model, scId)
+            ],
+            ['sc2', 'sc3', 'sc4'],
+        )
+        self.assertEqual(
+            [
+                chId for chId in self.novel.chapters
+                if chapterFilter.accept(self.model, chId)
+            ],
+            ['ch2', 'ch3'],
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Regression test for the columnar section metadata table.
+
+Test the synchronization with the sections, and the analytics queries.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.plot_line import PlotLine
+from nvlib.model.data.section import Section
+from nvlib.model.nv_model import NvModel
+from nvlib.novx_globals import CH_ROOT
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+
+
+class SectionTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = NvModel()
+        self.model.tree = NvTree()
+        self.model.open_project(f'{DATA_PATH}normal.novx')
+        self.novel = self.model.novel
+        self.table = self.novel.sectionTable
+
+    def test_counts(self):
+        self.assertEqual(len(self.table), len(self.novel.sections))
+        self.novel.sections['sc1'].status = 2
+        self.novel.sections['sc2'].scType = 1
+        self.novel.sections['sc3'].sectionContent = '<p>One two three</p>'
+        expected = [None, 0, 0, 0, 0, 0]
+        for section in self.novel.sections.values():
+            if section.scType == 0:
+                expected[section.status] += section.wordCount
+        self.assertEqual(self.table.get_status_counts(), expected)
+
+        wordCount = 0
+        sectionCount = 0
+        for scId in self.novel.tree.get_children('ch2'):
+            section = self.novel.sections[scId]
+            if section.scType == 0:
+                sectionCount += 1
+                wordCount += section.wordCount
+        self.assertEqual(
+            self.table.get_totals(['ch9', 'sc2', 'sc3']),
+            (sectionCount, wordCount),
+        )
+
+    def test_cumulative_word_counts(self):
+        scIds = []
+        for chId in self.novel.tree.get_children(CH_ROOT):
+            scIds.extend(self.novel.tree.get_children(chId))
+        total = 0
+        expected = []
+        for scId in scIds:
+            section = self.novel.sections[scId]
+            if section.scType == 0:
+                total += section.wordCount
+            expected.append(total)
+        self.assertEqual(
+            self.table.get_cumulative_word_counts(scIds),
+            expected,
+        )
+        self.assertEqual(total, self.model.get_counts()[0])
+
+    def test_group_by(self):
+        self.novel.sections['sc2'].viewpoint = 'cr3'
+        viewpointCounts = self.table.get_viewpoint_counts()
+        for crId in ('cr1', 'cr2', 'cr3', 'cr5'):
+            scIds = [
+                scId for scId, section in self.novel.sections.items()
+                if section.viewpoint == crId and section.scType == 0
+            ]
+            if not scIds:
+                self.assertNotIn(crId, viewpointCounts)
+                continue
+
+            self.assertEqual(
+                viewpointCounts[crId],
+                (
+                    len(scIds),
+                    sum(self.novel.sections[s].wordCount for s in scIds),
+                ),
+            )
+        self.novel.plotLines['pl1'] = PlotLine(
+            sections=['sc1', 'sc58', 'sc12'],
+        )
+        self.assertEqual(
+            self.table.get_plot_line_counts(self.novel.plotLines),
+            {
+                'pl1': (
+                    2,
+                    self.novel.sections['sc1'].wordCount
+                    +self.novel.sections['sc12'].wordCount,
+                ),
+            },
+        )
+
+    def test_remove_section(self):
+        self.novel.sections['sc1'].status = 3
+        sectionCount = len(self.table)
+        del self.novel.sections['sc120']
+        self.novel.sections.pop('sc5')
+        self.assertEqual(len(self.table), sectionCount - 2)
+        self.assertEqual(self.table.get_totals(['sc120', 'sc5']), (0, 0))
+        self.assertEqual(
+            self.table.get_totals(['sc1']),
+            (1, self.novel.sections['sc1'].wordCount),
+        )
+        self.assertEqual(
+            self.table.get_status_counts()[3],
+            self.novel.sections['sc1'].wordCount,
+        )
+        self.novel.sections['sc200'] = Section(scType=0, status=3)
+        self.novel.sections['sc200'].sectionContent = '<p>One two</p>'
+        self.assertEqual(self.table.get_totals(['sc200']), (1, 2))
+
+    def test_sort_by_time(self):
+        self.novel.sections['sc4'].date = '2024-03-01'
+        self.novel.sections['sc4'].time = '22:00'
+        self.novel.sections['sc5'].day = '2'
+        self.novel.sections['sc6'].date = '2024-03-02'
+        self.novel.sections['sc7'].date = '2024-03-02'
+        self.novel.referenceDate = '2024-03-01'
+        self.assertEqual(
+            self.table.get_sections_by_time(),
+            ['sc4', 'sc1', 'sc6', 'sc7', 'sc5'],
+        )
+        self.novel.referenceDate = '2024-02-01'
+        self.assertEqual(
+            self.table.get_sections_by_time(['sc7', 'sc6', 'sc5', 'sc4']),
+            ['sc5', 'sc4', 'sc7', 'sc6'],
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""Regression test for the main view's selection handling.
+
+Test that rapid selection changes are shown once after a delay,
+and that a reselected element is shown again after a model change.
+The tk root window and the views are replaced by fakes.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.gui.main_view import MainView
+import unittest
+
+
+class Root:
+
+    def __init__(self):
+        self.timers = {}
+        self._timerCount = 0
+
+    def after(self, delay, callback):
+        self._timerCount += 1
+        timerId = f'after#{self._timerCount}'
+        self.timers[timerId] = (delay, callback)
+        return timerId
+
+    def after_cancel(self, timerId):
+        del self.timers[timerId]
+
+    def event_generate(self, *args, **kwargs):
+        pass
+
+    def run_timers(self):
+        timers = self.timers
+        self.timers = {}
+        for __, callback in timers.values():
+            callback()
+
+    def title(self, *args):
+        pass
+
+
+class ActiveView:
+
+    def __init__(self):
+        self.elementId = None
+
+
+class PathBar:
+
+    def set_normal(self):
+        pass
+
+
+class PropertiesView:
+
+    def __init__(self):
+        self.activeView = ActiveView()
+        self.shownIds = []
+
+    def apply_changes(self):
+        pass
+
+    def show_properties(self, nodeId):
+        self.activeView.elementId = nodeId
+        self.shownIds.append(nodeId)
+
+
+class ContentsView:
+
+    def see(self, nodeId):
+        pass
+
+
+class Tree:
+
+    def exists(self, nodeId):
+        return nodeId != 'sc9'
+
+
+class TreeViewer:
+
+    def __init__(self):
+        self.tree = Tree()
+
+
+class SelectionDelayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.view = MainView.__new__(MainView)
+        self.view.root = Root()
+        self.view.propertiesView = PropertiesView()
+        self.view.contentsView = ContentsView()
+        self.view.tv = TreeViewer()
+        self.view.set_title = lambda: None
+        self.view._selectionTimerId = None
+        self.view._pendingSelection = None
+        self.view._shownSelection = None
+        self.shownIds = self.view.propertiesView.shownIds
+
+    def test_first_selection(self):
+        # A single selection is shown at once.
+        self.view.on_change_selection('sc1')
+        self.assertEqual(self.shownIds, ['sc1'])
+        (delay, __), = self.view.root.timers.values()
+        self.assertEqual(delay, MainView._SELECTION_DELAY)
+        self.view.root.run_timers()
+        self.assertEqual(self.shownIds, ['sc1'])
+
+        # After the delay, the next selection is shown at once again.
+        self.view.on_change_selection('sc2')
+        self.assertEqual(self.shownIds, ['sc1', 'sc2'])
+
+    def test_rapid_selection(self):
+        for nodeId in ('sc1', 'sc2', 'sc3', 'sc4'):
+            self.view.on_change_selection(nodeId)
+        self.assertEqual(self.shownIds, ['sc1'])
+        self.assertEqual(len(self.view.root.timers), 1)
+        self.view.root.run_timers()
+        self.assertEqual(self.shownIds, ['sc1', 'sc4'])
+
+        # Nodes deleted in the meantime are not shown.
+        self.view.on_change_selection('sc5')
+        self.view.on_change_selection('sc9')
+        self.view.root.run_timers()
+        self.assertEqual(self.shownIds, ['sc1', 'sc4', 'sc5'])
+
+    def test_close(self):
+        self.view.pathBar = PathBar()
+        self.view.show_path = lambda *args: None
+        self.view.title = ''
+        self.view.on_change_selection('sc1')
+        self.view.on_change_selection('sc2')
+        self.view.on_close()
+        self.assertEqual(self.view.root.timers, {})
+        self.assertIsNone(self.view._pendingSelection)
+
+    def test_reselection(self):
+        self.view.on_change_selection('sc1')
+        self.view.root.run_timers()
+        self.view.on_change_selection('sc1')
+        self.view.root.run_timers()
+        self.assertEqual(self.shownIds, ['sc1'])
+
+        # After a model change, the element's data may have been replaced.
+        self.view.refresh()
+        self.view.on_change_selection('sc1')
+        self.assertEqual(self.shownIds, ['sc1', 'sc1'])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Regression test for novelibre file processing.
+
+Test the conversion between single-file and multi-file projects.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+from shutil import copyfile
+from shutil import rmtree
+
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.novx.novx_file import NovxFile
+from nvlib.model.novx.split_novx_file import SplitNovxFile
+from nvlib.novx_globals import CH_ROOT
+from nvlib.novx_globals import CR_FIELD_1_DEFAULT
+from nvlib.novx_globals import CR_FIELD_2_DEFAULT
+from nvlib.novx_globals import NO_SCENE_FIELD_1_DEFAULT
+from nvlib.novx_globals import NO_SCENE_FIELD_2_DEFAULT
+from nvlib.novx_globals import NO_SCENE_FIELD_3_DEFAULT
+from nvlib.novx_globals import OTHER_SCENE_FIELD_1_DEFAULT
+from nvlib.novx_globals import OTHER_SCENE_FIELD_2_DEFAULT
+from nvlib.novx_globals import OTHER_SCENE_FIELD_3_DEFAULT
+from testlib.helper import read_file
+from testlib.novx_converter import NovxConverter
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+EXEC_PATH = '../test/tmp/'
+NOVX_FILE = f'{EXEC_PATH}yw7 Sample Project.novx'
+REF_FILE = f'{EXEC_PATH}reference.novx'
+SPLIT_FILE = f'{EXEC_PATH}yw7 Sample Project.novxm'
+PARTS_DIR = f'{EXEC_PATH}yw7 Sample Project_files'
+
+
+class SplitNovx(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(EXEC_PATH, exist_ok=True)
+        self._remove_all_tempfiles()
+        copyfile(f'{DATA_PATH}normal.novx', NOVX_FILE)
+
+    def tearDown(self):
+        self._remove_all_tempfiles()
+
+    def test_round_trip(self):
+        # Normalize the reference data, as the converter does.
+        novxFile = NovxFile(f'{DATA_PATH}normal.novx')
+        novxFile.novel = Novel(
+            tree=NvTree(),
+            noSceneField1=NO_SCENE_FIELD_1_DEFAULT,
+            noSceneField2=NO_SCENE_FIELD_2_DEFAULT,
+            noSceneField3=NO_SCENE_FIELD_3_DEFAULT,
+            otherSceneField1=OTHER_SCENE_FIELD_1_DEFAULT,
+            otherSceneField2=OTHER_SCENE_FIELD_2_DEFAULT,
+            otherSceneField3=OTHER_SCENE_FIELD_3_DEFAULT,
+            crField1=CR_FIELD_1_DEFAULT,
+            crField2=CR_FIELD_2_DEFAULT,
+        )
+        novxFile.read()
+        novxFile.filePath = REF_FILE
+        novxFile.write()
+
+        converter = NovxConverter()
+        converter.run(NOVX_FILE, suffix=None)
+        self.assertEqual(converter.newFile, SPLIT_FILE)
+        self.assertTrue(os.path.isdir(f'{PARTS_DIR}/chapters'))
+        os.remove(NOVX_FILE)
+        converter.run(SPLIT_FILE, suffix=None)
+        self.assertEqual(converter.newFile, NOVX_FILE)
+        self.assertEqual(
+            read_file(NOVX_FILE),
+            read_file(REF_FILE),
+        )
+
+    def test_partial_save(self):
+        NovxConverter().run(NOVX_FILE, suffix=None)
+        splitFile = SplitNovxFile(SPLIT_FILE)
+        splitFile.novel = Novel(tree=NvTree())
+        splitFile.read()
+        chId = splitFile.novel.tree.get_children(CH_ROOT)[0]
+        chapterFile = f'{PARTS_DIR}/chapters/{chId}.xml'
+        partFiles = [SPLIT_FILE, chapterFile]
+        for fileName in os.listdir(PARTS_DIR):
+            if fileName.endswith('.xml'):
+                partFiles.append(f'{PARTS_DIR}/{fileName}')
+        for partFile in partFiles:
+            os.utime(partFile, (0, 0))
+        splitFile.novel.chapters[chId].title = 'Changed title'
+        splitFile.write()
+        for partFile in partFiles:
+            with self.subTest(partFile=partFile):
+                if partFile == chapterFile:
+                    self.assertNotEqual(os.path.getmtime(partFile), 0)
+                else:
+                    self.assertEqual(os.path.getmtime(partFile), 0)
+
+    def _remove_all_tempfiles(self):
+        for filePath in (
+            NOVX_FILE,
+            f'{NOVX_FILE}.bak',
+            REF_FILE,
+            SPLIT_FILE,
+        ):
+            try:
+                os.remove(filePath)
+            except:
+                pass
+        rmtree(PARTS_DIR, ignore_errors=True)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Regression test for splitting sections by dividers.
+
+Test the structure and the IDs created by the content splitter.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.content_splitter import ContentSplitter
+from nvlib.model.data.id_generator import new_id
+from nvlib.model.data.id_generator import new_ids
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+from nvlib.novx_globals import CH_ROOT
+import unittest
+
+
+class SplitterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.novel = Novel(tree=NvTree())
+        for chId, scId, content in (
+            (
+                'ch1',
+                'sc1',
+                (
+                    '<p>Text 1</p>'
+                    '<p>### Section 2|Description 2</p>'
+                    '<p>Text 2</p>'
+                    '<p>## Chapter 3</p>'
+                    '<p>Text 3</p>'
+                    '<p>#### Section 4</p>'
+                    '<p>Text 4</p>'
+                ),
+            ),
+            ('ch1', 'sc2', '<p>Text 5</p>'),
+            (
+                'ch2',
+                'sc4',
+                (
+                    '<p># Part 2</p>'
+                    '<p>## Chapter 4</p>'
+                    '<p>### Section 6</p>'
+                    '<p>Text # 6</p>'
+                ),
+            ),
+        ):
+            if not chId in self.novel.chapters:
+                self.novel.chapters[chId] = Chapter(
+                    title=chId,
+                    chLevel=2,
+                    chType=0,
+                )
+                self.novel.tree.append(CH_ROOT, chId)
+            self.novel.sections[scId] = Section(
+                title=scId,
+                scType=0,
+                status=3,
+            )
+            self.novel.sections[scId].sectionContent = content
+            self.novel.tree.append(chId, scId)
+
+    def test_new_ids(self):
+        elements = {'sc1': None, 'sc3': None, 'sc4': None, 'sc7': None}
+        generatedIds = new_ids(elements, prefix='sc')
+        for __ in range(5):
+            expectedId = new_id(elements, prefix='sc')
+            self.assertEqual(next(generatedIds), expectedId)
+            elements[expectedId] = None
+
+    def test_split_sections(self):
+        self.assertTrue(ContentSplitter().split_sections(self.novel))
+        self.assertEqual(
+            self.novel.tree.get_children(CH_ROOT),
+            ['ch1', 'ch3', 'ch2', 'ch4', 'ch5'],
+        )
+        self.assertEqual(
+            [
+                self.novel.tree.get_children(chId)
+                for chId in self.novel.tree.get_children(CH_ROOT)
+            ],
+            [
+                ['sc1', 'sc3'],
+                ['sc5', 'sc6', 'sc2'],
+                ['sc4'],
+                [],
+                ['sc7'],
+            ],
+        )
+        self.assertEqual(self.novel.chapters['ch3'].title, 'Chapter 3')
+        self.assertEqual(self.novel.chapters['ch4'].chLevel, 1)
+        self.assertEqual(self.novel.sections['sc3'].title, 'Section 2')
+        self.assertEqual(self.novel.sections['sc3'].status, 2)
+        self.assertTrue(self.novel.sections['sc6'].appendToPrev)
+        self.assertEqual(
+            self.novel.sections['sc5'].sectionContent,
+            '<p>Text 3</p>',
+        )
+        self.assertEqual(
+            self.novel.sections['sc7'].sectionContent,
+            '<p>Text # 6</p>',
+        )
+        self.assertEqual(self.novel.sections['sc4'].sectionContent, '')
+
+    def test_without_dividers(self):
+        self.novel.sections['sc1'].sectionContent = '<p>Text 1</p>'
+        self.novel.sections['sc4'].sectionContent = '<p>Text 4</p>'
+        self.assertFalse(ContentSplitter().split_sections(self.novel))
+        self.assertEqual(
+            self.novel.tree.get_children(CH_ROOT),
+            ['ch1', 'ch2'],
+        )
+        self.assertEqual(
+            self.novel.tree.get_children('ch1'),
+            ['sc1', 'sc2'],
+        )
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Regression test for the paragraph-structured section content.
+
+Test the parsing, the incremental updates, the serialization,
+and the consumers of the paragraphs.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.chapter import Chapter
+from nvlib.model.data.content_splitter import ContentSplitter
+from nvlib.model.data.language_registry import LanguageRegistry
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+from nvlib.model.nv_model import NvModel
+from nvlib.novx_globals import CH_ROOT
+import unittest
+
+DATA_PATH = '../test/data/_manuscript/'
+CONTENT = (
+    '<h5>Heading</h5>'
+    '<p>First <em>para</em>graph<comment><p>Remark</p></comment></p>'
+    '<p xml:lang="de-DE">Zweiter<note id="1"><p>Note text</p></note></p>'
+    '<ul><li><p>One</p></li><li><p>Two</p></li></ul>'
+)
+
+
+class StructuredContentTest(unittest.TestCase):
+
+    def setUp(self):
+        self.section = Section(scType=0)
+        self.section.languageRegistry = LanguageRegistry()
+        self.section.sectionContent = CONTENT
+
+    def test_paragraphs(self):
+        content = self.section.structuredContent
+        self.assertIs(content, self.section.structuredContent)
+        self.assertEqual(
+            [paragraph.tag for paragraph in content],
+            ['h5', 'p', 'p', 'ul'],
+        )
+        self.assertEqual(content.to_xml(), CONTENT)
+        self.assertEqual(content[1].text, 'First paragraph')
+        self.assertEqual(content[1].comments[0].find('p').text, 'Remark')
+        self.assertEqual(content[2].notes[0].get('id'), '1')
+        self.assertEqual(content[2].languages, ('de-DE',))
+        self.assertEqual(content.wordCount, self.section.wordCount)
+
+        # The section's derived data is taken from the paragraphs.
+        self.assertTrue(self.section.hasComment)
+        self.assertEqual(self.section.languages, ('de-DE',))
+
+    def test_replace_paragraphs(self):
+        self.section.replace_paragraphs(1, 2, ['<p>New para</p>'])
+        self.assertFalse(self.section.hasComment)
+        self.assertEqual(
+            self.section.sectionContent,
+            CONTENT.replace(
+                '<p>First <em>para</em>graph'
+                '<comment><p>Remark</p></comment></p>',
+                '<p>New para</p>',
+            ),
+        )
+        self.section.replace_paragraphs(0, 0, ['<p>Start</p>'])
+        self.section.replace_paragraphs(3, 4, [])
+        self.assertEqual(self.section.languages, ())
+        self.assertEqual(
+            self.section.sectionContent,
+            '<p>Start</p><h5>Heading</h5><p>New para</p>'
+            '<ul><li><p>One</p></li><li><p>Two</p></li></ul>',
+        )
+        self.assertEqual(
+            self.section.wordCount,
+            self.section.wordCounter.get_word_count(
+                self.section.sectionContent
+            ),
+        )
+        self.section.sectionContent = '<p>Replaced</p>'
+        self.assertEqual(len(self.section.structuredContent), 1)
+        self.assertEqual(self.section.wordCount, 1)
+
+    def test_split_sections(self):
+        novel = Novel(tree=NvTree())
+        novel.chapters['ch1'] = Chapter(chLevel=2, chType=0)
+        novel.tree.append(CH_ROOT, 'ch1')
+        novel.sections['sc1'] = Section(scType=0, status=1)
+        novel.sections['sc1'].sectionContent = (
+            '<ul><li><p>Item</p></li><li><p>### Not a divider</p></li></ul>'
+            '<p>### Section 2</p>'
+            '<p>Text 2</p>'
+        )
+        novel.tree.append('ch1', 'sc1')
+        self.assertTrue(ContentSplitter().split_sections(novel))
+        sc1, sc2 = novel.tree.get_children('ch1')
+
+        # The divider within the list does not split the list.
+        self.assertEqual(
+            novel.sections[sc1].sectionContent,
+            '<ul><li><p>Item</p></li><li><p>### Not a divider</p></li></ul>',
+        )
+        self.assertEqual(novel.sections[sc2].title, 'Section 2')
+        self.assertEqual(novel.sections[sc2].sectionContent, '<p>Text 2</p>')
+
+    def test_word_count(self):
+        model = NvModel()
+        model.tree = NvTree()
+        model.open_project(f'{DATA_PATH}normal.novx')
+        for section in model.novel.sections.values():
+            wordCount = section.wordCount
+            # After editing, the words are summed up from the paragraphs.
+            section.replace_paragraphs(0, 0, ['<p></p>'])
+            self.assertEqual(section.wordCount, wordCount)
+
+        # Words across paragraph boundaries, as counted in the whole text.
+        self.section.sectionContent = '<h5>one</h5><p>two three</p>'
+        self.assertEqual(self.section.structuredContent.wordCount, 2)
+        self.section.replace_paragraphs(1, 2, ['<p> two three</p>'])
+        self.assertEqual(self.section.wordCount, 3)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
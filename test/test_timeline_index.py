@@ -0,0 +1,178 @@
+"""Regression test for the narrative timeline index.
+
+Test the range, overlap, gap, and span queries,
+and the synchronization with the sections.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from datetime import datetime
+
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+import unittest
+
+
+def timestamp(dateTimeIso):
+    return int(
+        (datetime.fromisoformat(dateTimeIso) - datetime.min).total_seconds()
+    )
+
+
+class TimelineIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.novel = Novel(tree=NvTree(), referenceDate='2024-01-01')
+        self.index = self.novel.timelineIndex
+        self.novel.sections['sc1'] = Section(
+            scDate='2024-01-02',
+            scTime='10:00',
+            lastsHours='2',
+        )
+        self.novel.sections['sc2'] = Section(
+            scDate='2024-01-02',
+            scTime='12:00',
+            lastsMinutes='30',
+        )
+        self.novel.sections['sc3'] = Section(
+            scDate='2024-01-02',
+            scTime='14:00',
+        )
+        self.novel.sections['sc4'] = Section(
+            day='1',
+            scTime='11:00',
+            lastsMinutes='30',
+        )
+        self.novel.sections['sc5'] = Section(title='No date')
+
+    def test_span(self):
+        self.assertEqual(
+            self.index.get_span('sc1'),
+            (timestamp('2024-01-02 10:00'), timestamp('2024-01-02 12:00')),
+        )
+        self.assertEqual(
+            self.index.get_span('sc3'),
+            (timestamp('2024-01-02 14:00'), timestamp('2024-01-02 14:00')),
+        )
+        self.assertIsNone(self.index.get_span('sc5'))
+        self.assertEqual(
+            self.index.get_section_ids(),
+            ['sc1', 'sc4', 'sc2', 'sc3'],
+        )
+
+    def test_boundaries(self):
+        # The period's end is exclusive.
+        self.assertEqual(
+            self.index.get_sections_between(
+                timestamp('2024-01-02 08:00'),
+                timestamp('2024-01-02 10:00'),
+            ),
+            [],
+        )
+
+        # Sections ending at the period's beginning are not listed.
+        self.assertEqual(
+            self.index.get_sections_between(
+                timestamp('2024-01-02 12:00'),
+                timestamp('2024-01-02 14:00'),
+            ),
+            ['sc2'],
+        )
+
+        # Sections without duration are listed if they start in time.
+        self.assertEqual(
+            self.index.get_sections_between(
+                timestamp('2024-01-02 14:00'),
+                timestamp('2024-01-02 14:01'),
+            ),
+            ['sc3'],
+        )
+        self.assertEqual(
+            self.index.get_sections_between(
+                timestamp('2024-01-02 11:59'),
+                timestamp('2024-01-02 12:01'),
+            ),
+            ['sc1', 'sc2'],
+        )
+        self.assertEqual(self.index.get_sections_on_day('2024-01-03'), [])
+
+    def test_overlaps_and_gaps(self):
+        self.assertEqual(self.index.get_overlaps(), [('sc1', 'sc4')])
+        # Adjacent sections neither overlap nor leave a gap.
+        self.assertEqual(
+            self.index.get_gaps(),
+            [(timestamp('2024-01-02 12:30'), timestamp('2024-01-02 14:00'))],
+        )
+        self.assertEqual(self.index.get_gaps(minSeconds=5400), [(
+            timestamp('2024-01-02 12:30'),
+            timestamp('2024-01-02 14:00'),
+        )])
+        self.assertEqual(self.index.get_gaps(minSeconds=5401), [])
+
+    def test_sections_without_date(self):
+        self.novel.sections['sc5'].time = '09:00'
+        # A time without date or day refers to the reference date.
+        self.assertEqual(
+            self.index.get_span('sc5')[0],
+            timestamp('2024-01-01 09:00'),
+        )
+        self.novel.sections['sc5'].time = None
+        self.assertIsNone(self.index.get_span('sc5'))
+        self.novel.sections['sc1'].date = None
+        self.novel.sections['sc1'].day = None
+        self.novel.sections['sc1'].time = None
+        self.assertNotIn('sc1', self.index.get_section_ids())
+
+    def test_reference_date(self):
+        self.novel.referenceDate = '2024-02-01'
+        self.assertEqual(
+            self.index.get_span('sc4')[0],
+            timestamp('2024-02-02 11:00'),
+        )
+        self.assertEqual(
+            self.index.get_sections_on_day('2024-01-02'),
+            ['sc1', 'sc2', 'sc3'],
+        )
+        self.assertEqual(
+            self.index.get_section_ids(),
+            ['sc1', 'sc2', 'sc3', 'sc4'],
+        )
+        self.assertEqual(self.index.get_overlaps(), [])
+
+        # Sections with a specific date are not affected.
+        self.assertEqual(
+            self.index.get_span('sc1')[0],
+            timestamp('2024-01-02 10:00'),
+        )
+
+    def test_removal(self):
+        section = self.novel.sections['sc1']
+        del self.novel.sections['sc1']
+        self.assertIsNone(self.index.get_span('sc1'))
+        self.assertEqual(self.index.get_section_ids(), ['sc4', 'sc2', 'sc3'])
+        self.assertEqual(self.index.get_overlaps(), [])
+
+        # The removed section no longer updates the index.
+        section.time = '15:00'
+        self.assertNotIn('sc1', self.index.get_section_ids())
+
+        self.novel.sections['sc6'] = Section(
+            scDate='2024-01-02',
+            scTime='14:00',
+        )
+        # Sections with the same start are listed in the order of indexing.
+        self.assertEqual(
+            self.index.get_section_ids(),
+            ['sc4', 'sc2', 'sc3', 'sc6'],
+        )
+        del self.novel.sections['sc3']
+        self.assertEqual(self.index.get_section_ids(), ['sc4', 'sc2', 'sc6'])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
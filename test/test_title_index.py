@@ -0,0 +1,139 @@
+"""Regression test for the title index.
+
+Test the title normalization, the lookup of ambiguous titles,
+and the synchronization with the elements.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.character import Character
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.section import Section
+from nvlib.model.data.title_index import normalize_title
+from nvlib.model.ods.ods_r_grid import OdsRGrid
+from nvlib.novx_globals import CHARACTER_PREFIX
+from nvlib.novx_globals import SECTION_PREFIX
+import unittest
+
+
+class TitleIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.novel = Novel(tree=NvTree())
+        self.novel.characters['cr1'] = Character(title='Alice')
+        self.novel.characters['cr2'] = Character(title='Bob  Miller')
+        self.novel.characters['cr3'] = Character(title='ALICE')
+        self.novel.characters['cr4'] = Character()
+        self.novel.sections['sc1'] = Section(title='Alice', viewpoint='cr3')
+        self.novel.sections['sc2'] = Section()
+
+    def test_normalize_title(self):
+        self.assertEqual(normalize_title(' Bob \t Miller\n'), 'bob miller')
+        self.assertEqual(normalize_title('STRASSE'), normalize_title('Straße'))
+        self.assertEqual(normalize_title(None), '')
+        self.assertEqual(normalize_title('   '), '')
+
+    def test_lookup(self):
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'bob miller'),
+            ['cr2'],
+        )
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Carol'),
+            [],
+        )
+        self.assertEqual(self.novel.get_ids_by_title(CHARACTER_PREFIX, ''), [])
+
+        # Element types are indexed separately.
+        self.assertEqual(
+            self.novel.get_ids_by_title(SECTION_PREFIX, 'alice'),
+            ['sc1'],
+        )
+
+    def test_ambiguous_title(self):
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, ' alice '),
+            ['cr1', 'cr3'],
+        )
+
+        # Title changes keep the order of the elements.
+        self.novel.characters['cr1'].title = 'Alicia'
+        self.novel.characters['cr1'].title = 'Alice'
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'alice'),
+            ['cr1', 'cr3'],
+        )
+
+    def test_title_change(self):
+        self.novel.characters['cr4'].title = 'Bob Miller'
+        self.novel.characters['cr2'].title = 'Robert Miller'
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Bob Miller'),
+            ['cr4'],
+        )
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Robert Miller'),
+            ['cr2'],
+        )
+        self.novel.characters['cr2'].title = None
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Robert Miller'),
+            [],
+        )
+
+    def test_removal(self):
+        character = self.novel.characters.pop('cr1')
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Alice'),
+            ['cr3'],
+        )
+
+        # The removed element no longer updates the index.
+        character.title = 'Bob Miller'
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Bob Miller'),
+            ['cr2'],
+        )
+
+        # Replacing an element replaces its entry.
+        self.novel.characters['cr3'] = Character(title='Carol')
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Alice'),
+            [],
+        )
+        self.assertEqual(
+            self.novel.get_ids_by_title(CHARACTER_PREFIX, 'Carol'),
+            ['cr3'],
+        )
+
+    def test_viewpoint_import(self):
+        reader = OdsRGrid('')
+        reader.novel = self.novel
+        reader._columnDict = {
+            'Viewpoint': {'sc1': 'alice', 'sc2': 'ALICE'},
+        }
+        reader._read_sections()
+
+        # An ambiguous name keeps the current viewpoint, if matching.
+        self.assertEqual(self.novel.sections['sc1'].viewpoint, 'cr3')
+        # Otherwise, the first match is taken.
+        self.assertEqual(self.novel.sections['sc2'].viewpoint, 'cr1')
+        self.assertEqual(
+            reader.ambiguousTitles,
+            {'sc1': ['cr1', 'cr3'], 'sc2': ['cr1', 'cr3']},
+        )
+
+        reader._columnDict = {'Viewpoint': {'sc2': 'bob miller'}}
+        reader.ambiguousTitles = {}
+        reader._read_sections()
+        self.assertEqual(self.novel.sections['sc2'].viewpoint, 'cr2')
+        self.assertEqual(reader.ambiguousTitles, {})
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
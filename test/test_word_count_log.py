@@ -0,0 +1,106 @@
+"""Regression test for the novelibre word count log.
+
+For further information see https://github.com/peter88213/novelibre
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from nvlib.model.data.novel import Novel
+from nvlib.model.data.nv_tree import NvTree
+from nvlib.model.data.word_count_log import WordCountLog
+from nvlib.model.nv_work_file import NvWorkFile
+from nvlib.nv_globals import prefs
+import unittest
+
+
+class WordCountLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.wcLog = WordCountLog()
+        self.wcLog['2024-01-31'] = [300, 310]
+        self.wcLog['2024-01-01'] = [100, 110]
+        self.wcLog['2024-01-02'] = [200, 210]
+        self.wcLog['2024-02-15'] = [400, 410]
+
+    def test_mapping(self):
+        self.assertEqual(
+            list(self.wcLog),
+            ['2024-01-01', '2024-01-02', '2024-01-31', '2024-02-15'],
+        )
+        self.assertEqual(self.wcLog['2024-01-02'], (200, 210))
+        self.assertTrue('2024-01-31' in self.wcLog)
+        self.assertFalse('2024-01-03' in self.wcLog)
+        self.assertFalse('invalid' in self.wcLog)
+        self.wcLog['2024-01-02'] = [250, 260]
+        self.assertEqual(len(self.wcLog), 4)
+        self.assertEqual(self.wcLog['2024-01-02'], (250, 260))
+        with self.assertRaises(ValueError):
+            self.wcLog['invalid'] = [1, 1]
+        with self.assertRaises(TypeError):
+            self.wcLog['2024-01-02'][0] = 1
+
+    def test_latest(self):
+        self.assertEqual(self.wcLog.latest(), ('2024-02-15', 400, 410))
+        self.assertIsNone(WordCountLog().latest())
+
+    def test_get_range(self):
+        self.assertEqual(
+            self.wcLog.get_range('2024-01-02', '2024-01-31'),
+            [('2024-01-02', 200, 210), ('2024-01-31', 300, 310)],
+        )
+        self.assertEqual(len(self.wcLog.get_range(start='2024-02-01')), 1)
+
+    def test_compact(self):
+        self.wcLog.compact('monthly', '2024-02-01')
+        self.assertEqual(
+            list(self.wcLog),
+            ['2024-01-31', '2024-02-15'],
+        )
+        self.assertEqual(self.wcLog['2024-01-31'], (300, 310))
+        with self.assertRaises(ValueError):
+            self.wcLog.compact('daily', '2024-02-01')
+
+
+class GranularityTest(unittest.TestCase):
+
+    def tearDown(self):
+        prefs.pop('wc_log_granularity', None)
+
+    def test_preference(self):
+        prefs['wc_log_granularity'] = 'weekly'
+        self.assertEqual(NvWorkFile('').wcLogGranularity, 'weekly')
+        for granularity in ('daily', '', None):
+            prefs['wc_log_granularity'] = granularity
+            self.assertIsNone(NvWorkFile('').wcLogGranularity)
+
+    def test_invalid_granularity(self):
+        prjFile = NvWorkFile('')
+        prjFile.novel = Novel(tree=NvTree())
+        prjFile.wcLog['2024-01-01'] = [100, 110]
+        prjFile.wcLogGranularity = 'daily'
+        with self.assertRaises(RuntimeError):
+            prjFile.prepare_xml_root()
+
+    def test_compact_on_write(self):
+        prjFile = NvWorkFile('')
+        prjFile.novel = Novel(tree=NvTree())
+        prjFile.wcLog['2024-01-01'] = [100, 110]
+        prjFile.wcLog['2024-01-02'] = [200, 210]
+        prjFile.wcLogGranularity = 'monthly'
+        prjFile.wcLogFullDays = 0
+
+        # Building an xml tree, e.g. for a snapshot, keeps the log.
+        prjFile.build_xml_root()
+        self.assertEqual(len(prjFile.wcLog), 2)
+        prjFile.wcLogGranularity = 'daily'
+        prjFile.build_xml_root()
+
+        prjFile.wcLogGranularity = 'monthly'
+        prjFile.copy_for_writing()
+        self.assertEqual(list(prjFile.wcLog), ['2024-01-02'])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()